@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# 🖥️ Headless entry point – runs the print pipeline for an order and a list of serials without GUI
+# Spouští tiskovou pipeline pro příkaz a seznam serial numbers bez GUI
+
+import sys
+import json
+import argparse
+import configparser
+from pathlib import Path
+from core.print_service import PrintService, PrintServiceError
+from utils.serial_batch import parse_serial_batch
+
+# 📌 Exit codes / Návratové kódy
+EXIT_OK = 0
+EXIT_FAILED_SERIALS = 1
+EXIT_SETUP_ERROR = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Command line arguments.
+    Argumenty příkazové řádky.
+    """
+    parser = argparse.ArgumentParser(description='PrintPackingLine – headless print pipeline (JSON result on stdout, timings on stderr).')
+    parser.add_argument('order', help='Work order code / Výrobní příkaz')
+    parser.add_argument('serials', nargs='*', help="Serials or ranges '25-0001-0001..25-0001-0200' / Serial numbers nebo rozsahy")
+    parser.add_argument('--file', type=Path, help='File with serials (one per line) / Soubor se serial numbers')
+    parser.add_argument('--prefix', help="Operator prefix for 'P Znacka balice' / Prefix operátora")
+    parser.add_argument('--product', help='Product name (default: read from .nor) / Název produktu (jinak z .nor)')
+    parser.add_argument('--dry-run', action='store_true', help='Validate and extract only, write nothing / Jen validace a extrakce')
+    parser.add_argument('--max-serials', type=int, default=100000, help='Batch size limit / Limit velikosti dávky')
+    parser.add_argument('--quiet', action='store_true', help='No timings on stderr / Bez výpisu časů')
+    return parser
+
+
+def print_timings(result: dict) -> None:
+    """
+    Prints per-serial stage timings to stderr.
+    Vypíše časy jednotlivých kroků pro každý serial na stderr.
+    """
+    print(f"{result['order']} {result['product']} groups={','.join(result['groups'])} load_index={result['load_index_ms']:.1f} ms", file=sys.stderr)
+    for item in result['serials']:
+        stages = '  '.join(f'{stage}={ms:.1f}' for stage, ms in item['timings_ms'].items())
+        status = 'OK ' if item['ok'] else item['error']['code']
+        print(f"  {item['serial']}  {status}  {stages}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the pipeline and prints JSON result.
+    Spustí pipeline a vypíše výsledek v JSON.
+
+    :return: 0 all serials OK, 1 some serials failed, 2 setup error / 0 vše OK, 1 chyba serialu, 2 chyba nastavení
+    """
+    args = build_parser().parse_args(argv)
+
+    try:
+        text = ' '.join(args.serials)
+        if args.file:
+            text += '\n' + args.file.read_text()
+        serials = parse_serial_batch(text, args.max_serials)
+    except (OSError, ValueError) as e:
+        print(json.dumps({'ok': False, 'error': {'code': 'CLI001', 'message': str(e)}}, ensure_ascii=False))
+        return EXIT_SETUP_ERROR
+
+    try:
+        service = PrintService(args.order, product_name=args.product, prefix=args.prefix)
+        result = service.process(serials, dispatch=not args.dry_run)
+    except PrintServiceError as e:
+        print(json.dumps({'ok': False, 'error': {'code': e.error_code, 'message': e.message}}, ensure_ascii=False))
+        return EXIT_SETUP_ERROR
+    except (OSError, configparser.Error) as e:
+        # ⚙️ Missing or broken config.ini, unreachable share / Chybějící nebo vadný config.ini, nedostupný disk
+        print(json.dumps({'ok': False, 'error': {'code': 'CLI002', 'message': str(e)}}, ensure_ascii=False))
+        return EXIT_SETUP_ERROR
+
+    if not args.quiet:
+        print_timings(result)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return EXIT_OK if result['ok'] else EXIT_FAILED_SERIALS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,21 @@ from core.messenger import Messenger
 from views.print_window import PrintWindow
 from core.config_loader import ConfigLoader
 from utils.validators import Validator
-from PyQt6.QtCore import QEventLoop, QTimer
+from utils.lbl_index import LblIndex, GROUP_FIELDS
+from utils.order_cache import get_order_cache
+from core.print_queue import PrintQueue, PrintDispatcher
+from core.print_service import PrintJob, PrintService, PrintServiceError, find_my2n_token, trigger_dirs, lane_balancer
+from core.pacing_profile import get_pacing_profile
+from core.batch_printer import BatchPrinter
+from utils.serial_batch import parse_serial_batch
+from utils.szv_utils import get_value_prefix
+from core.reprint_journal import ReprintJournal
+from core.scan_metrics import ScanTimer, get_scan_metrics
+from core.printed_serials import PrintedSerials
+from core.my2n_index import get_my2n_index
+from utils.my2n_index_worker import My2nIndexWorker
+from core.prefetcher import NextBoxPrefetcher
+from PyQt6.QtCore import QThreadPool, QTimer
 
 
 class PrintController:
@@ -26,12 +40,15 @@ class PrintController:
     - Komunikuje s PrintWindow GUI a propojuje tlačítka s odpovídajícím zpracováním
     """
 
-    def __init__(self, window_stack, order_code: str, product_name: str):
+    def __init__(self, window_stack, order_code: str, product_name: str, order_loader=None):
         """
         Initializes the print controller and connects signals.
         Inicializuje PrintController a napojí akce tlačítek.
+
+        :param order_loader: OrderLoadWorker still indexing the .lbl in background (optional) / Worker indexující .lbl na pozadí
         """
         self.window_stack = window_stack
+        self.order_loader = order_loader
         self.print_window = PrintWindow(order_code, product_name, controller=self)
         self.validator = Validator(self.print_window)
 
@@ -42,9 +59,89 @@ class PrintController:
         self.normal_logger = Logger(spaced=False)
         self.spaced_logger = Logger(spaced=True)
 
+        # 🧾 Print job queues per printer lane – scans only enqueue, labels are paced by the dispatcher
+        # Fronty tisku pro jednotlivé tiskové linky – sken jen zařazuje, tempo řídí dispečer
+        lane_of = {group: lanes[0] for group, lanes in self.config.get_all_triggers('PrinterLanes').items() if lanes}
+        self.print_queue = PrintDispatcher(self.create_lane_queue, lane_of)
+        self.print_queue.depth_changed.connect(self.on_queue_depth_changed)
+        self.print_queue.label_started.connect(self.on_label_started)
+        self.print_queue.job_failed.connect(self.on_print_job_failed)
+        self.print_queue.job_printed.connect(self.on_print_job_printed)
+        self.print_queue.job_dropped.connect(self.on_print_job_dropped)
+
         # 🔗 Button actions / Napojení tlačítek
         self.print_window.print_button.clicked.connect(self.print_button_click)
         self.print_window.exit_button.clicked.connect(self.handle_exit)
+        self.print_window.batch_button.clicked.connect(self.batch_button_click)
+        self.print_window.batch_pause_button.clicked.connect(self.batch_pause_click)
+        self.print_window.batch_cancel_button.clicked.connect(self.batch_cancel_click)
+        self.print_window.reprint_button.clicked.connect(self.reprint_last_click)
+
+        # 📒 Local journal of printed payloads – rescans are reprinted without touching T: / Lokální deník pro dotisk
+        self.journal = ReprintJournal(
+            self.config.get_path('local_data_path', fallback='data') / 'journal',
+            order_code,
+            max_entries=int(self.config.get_value('Printing', 'journal_max_entries', fallback='2000')),
+            max_orders=int(self.config.get_value('Printing', 'journal_max_orders', fallback='20')),
+        )
+
+        # 🔁 Serials already printed for this order (confirm / block / off) / Již vytištěné serialy příkazu
+        self.printed = PrintedSerials(self.config.get_path('local_data_path', fallback='data') / 'printed', order_code)
+        self.duplicate_check = self.config.get_value('Printing', 'duplicate_check', fallback='confirm').strip().lower()
+
+        # ⏳ Scanned serials whose labels are still in the queue (serial → jobs, waiting jobs, journal data)
+        # Naskenované serialy, jejichž etikety jsou ještě ve frontě (serial → úlohy, čekající úlohy, data deníku)
+        self.unconfirmed: dict[str, dict] = {}
+
+        # 📦 Running batch print (None when scanning one by one) / Běžící dávkový tisk
+        self.batch: BatchPrinter | None = None
+
+        # 📊 Stage timings of the current scan / Časy kroků aktuálního skenu
+        self.metrics = get_scan_metrics()
+        self.scan = ScanTimer(None, order_code, '')
+
+        # 🔐 Local index of My2N tokens, refreshed in background while the order is open / Lokální index My2N tokenů
+        self.my2n_index = get_my2n_index() if 'my2n' in self.get_trigger_groups_for_product() else None
+        self.my2n_worker: My2nIndexWorker | None = None  # 💡 Kept until the next refresh replaces it / Drží se do další obnovy
+        self.my2n_running = False
+        self.my2n_timer = QTimer()
+        self.my2n_timer.setInterval(int(float(self.config.get_value('My2N', 'refresh_s', fallback='60')) * 1000))
+        self.my2n_timer.timeout.connect(self.refresh_my2n_index)
+
+        # 🧩 Shared print pipeline – validation and extraction of labels (same as cli.py) / Sdílená tisková pipeline (stejná jako cli.py)
+        self.service: PrintService | None = None
+        try:
+            self.service = PrintService(order_code, product_name, prefix=get_value_prefix(), config=self.config, token_index=self.my2n_index)
+        except PrintServiceError as e:
+            self.normal_logger.log('Error', e.message, e.error_code)
+
+        # 🔮 Labels of the next boxes rendered ahead (boxes come in ascending order) / Etikety dalších krabic vykreslené dopředu
+        self.prefetcher: NextBoxPrefetcher | None = None
+        if self.service and self.config.get_value('Printing', 'prefetch', fallback='true').strip().lower() == 'true':
+            self.prefetcher = NextBoxPrefetcher(self.service, depth=int(self.config.get_value('Printing', 'prefetch_depth', fallback='3')))
+
+        # ⏳ Scans arriving while the .lbl is still being indexed wait here in order / Skeny během indexace .lbl čekají zde v pořadí
+        self.lbl_finished = False
+        self.queued_scans: list[str] = []
+
+        # 🧮 Completeness summary of the whole order (as soon as the index is ready) / Souhrn kompletnosti celého příkazu
+        if self.order_loader:
+            self.print_window.set_order_summary('Kontroluji kompletnost příkazu…')
+
+            # 💡 Connected before lbl_done is checked, so a worker finishing in between is never missed
+            # Připojeno před kontrolou lbl_done, takže worker dokončený mezitím se neztratí
+            self.order_loader.signals.lbl_ready.connect(self.on_lbl_ready)
+            self.order_loader.signals.lbl_failed.connect(self.on_lbl_failed)
+            if self.order_loader.lbl_done:
+                if self.order_loader.lbl_error is None:
+                    self.on_lbl_ready()
+                else:
+                    self.on_lbl_failed(self.order_loader.lbl_error)
+        else:
+            self.on_lbl_ready()
+
+        if self.my2n_index:
+            self.my2n_timer.start()
 
     @property
     def serial_input(self) -> str:
@@ -62,22 +159,52 @@ class PrintController:
         """
         return self.print_window.product_name.strip().upper()
 
-    def get_trigger_dir(self) -> Path | None:
+    def get_trigger_dirs(self, lane: str | None = None) -> list[Path]:
+        """
+        Returns pool of trigger directories from config (comma-separated, one per Commander/printer).
+        Vrací seznam složek trigger souborů z config.ini (oddělené čárkou, jedna na Commander/tiskárnu).
+
+        :param lane: Printer lane with its own folders in [LaneTriggerPaths] (optional) / Tisková linka s vlastními složkami
         """
-        Returns trigger directory path from config.
-        Vrací cestu ke složce trigger souborů z config.ini.
+        return trigger_dirs(self.config, lane)
+
+    def create_lane_queue(self, lane: str) -> PrintQueue:
         """
-        path = self.config.get_path('trigger_path', section='Paths')
-        if path and path.exists():
-            return path
-        return None
+        Creates print queue for one printer lane using [Printing] settings.
+        Vytvoří tiskovou frontu pro jednu tiskovou linku podle nastavení [Printing].
+
+        - Jobs are spread across the lane's trigger directories by TriggerDirBalancer
+        - Úlohy se rozdělují mezi složky spouštěčů linky pomocí TriggerDirBalanceru
 
-    def load_file_lbl(self):
+        :param lane: Lane name from [PrinterLanes] / Název linky z [PrinterLanes]
+        """
+        balancer = lane_balancer(self.config, lane)
+        queue = PrintQueue(
+            balancer.pick,
+            pace_ms=int(self.config.get_value('Printing', 'trigger_pace_ms', fallback='3000')),
+            watch_triggers=self.config.get_value('Printing', 'watch_triggers', fallback='true').strip().lower() == 'true',
+            consume_timeout_ms=int(self.config.get_value('Printing', 'trigger_timeout_ms', fallback='15000')),
+            unique_triggers=self.config.get_value('Printing', 'unique_triggers', fallback='false').strip().lower() == 'true',
+            pipeline_depth=int(self.config.get_value('Printing', 'pipeline_depth', fallback='1')),
+            pacing=get_pacing_profile(),
+            metrics=get_scan_metrics(),
+        )
+        queue.trigger_finished.connect(balancer.report)
+        queue.balancer = balancer  # 💡 Keep balancer alive with its queue / Balancer žije spolu s frontou
+
+        # ⚠️ Jobs share one output file unless pipelined → more folders give failover only, no throughput
+        # Bez pipeline sdílí úlohy jeden výstupní soubor → více složek dává jen zálohu, ne vyšší výkon
+        if len(balancer.directories) > 1 and not queue.pipelined:
+            self.normal_logger.log('Error', f'Linka {lane}: {len(balancer.directories)} složek spouštěčů bez pipeline '
+                                            f'(unique_triggers = true, pipeline_depth > 1) netiskne paralelně.', 'PRICON030')
+        return queue
+
+    def load_file_lbl(self) -> LblIndex | None:
         """
-        Loads the .lbl file based on order_code and config path.
-        Načte .lbl soubor podle kódu příkazu a cesty z config.ini.
+        Loads the .lbl file based on order_code and config path and indexes its lines.
+        Načte .lbl soubor podle kódu příkazu a cesty z config.ini a zaindexuje jeho řádky.
 
-        :return: List of lines or empty list if not found / Seznam řádků nebo prázdný list
+        :return: LblIndex or None if not found / Index řádků nebo None
         """
         # 🎯 Getting path from config.ini / Získání cesty z config.ini
         orders_path = self.config.get_path('orders_path', section='Paths')
@@ -86,7 +213,7 @@ class PrintController:
             self.normal_logger.log('Error', f'Konfigurační cesta {orders_path} nebyla nalezena!', 'PRICON001')
             self.messenger.show_error('Error', f'Konfigurační cesta {orders_path} nebyla nalezena!', 'PRICON001', False)
             self.print_window.reset_input_focus()
-            return []
+            return None
 
         # 🧩 Build path to .lbl file / Sestavení cesty k .lbl souboru
         lbl_file = orders_path / f'{self.print_window.order_code}.lbl'
@@ -95,155 +222,131 @@ class PrintController:
             self.normal_logger.log('Warning', f'Soubor {lbl_file} neexistuje.', 'PRICON002')
             self.messenger.show_info('Warning', f'Soubor {lbl_file} neexistuje.', 'PRICON002')
             self.print_window.reset_input_focus()
-            return []
+            return None
 
         try:
-            # 📄 Load the contents of a file / Načtení obsahu souboru
-            return lbl_file.read_text().splitlines()
+            # 📄 Indexed contents from shared cache (re-read only on change) / Index ze sdílené cache (čte se jen při změně)
+            return get_order_cache().get(lbl_file)
         except Exception as e:
             self.normal_logger.log('Error', f'Chyba načtení souboru {str(e)}', 'PRICON003')
             self.messenger.show_error('Error', f'{str(e)}', 'PRICON003', False)
             self.print_window.reset_input_focus()
-            return []
+            return None
 
-    def control4_save_and_print(self, header: str, record: str, trigger_values: list[str]) -> None:
+    def on_lbl_ready(self) -> None:
         """
-        Extracts header and record for the scanned serial number and writes them to Control4 output file.
-        Načte hlavičku a záznam z řádků .lbl pro naskenovaný serial number a zapíše je do výstupního souboru Control4.
-
-        - Hledá řádky začínající na: SERIAL+I= a SERIAL+J= a SERIAL+K=
-        - Pokud najde hlavičku i záznam, zapíše je do výstupního souboru
-
-        :param header: extracted header line / extrahovaná hlavička z .lbl
-        :param record: extracted record line / extrahovaný záznam z .lbl
-        :param trigger_values: list of trigger filenames / seznam názvů souborů spouštěče
+        Background index of the .lbl is built – shows the summary and prints the scans that waited for it.
+        Index .lbl na pozadí je hotový – zobrazí souhrn a vytiskne skeny, které na něj čekaly.
         """
-        # 📁 Retrieve output file path from config / Získání cesty k výstupnímu souboru z konfigurace
-        output_path = self.config.get_path('output_file_path_c4_product', section='Control4Paths')
-        if not output_path:
-            self.normal_logger.log('Error', f'Cesta k výstupnímu souboru product nebyla nalezena.', 'PRICON004')
-            self.messenger.show_error('Error', f'Cesta k výstupnímu souboru product nebyla nalezena.', 'PRICON004', False)
-            self.print_window.reset_input_focus()
-            return
+        if self.lbl_finished:
+            return  # 💡 Already handled (signal arrived after the direct call) / Už obslouženo
+        self.lbl_finished = True
 
-        try:
-            # 💾 Write header and record to file / Zápis hlavičky a záznamu do souboru
-            with output_path.open('w') as file:
-                file.write(header + '\n')
-                file.write(record + '\n')
-
-            # 🗂️ Retrieve trigger directory from config / Získání složky pro spouštěče z konfigurace
-            trigger_dir = self.get_trigger_dir()
-            if not trigger_dir or not trigger_dir.exists():
-                self.normal_logger.log('Error', f'Složka trigger_path neexistuje nebo není zadána.', 'PRICON005')
-                self.messenger.show_error('Error', f'Složka trigger_path neexistuje nebo není zadána.', 'PRICON005', False)
-                self.print_window.reset_input_focus()
-                return
+        self.show_order_summary()
+        self.refresh_my2n_index()
+        self.process_queued_scans()
 
-            # ✂️ Create trigger files from values / Vytvoření souborů podle hodnot I=
-            for value in trigger_values:
-                target_file = trigger_dir / value
-                target_file.touch(exist_ok=True)
-                # 💬 Inform the user about printing progress / Informace o průběhu tisku
-                self.messenger.show_timed_info('Info', f'Prosím čekejte, tisknu etiketu: {value}', 3000)
+    def on_lbl_failed(self, message: str) -> None:
+        """
+        Background indexing of the .lbl failed (dialog is shown by WorkOrderController) – summary shows the failure.
+        Indexace .lbl na pozadí selhala (dialog zobrazí WorkOrderController) – souhrn ukáže chybu.
 
-                # 🛑 Vytvoření prodlevy bez blokace GUI
-                loop = QEventLoop()
-                QTimer.singleShot(3000, loop.quit)
-                loop.exec()
+        - Waiting scans are processed anyway, each one reports why the .lbl cannot be loaded
+        - Čekající skeny se přesto zpracují, každý ohlásí, proč .lbl nelze načíst
+        """
+        if self.lbl_finished:
+            return
+        self.lbl_finished = True
 
-        except Exception as e:
-            # 🛑 Log and display unexpected error / Zaloguj a zobraz neočekávanou chybu
-            self.normal_logger.log('Error', f'Chyba zápisu {str(e)}', 'PRICON006')
-            self.messenger.show_error('Error', f'{str(e)}', 'PRICON006', False)
-            self.print_window.reset_input_focus()
+        self.print_window.set_order_summary(f'Příkaz nelze zaindexovat: {message}', ok=False)
+        self.process_queued_scans()
 
-    def product_save_and_print(self, header: str, record: str, trigger_values: list[str]) -> None:
+    def process_queued_scans(self) -> None:
+        """
+        Prints scans that arrived while the .lbl was being indexed (in scan order).
+        Vytiskne skeny, které přišly během indexace .lbl (v pořadí skenování).
         """
-        Extracts header and record for the scanned serial number and writes them to product output file.
-        Načte hlavičku a záznam z řádků .lbl pro naskenovaný serial number a zapíše je do výstupního souboru product.
+        scans, self.queued_scans = self.queued_scans, []
+        for serial in scans:
+            self.scan = ScanTimer(self.metrics, self.print_window.order_code, serial)
+            self.scan.finish(self.process_scan(serial))
 
-        :param header: extracted header line / extrahovaná hlavička z .lbl
-        :param record: extracted record line / extrahovaný záznam z .lbl
-        :param trigger_values: list of trigger filenames / seznam názvů souborů spouštěče
+    def show_order_summary(self) -> None:
         """
+        Shows how many serials of the order have all rows required by the product's trigger groups.
+        Zobrazí, kolik serial numbers příkazu má všechny řádky požadované skupinami produktu.
 
-        # 📁 Retrieve output file path from config / Získání cesty k výstupnímu souboru z konfigurace
-        output_path = self.config.get_path('output_file_path_product', section='ProductPaths')
-        if not output_path:
-            self.normal_logger.log('Warning', f'Cesta k výstupnímu souboru product nebyla nalezena.', 'PRICON009')
-            self.messenger.show_warning('Warning', f'Cesta k výstupnímu souboru product nebyla nalezena.', 'PRICON009')
-            self.print_window.reset_input_focus()
+        - Answered from the completeness bitmap built while indexing / Odpověď z bitmapy sestavené při indexaci
+        - Operator sees incomplete serials before packing the first box / Operátor vidí neúplné serialy ještě před prvním balením
+        """
+        orders_path = self.config.get_path('orders_path', section='Paths')
+        required = ''.join(GROUP_FIELDS.get(group, '') for group in self.get_trigger_groups_for_product())
+        if not orders_path or not required:
             return
 
         try:
-            # 💾 Write header and record to file / Zápis hlavičky a záznamu do souboru
-            with output_path.open('w') as file:
-                file.write(header + '\n')
-                file.write(record + '\n')
-
-            # 🗂️ Retrieve trigger directory from config / Získání složky pro spouštěče z konfigurace
-            trigger_dir = self.get_trigger_dir()
-            if not trigger_dir or not trigger_dir.exists():
-                self.normal_logger.log('Warning', f'Složka trigger_path neexistuje nebo není zadána.', 'PRICON010')
-                self.messenger.show_warning('Warning', f'Složka trigger_path neexistuje nebo není zadána.', 'PRICON010')
-                self.print_window.reset_input_focus()
-                return
+            lbl_index = get_order_cache().get(orders_path / f'{self.print_window.order_code}.lbl')
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Kompletnost příkazu nelze ověřit: {str(e)}', 'PRICON017')
+            self.print_window.set_order_summary('Kompletnost příkazu nelze ověřit.', ok=False)
+            return
 
-            # ✂️ Create trigger files from values / Vytvoření souborů podle hodnot B=
-            for value in trigger_values:
-                target_file = trigger_dir / value
-                target_file.touch(exist_ok=True)
-                # 💬 Inform the user about printing progress / Informace o průběhu tisku
-                self.messenger.show_timed_info('Info', f'Prosím čekejte, tisknu etiketu: {value}', 3000)
+        complete, incomplete = lbl_index.completeness(required)
+        if incomplete:
+            self.normal_logger.log('Warning', f'Příkaz {self.print_window.order_code}: {incomplete} neúplných serial numbers (řádky {required}).', 'PRICON018')
 
-                # 🛑 Vytvoření prodlevy bez blokace GUI
-                loop = QEventLoop()
-                QTimer.singleShot(3000, loop.quit)
-                loop.exec()
+        self.print_window.set_order_summary(f'Kompletní: {complete}   Neúplné: {incomplete}', ok=not incomplete)
 
-        except Exception as e:
-            # 🛑 Log and display unexpected error / Zaloguj a zobraz neočekávanou chybu
-            self.normal_logger.log('Error', f'Chyba zápisu {str(e)}', 'PRICON011')
-            self.messenger.show_error('Error', f'{str(e)}', 'PRICON011', False)
-            self.print_window.reset_input_focus()
+    def on_queue_depth_changed(self, depth: int) -> None:
+        """
+        Updates queue status in print window.
+        Aktualizuje stav fronty v tiskovém okně.
+        """
+        self.print_window.set_queue_depth(depth)
 
-    def my2n_save_and_print(self, serial_number: str, token: str, output_path: Path) -> None:
+    def on_label_started(self, value: str) -> None:
         """
-        Writes extracted My2N token and serial number to output file and creates trigger file.
-        Zapíše získaný My2N token a serial do výstupního souboru a vytvoří trigger soubor.
+        Shows which label is being printed right now.
+        Zobrazí, která etiketa se právě tiskne.
+        """
+        self.print_window.set_current_label(value)
 
-        :param serial_number: serial number from input / seriové číslo z inputu
-        :param token: extracted My2N token / získaný bezpečnostní kód
-        :param output_path: path to output file / cesta k výstupnímu souboru
+    def on_print_job_failed(self, message: str, error_code: str) -> None:
         """
-        try:
-            with output_path.open('w') as file:
-                file.write('"L Vyrobni cislo dlouhe","L Bezpecnostni cislo","P Vyrobni cislo","P Bezpecnostni kod"\n')
-                file.write(f'"Serial number:","My2N Security Code:","{serial_number}","{token}"\n')
-
-            trigger_dir = self.get_trigger_dir()
-            if trigger_dir and trigger_dir.exists():
-                try:
-                    trigger_file = trigger_dir / 'SF_MY2N_A'
-                    trigger_file.touch(exist_ok=True)
-                    # 💬 Inform the user about printing progress / Informace o průběhu tisku
-                    self.messenger.show_timed_info('Info', f'Prosím čekejte, tisknu etiketu: SF_MY2N_A', 3000)
-
-                    # 🛑 Vytvoření prodlevy bez blokace GUI
-                    loop = QEventLoop()
-                    QTimer.singleShot(3000, loop.quit)
-                    loop.exec()
-                except Exception as e:
-                    self.normal_logger.log('Error', f'Chyba trigger souboru {str(e)}', 'PRICON012')
-                    self.messenger.show_error('Error', f'{str(e)}', 'PRICON012', False)
-            else:
-                self.normal_logger.log('Error', 'Trigger složka není definována nebo neexistuje.', 'PRICON013')
-                self.messenger.show_error('Error', 'Složka pro trigger není dostupná.', 'PRICON013', False)
+        Shows dispatcher error to the operator (already logged by the queue).
+        Zobrazí chybu dispečera operátorovi (fronta ji už zalogovala).
+        """
+        self.messenger.show_error('Error', message, error_code, False)
+        self.print_window.reset_input_focus()
 
-        except Exception as e:
-            self.normal_logger.log('Error', f'Chyba zápisu: {str(e)}', 'PRICON014')
-            self.messenger.show_error('Error', f'{str(e)}', 'PRICON014', False)
+    def on_print_job_printed(self, job: PrintJob) -> None:
+        """
+        Marks the serial printed (and journals it) once all labels of its scan were consumed.
+        Označí serial jako vytištěný (a zapíše do deníku), jakmile byly zpracovány všechny etikety jeho skenu.
+
+        - Reprints are not tracked, they never change the record of the serial / Dotisky se nesledují, záznam serialu nemění
+        """
+        pending = self.unconfirmed.get(job.serial)
+        if not pending or not any(waiting is job for waiting in pending['waiting']):
+            return
+
+        pending['waiting'] = [waiting for waiting in pending['waiting'] if waiting is not job]
+        if pending['waiting']:
+            return
+
+        del self.unconfirmed[job.serial]
+        self.journal.record(job.serial, pending['jobs'], prefix=pending['prefix'], token=pending['token'], source=pending['source'])
+        self.printed.add(job.serial)
+
+    def on_print_job_dropped(self, job: PrintJob) -> None:
+        """
+        Label of the scan failed or timed out – the serial stays unprinted, its earlier record is kept.
+        Etiketa skenu selhala nebo nebyla zpracována – serial zůstává nevytištěný, jeho dřívější záznam zůstává.
+        """
+        pending = self.unconfirmed.get(job.serial)
+        if pending and any(waiting is job for waiting in pending['waiting']):
+            del self.unconfirmed[job.serial]
+            self.normal_logger.log('Warning', f'Etiketa {job.group} serialu {job.serial} nebyla vytištěna, serial není označen jako vytištěný.', 'PRICON032')
 
     def get_trigger_groups_for_product(self) -> list[str]:
         """
@@ -265,100 +368,452 @@ class PrintController:
 
     def print_button_click(self):
         """
-        Handles print button action by validating input and triggering appropriate save-and-print methods.
-        Obsluhuje kliknutí na tlačítko 'Print' validací vstupu a spuštěním příslušných metod podle konfigurace.
+        Handles print button action and records stage timings of the scan.
+        Obsluhuje kliknutí na tlačítko 'Print' a zaznamená časy kroků skenu.
+
+        - Before the .lbl index is built the scan is queued (no nested event loop, no re-entry)
+        - Před sestavením indexu .lbl se sken zařadí do čekání (bez vnořené smyčky událostí, bez opětovného vstupu)
+        """
+        serial = self.serial_input
+        if not self.lbl_finished:
+            if serial:
+                self.queued_scans.append(serial)
+                self.print_window.set_order_summary(f'Kontroluji kompletnost příkazu… (čekající skeny: {len(self.queued_scans)})')
+            self.print_window.reset_input_focus()
+            return
+
+        self.scan = ScanTimer(self.metrics, self.print_window.order_code, serial)
+        self.scan.finish(self.process_scan(serial))
+
+    def process_scan(self, serial: str) -> str:
+        """
+        Validates input and triggers appropriate save-and-print methods.
+        Validuje vstup a spouští příslušné metody podle konfigurace.
+
+        :param serial: Scanned serial number / Naskenovaný serial number
+        :return: Scan result for metrics (ok, reprint, failed, invalid) / Výsledek skenu pro metriky
         """
 
         # === 1️⃣ Validate serial number input / Validace vstupu
-        if not self.validator.validate_serial_format(self.serial_input):
-            return
+        if not self.validator.validate_serial_format(serial):
+            return 'invalid'
+
+        # === 2️⃣ Already printed serial → warn or confirm reprint / Již vytištěný serial → varování nebo potvrzení dotisku
+        if not self.check_duplicate(serial):
+            self.print_window.reset_input_focus()
+            return 'duplicate'
+
+        # === 3️⃣ Rescan of a printed serial → reprint from local journal / Opakovaný sken → dotisk z deníku
+        if self.reprint_from_journal(serial):
+            self.print_window.reset_input_focus()
+            return 'reprint'
 
-        # === 2️⃣ Resolve product trigger groups from config / Načtení skupin produktů podle konfigurace
+        # === 4️⃣ Resolve product trigger groups from config / Načtení skupin produktů podle konfigurace
         triggers = self.get_trigger_groups_for_product()
+        self.scan.lap('config')
 
-        # === 3️⃣ Load corresponding .lbl file lines / Načtení řádků ze souboru .lbl
-        lbl_lines = self.load_file_lbl()
-        if not lbl_lines:
+        # === 5️⃣ Load corresponding .lbl file index / Načtení indexu řádků ze souboru .lbl
+        lbl_index = self.load_file_lbl()
+        self.scan.lap('load_lbl')
+        if not lbl_index:
             self.normal_logger.log('Error', f'Soubor .lbl nelze načíst nebo je prázdný!', 'PRICON015')
             self.messenger.show_error('Error', 'Soubor .lbl nelze načíst nebo je prázdný!', 'PRICON015', False)
+            return 'failed'
+
+        # === 6️⃣ Validate, extract and enqueue labels / Validace, extrakce a zařazení etiket
+        if not self.print_serial(serial, triggers, lbl_index):
+            return 'failed'
+
+        self.print_window.reset_input_focus()
+        return 'ok'
+
+    def print_serial(self, serial: str, triggers: list[str], lbl_index: LblIndex) -> bool:
+        """
+        Validates one serial number and enqueues its labels for all trigger groups of the product.
+        Zvaliduje jeden serial number a zařadí jeho etikety pro všechny skupiny spouštěčů produktu.
+
+        :param serial: Serial number in format 00-0000-0000 / Serial number ve formátu 00-0000-0000
+        :param triggers: Trigger groups of the product / Skupiny spouštěčů produktu
+        :param lbl_index: Index of the order .lbl file / Index .lbl souboru příkazu
+        :return: True if all labels were enqueued / True, pokud byly zařazeny všechny etikety
+        """
+        if not self.service:
+            self.messenger.show_error('Error', 'Tiskovou pipeline nelze spustit, podrobnosti jsou v logu.', 'PRICON033', False)
+            self.print_window.reset_input_focus()
+            return False
+
+        source = self.lbl_signature()
+
+        # 🔮 Labels rendered ahead by the prefetcher / Etikety vykreslené dopředu
+        jobs = self.prefetcher.take(serial, lbl_index) if self.prefetcher else None
+        try:
+            if jobs is None:
+                # === 1️⃣ Validate and extract .lbl labels (product, Control4) / Validace a extrakce etiket z .lbl
+                jobs = self.service.render(serial, lbl_index, [group for group in triggers if group != 'my2n'])
+                self.scan.lap('validate')
+
+                # === 2️⃣ My2N token – local index first, report on T: only when not indexed / Nejdřív lokální index, report jen když chybí
+                jobs += self.service.render(serial, lbl_index, [group for group in triggers if group == 'my2n'])
+                self.scan.lap('my2n_lookup')
+
+            # === 3️⃣ Check trigger folders before accepting the jobs / Kontrola složek spouštěčů před přijetím úloh
+            self.service.require_trigger_dirs(jobs)
+        except PrintServiceError as e:
+            self.validator.report(e)
+            return False
+
+        # === 4️⃣ Serial is printed (and journaled) once the queue confirms all its labels / Serial je vytištěn, až fronta potvrdí všechny etikety
+        token = next((job.token for job in jobs if job.token), None)
+        self.unconfirmed[serial] = {'jobs': jobs, 'waiting': list(jobs), 'prefix': self.service.prefix, 'token': token, 'source': source}
+
+        # === 5️⃣ Enqueue, dispatcher writes the files and fires triggers in order / Zařazení, dispečer zapíše soubory a spustí triggery
+        for job in jobs:
+            job.scan_started = self.scan.started
+            self.print_queue.enqueue(job)
+        self.scan.lap('enqueue')
+
+        self.normal_logger.clear_log('Info', f'{self.product_name} {serial} ({", ".join(job.group for job in jobs)})')
+        if token:
+            self.normal_logger.clear_log('Info', f'My2N token: {token}')
+
+        # 🔮 Render the next boxes while this one is being packed / Vykreslení dalších krabic, zatímco se balí tato
+        if self.prefetcher:
+            self.prefetcher.prefetch(serial, lbl_index, [job.group for job in jobs])
+
+        self.normal_logger.add_blank_line()
+        return True
+
+    def refresh_my2n_index(self) -> None:
+        """
+        Starts background indexing of My2N tokens for all serials of the order (skipped while one is running).
+        Spustí indexaci My2N tokenů všech serialů příkazu na pozadí (přeskočí, pokud jedna běží).
+
+        - Only new or changed reports are read / Čtou se jen nové nebo změněné reporty
+        - Serials without a report are shown before the operator reaches their boxes
+        - Serialy bez reportu se zobrazí dřív, než se operátor dostane k jejich krabicím
+        """
+        if not self.my2n_index or self.my2n_running:
             return
 
-        # 📌 Execute save-and-print functions as needed / Spuštění odpovídajících funkcí
-        if 'product' in triggers and lbl_lines:
+        orders_path = self.config.get_path('orders_path', section='Paths')
+        reports_path = self.config.get_path('reports_path', section='Paths')
+        if not orders_path or not reports_path:
+            return
 
-            # === 1️⃣ Validate presence of required lines / Validace existence B/D/E řádků
-            if not self.validator.validate_input_exists_for_product(lbl_lines, self.serial_input):
-                return
+        try:
+            lbl_index = get_order_cache().get(orders_path / f'{self.print_window.order_code}.lbl')
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Index My2N tokenů nelze obnovit: {str(e)}', 'PRICON027')
+            return
 
-            # === 2️⃣ Extract header and record / Získání D= a E= řádků
-            result = self.validator.extract_header_and_record(lbl_lines, self.serial_input)
-            if not result:
-                return
+        self.my2n_worker = My2nIndexWorker(
+            self.my2n_index, sorted(lbl_index.serials()), reports_path,
+            workers=int(self.config.get_value('My2N', 'index_workers', fallback='8')),
+        )
+        self.my2n_worker.signals.finished.connect(self.on_my2n_indexed)
+        self.my2n_worker.signals.failed.connect(self.on_my2n_index_failed)
+        self.my2n_running = True
+        QThreadPool.globalInstance().start(self.my2n_worker)
 
-            header, record = result
+    def on_my2n_indexed(self, missing: list) -> None:
+        """
+        Shows serials of the order whose My2N report or token is missing.
+        Zobrazí serialy příkazu, kterým chybí My2N report nebo token.
+        """
+        self.my2n_running = False  # 💡 run() may still be returning – the reference stays / run() ještě může dobíhat – reference zůstává
+        if missing:
+            preview = ', '.join(missing[:5]) + (' …' if len(missing) > 5 else '')
+            self.normal_logger.log('Warning', f'Příkaz {self.print_window.order_code}: {len(missing)} serial numbers bez My2N tokenu ({preview}).', 'PRICON028')
+            self.print_window.set_my2n_status(f'My2N bez tokenu: {len(missing)} ({preview})', ok=False)
+        else:
+            self.print_window.set_my2n_status('My2N tokeny: kompletní')
+
+    def on_my2n_index_failed(self, message: str) -> None:
+        """
+        Logs a failed refresh (lookup falls back to reading the report).
+        Zaloguje neúspěšnou obnovu (dotaz se vrátí ke čtení reportu).
+        """
+        self.my2n_running = False
+        self.normal_logger.log('Warning', f'Index My2N tokenů nelze obnovit: {message}', 'PRICON027')
 
-            # === 3️⃣ Inject prefix to record / Vložení prefixu do správného pole
-            new_record = self.validator.validate_and_inject_balice(header, record)
-            if new_record is None:
-                return
+    def check_duplicate(self, serial: str) -> bool:
+        """
+        Warns when the serial was already printed for this order ([Printing] duplicate_check).
+        Upozorní, pokud už byl serial pro tento příkaz vytištěn ([Printing] duplicate_check).
 
-            # === 4️⃣ Inject prefix to record / Vložení prefixu do správného pole
-            trigger_values = self.validator.extract_trigger_values(lbl_lines, self.serial_input)
-            if not trigger_values:
-                return
+        - confirm: operator must confirm the reprint / operátor musí dotisk potvrdit
+        - block: reprint only via 'Dotisk' button / dotisk jen tlačítkem 'Dotisk'
+        - off: no check / bez kontroly
 
-            # === 5️⃣ Save and print / Spuštění zápisu výstupního souboru
-            self.product_save_and_print(header, new_record, trigger_values)
+        :return: True if the serial may be printed / True, pokud lze serial vytisknout
+        """
+        if self.duplicate_check == 'off' or not self.is_printed(serial):
+            return True
 
-            # === 6️⃣ Log success
-            self.normal_logger.clear_log('Info', f'{self.product_name} {self.serial_input}')
+        entry = self.journal.get(serial)
+        printed_at = f' ({entry["printed_at"]})' if entry else ''
+        self.normal_logger.log('Warning', f'Serial {serial} už byl vytištěn{printed_at}.', 'PRICON025')
 
-        # 📌 Execute control4-save-and-print functions as needed / Spuštění odpovídajících funkcí
-        if 'control4' in triggers and lbl_lines:
-            # === 1️⃣ Validation of input lines I/J/K / Validace vstupních řádků I/J/K
-            if not self.validator.validate_input_exists_for_control4(lbl_lines, self.serial_input):
-                return
+        if self.duplicate_check == 'block':
+            self.messenger.show_warning('Warning', f'Serial {serial} už byl vytištěn{printed_at}.\nPro dotisk použijte tlačítko Dotisk.', 'PRICON025')
+            return False
 
-            # === 2️⃣ Getting header and record from J= and K= / Získání hlavičky a záznamu z J= a K=
-            result = self.validator.extract_header_and_record_c4(lbl_lines, self.serial_input)
-            if not result:
-                return
-            header, record = result
+        confirmed = self.messenger.ask_question('Warning', f'Serial {serial} už byl vytištěn{printed_at}.\nVytisknout znovu?', 'PRICON025')
+        self.scan.skip()  # 💡 Operator decision is not pipeline latency / Rozhodování operátora není latence pipeline
+        if confirmed:
+            self.normal_logger.clear_log('Info', f'Potvrzen opakovaný tisk {serial}')
+        return confirmed
 
-            # === 3️⃣ Getting values from I= row / Získání hodnot z I= řádku
-            trigger_values = self.validator.extract_trigger_values_c4(lbl_lines, self.serial_input)
-            if not trigger_values:
-                return
+    def is_printed(self, serial: str) -> bool:
+        """
+        True if the serial was printed or its labels are still in the queue.
+        True, pokud byl serial vytištěn nebo jsou jeho etikety ještě ve frontě.
+        """
+        return serial in self.printed or serial in self.unconfirmed
+
+    def lbl_signature(self) -> tuple[int, int] | None:
+        """
+        Returns (mtime_ns, size) of the order .lbl file or None.
+        Vrátí (mtime_ns, velikost) .lbl souboru příkazu nebo None.
+        """
+        orders_path = self.config.get_path('orders_path', section='Paths')
+        try:
+            stat = (orders_path / f'{self.print_window.order_code}.lbl').stat()
+            return stat.st_mtime_ns, stat.st_size
+        except (OSError, TypeError):
+            return None
 
-            # === 4️⃣ Starting enrolment for Control4 / Spuštění zápisu pro Control4
-            self.control4_save_and_print(header, record, trigger_values)
+    def reprint_from_journal(self, serial: str) -> bool:
+        """
+        Reprints the serial from local journal if it was printed from the same .lbl version.
+        Dotiskne serial z lokálního deníku, pokud byl vytištěn ze stejné verze .lbl.
 
-            # === 5️⃣ Log entry / Zápis do logu
-            self.normal_logger.clear_log('Info', f'Control4 {self.serial_input}')
+        :return: False if the serial has to be rendered again / False, pokud je nutné serial vykreslit znovu
+        """
+        entry = self.journal.get(serial)
+        if not entry:
+            return False
 
-        # 📌 Execute my2n-save-and-print functions as needed / Spuštění odpovídajících funkcí
-        if 'my2n' in triggers:
-            reports_path = self.config.get_path('reports_path', section='Paths')
-            output_path = self.config.get_path('output_file_path_my2n', section='My2nPaths')
+        # 💡 Changed .lbl (corrected order) → render again / Změněný .lbl (opravený příkaz) → znovu vykreslit
+        if entry['source'] and tuple(entry['source']) != self.lbl_signature():
+            return False
 
-            if not reports_path or not output_path:
-                self.normal_logger.log('Error', 'Cesty k reportu nebo výstupu nejsou definovány.', 'PRICON016')
-                self.messenger.show_error('Error', 'Chybí konfigurace cest pro My2N.', 'PRICON016', False)
-                return
+        for job in self.journal.jobs(entry):
+            job.scan_started = self.scan.started
+            self.print_queue.enqueue(job)
+        self.scan.lap('journal')
 
-            token = self.validator.extract_my2n_token(self.serial_input, reports_path)
-            if not token:
-                return
+        self.normal_logger.clear_log('Info', f'Dotisk z deníku {serial} (tisk {entry["printed_at"]})')
+        self.normal_logger.add_blank_line()
+        return True
 
-            self.my2n_save_and_print(self.serial_input, token, output_path)
-            self.normal_logger.clear_log('Info', f'My2N token: {token}')
+    def reprint_last_click(self):
+        """
+        Reprints the last N printed serials of the order from the local journal.
+        Dotiskne posledních N vytištěných serialů příkazu z lokálního deníku.
+        """
+        if not len(self.journal):
+            self.messenger.show_info('Info', 'Pro tento příkaz zatím nebylo nic vytištěno.', 'PRICON024')
+            self.print_window.reset_input_focus()
+            return
+
+        count = self.print_window.ask_reprint_count(len(self.journal))
+        if not count:
+            self.print_window.reset_input_focus()
+            return
 
+        for entry in self.journal.last(count):
+            for job in self.journal.jobs(entry):
+                self.print_queue.enqueue(job)
+
+        self.normal_logger.clear_log('Info', f'Dotisk posledních {count} serial numbers z deníku')
         self.normal_logger.add_blank_line()
         self.print_window.reset_input_focus()
 
+    def batch_button_click(self):
+        """
+        Starts batch print of a serial range or pasted/scanned list.
+        Spustí dávkový tisk rozsahu nebo vloženého/naskenovaného seznamu serial numbers.
+
+        - All serials are checked against the order index before the first label / Všechny serialy se ověří v indexu před první etiketou
+        - Labels are then streamed through the print queue with progress, pause and cancel
+        - Etikety pak postupně proudí tiskovou frontou s průběhem, pauzou a zrušením
+        """
+        if self.batch and self.batch.running:
+            return
+
+        if not self.lbl_finished:
+            self.messenger.show_info('Info', 'Příkaz se ještě indexuje, dávku spusťte za chvíli.', 'PRICON034')
+            self.print_window.reset_input_focus()
+            return
+
+        text = self.print_window.ask_batch_serials()
+        if text is None:
+            return
+
+        # === 1️⃣ Parse range / list / Rozbor rozsahu nebo seznamu
+        try:
+            serials = parse_serial_batch(text, int(self.config.get_value('Printing', 'batch_max_serials', fallback='1000')))
+        except ValueError as e:
+            self.normal_logger.log('Warning', f'Neplatný vstup dávky: {str(e)}', 'PRICON019')
+            self.messenger.show_warning('Warning', str(e), 'PRICON019')
+            return
+
+        if not serials:
+            return
+
+        # === 2️⃣ Validate all serials up front / Validace všech serialů předem
+        lbl_index = self.load_file_lbl()
+        if not lbl_index:
+            return
+
+        required = ''.join(GROUP_FIELDS.get(group, '') for group in self.get_trigger_groups_for_product())
+        invalid = [serial for serial in serials if lbl_index.missing(serial, required)] if required else []
+        if invalid:
+            shown = ', '.join(invalid[:10]) + (' …' if len(invalid) > 10 else '')
+            self.normal_logger.log('Warning', f'Dávka obsahuje {len(invalid)} neplatných serial numbers: {", ".join(invalid)}', 'PRICON020')
+            self.messenger.show_warning('Warning', f'Dávka obsahuje {len(invalid)} serial numbers bez kompletních řádků v .lbl: {shown}', 'PRICON020')
+            return
+
+        # 🔐 My2N labels need a token – index first, report only for serials it does not know / Index, report jen pro neznámé serialy
+        if 'my2n' in self.get_trigger_groups_for_product():
+            without_token = self.serials_without_my2n_token(serials)
+            if without_token:
+                shown = ', '.join(without_token[:10]) + (' …' if len(without_token) > 10 else '')
+                self.normal_logger.log('Warning', f'Dávka obsahuje {len(without_token)} serial numbers bez My2N tokenu: {", ".join(without_token)}', 'PRICON031')
+                self.messenger.show_warning('Warning', f'Dávka obsahuje {len(without_token)} serial numbers bez My2N reportu nebo tokenu: {shown}', 'PRICON031')
+                return
+
+        # === 3️⃣ Already printed serials / Již vytištěné serialy
+        duplicates = [serial for serial in serials if self.is_printed(serial)] if self.duplicate_check != 'off' else []
+        if duplicates:
+            self.normal_logger.log('Warning', f'Dávka obsahuje {len(duplicates)} již vytištěných serial numbers.', 'PRICON026')
+            reprint = self.duplicate_check == 'confirm' and self.messenger.ask_question(
+                'Warning', f'{len(duplicates)} z {len(serials)} serial numbers už bylo vytištěno.\nVytisknout je znovu? (Ne = přeskočit)', 'PRICON026')
+            if not reprint:
+                skipped = set(duplicates)
+                serials = [serial for serial in serials if serial not in skipped]
+                if not serials:
+                    self.messenger.show_info('Info', 'Všechny serial numbers dávky už byly vytištěny.', 'PRICON026')
+                    return
+
+        # === 4️⃣ Stream labels through the print queue / Postupné zařazování etiket do fronty
+        self.normal_logger.log('Info', f'Dávkový tisk {len(serials)} serial numbers ({serials[0]} … {serials[-1]}).', 'PRICON021')
+        self.batch = BatchPrinter(
+            serials,
+            self.print_batch_serial,
+            lambda: self.print_queue.depth,
+            window=int(self.config.get_value('Printing', 'batch_window', fallback='2')),
+        )
+        self.batch.progress.connect(self.print_window.set_batch_progress)
+        self.batch.paused_changed.connect(self.print_window.set_batch_paused)
+        self.batch.finished.connect(self.on_batch_finished)
+
+        self.print_window.show_batch(len(serials))
+        self.batch.start()
+
+    def serials_without_my2n_token(self, serials: list[str]) -> list[str]:
+        """
+        Returns serials whose My2N token is neither in the index nor in their report.
+        Vrátí serialy, jejichž My2N token není v indexu ani v jejich reportu.
+        """
+        unindexed = [serial for serial in serials if not (self.my2n_index and self.my2n_index.lookup(serial))]
+
+        reports_path = self.config.get_path('reports_path', section='Paths')
+        if not reports_path:
+            return unindexed
+
+        missing = []
+        for serial in unindexed:
+            try:
+                find_my2n_token(serial, reports_path)
+            except PrintServiceError:
+                missing.append(serial)
+        return missing
+
+    def print_batch_serial(self, serial: str) -> bool:
+        """
+        Prints one serial of the running batch (journal first, index is revalidated by the order cache).
+        Vytiskne jeden serial běžící dávky (nejdřív z deníku, index revaliduje cache příkazů).
+        """
+        self.scan = ScanTimer(self.metrics, self.print_window.order_code, serial)
+        if self.reprint_from_journal(serial):
+            self.scan.finish('reprint')
+            return True
+
+        triggers = self.get_trigger_groups_for_product()
+        self.scan.lap('config')
+        lbl_index = self.load_file_lbl()
+        self.scan.lap('load_lbl')
+
+        ok = bool(lbl_index) and self.print_serial(serial, triggers, lbl_index)
+        self.scan.finish('ok' if ok else 'failed')
+        return ok
+
+    def batch_pause_click(self):
+        """
+        Pauses or resumes the running batch.
+        Pozastaví nebo obnoví běžící dávku.
+        """
+        if self.batch:
+            self.batch.set_paused(not self.batch.paused)
+
+    def batch_cancel_click(self):
+        """
+        Cancels the rest of the running batch.
+        Zruší zbytek běžící dávky.
+        """
+        if self.batch:
+            self.batch.cancel()
+
+    def on_batch_finished(self, processed: int, total: int, cancelled: bool) -> None:
+        """
+        Hides batch panel and reports the result.
+        Skryje panel dávky a oznámí výsledek.
+        """
+        self.batch = None
+        self.print_window.hide_batch()
+
+        if cancelled:
+            self.normal_logger.log('Warning', f'Dávkový tisk zrušen po {processed} z {total} serial numbers.', 'PRICON022')
+            self.messenger.show_info('Info', f'Dávka zrušena po {processed} z {total} serial numbers.')
+        else:
+            self.normal_logger.log('Info', f'Dávkový tisk dokončen: {processed} serial numbers.', 'PRICON023')
+
     def handle_exit(self):
         """
         Closes PrintWindow and returns to the previous window.
         Zavře PrintWindow a vrátí se na předchozí okno ve stacku.
         """
+        # 📦 Remaining batch serials are dropped with the window / Zbytek dávky se se zavřením okna zahodí
+        if self.batch:
+            self.batch.finished.disconnect(self.on_batch_finished)
+            self.batch.cancel()
+            self.batch = None
+
+        # 🧾 Queued labels keep printing, only window updates are detached / Fronta tiskne dál, odpojí se jen aktualizace okna
+        self.print_queue.depth_changed.disconnect(self.on_queue_depth_changed)
+        self.print_queue.label_started.disconnect(self.on_label_started)
+        self.print_queue.job_failed.disconnect(self.on_print_job_failed)
+        self.print_queue.job_failed.connect(lambda message, error_code: Messenger().show_error('Error', message, error_code, False))
+
+        # 🔮 Pending renders of the next boxes are dropped / Čekající vykreslení dalších krabic se zahodí
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+
+        # 🔐 No more My2N refreshes for a closed order / Pro zavřený příkaz se index My2N už neobnovuje
+        self.my2n_timer.stop()
+        if self.my2n_worker:
+            self.my2n_worker.signals.finished.disconnect(self.on_my2n_indexed)
+            self.my2n_worker.signals.failed.disconnect(self.on_my2n_index_failed)
+
+        # ⏱️ Persist learned pacing / Uložení naučeného tempa tisku
+        pacing = get_pacing_profile()
+        if pacing:
+            pacing.save()
+
+        # 📊 Write pending metrics / Zápis čekajících metrik
+        if self.metrics:
+            self.metrics.flush()
+
         self.print_window.effects.fade_out(self.print_window, duration=1000)
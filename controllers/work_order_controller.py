@@ -7,6 +7,8 @@ from core.logger import Logger
 from core.messenger import Messenger
 from views.work_order_window import WorkOrderWindow
 from core.config_loader import ConfigLoader
+from utils.order_loader import OrderLoadWorker
+from PyQt6.QtCore import QThreadPool
 
 
 class WorkOrderController:
@@ -27,11 +29,11 @@ class WorkOrderController:
         self.nor_file = None
 
         # 📄 Parsed data / Načtené hodnoty
-        self.lines = None
         self.found_product_name = None
 
         self.print_controller = None
         self.print_window = None
+        self.order_loader = None
 
         # 📌 Logging setup / Nastavení loggeru
         self.normal_logger = Logger(spaced=False)
@@ -70,9 +72,8 @@ class WorkOrderController:
         Spuštěno po stisknutí tlačítka 'Pokračuj'.
 
         - Validates input
-        - Checks .lbl and .nor file existence
-        - Parses .nor file and validates order
-        - Loads label content and launches print controller
+        - Starts background loading of the order (file checks, .nor parsing, .lbl indexing)
+        - Keeps the window responsive and shows a progress indicator meanwhile
         """
 
         # 📌 Processing of input / Zpracování vstupu
@@ -86,61 +87,55 @@ class WorkOrderController:
         self.orders_dir = Path('T:/Prikazy')
         self.lbl_file = self.orders_dir / f'{value_input}.lbl'
         self.nor_file = self.orders_dir / f'{value_input}.nor'
+        self.found_product_name = None
 
-        # ❌ If file not found / Příkaz neexistuje
-        if not self.lbl_file.exists() or not self.nor_file.exists():
-            self.lines = []
-            self.found_product_name = None
-            self.normal_logger.log('Warning', f'Soubor {self.lbl_file} nebo {self.nor_file} nebyl nalezen!', 'WORORCON005')
-            self.messenger.show_warning('Warning', f'Soubor {self.lbl_file} nebo {self.nor_file} nebyl nalezen!', 'WORORCON005')
-            self.reset_input_focus()
-            return
+        # ⏳ Load the order off the GUI thread / Načtení příkazu mimo GUI vlákno
+        self.order_loader = OrderLoadWorker(self.orders_dir, value_input)
+        self.order_loader.signals.nor_ready.connect(self.on_nor_ready)
+        self.order_loader.signals.nor_failed.connect(self.on_nor_failed)
+        self.order_loader.signals.lbl_failed.connect(self.on_lbl_failed)
 
-        try:
-            with self.nor_file.open('r') as file:
-                first_line = file.readline().strip()
-                parts = first_line.split(';')
-
-                if len(parts) >= 2:
-                    nor_order_code = parts[0].lstrip('$').upper()
-                    product_name = parts[1].strip()
-
-                    if nor_order_code != value_input:
-                        self.normal_logger.log('Warning', f'Výrobní příkaz v souboru .NOR ({nor_order_code}) neodpovídá zadanému vstupu ({value_input})!', 'WORORCON006')
-                        self.messenger.show_warning('Warning', f'Výrobní příkaz v souboru .NOR ({nor_order_code}) neodpovídá zadanému vstupu ({value_input})!', 'WORORCON006')
-                        self.reset_input_focus()
-                        return
-
-                    self.found_product_name = product_name
-                    self.lines = self.load_file(self.lbl_file)
-
-                    # 📌 Tady zavoláme další okno:
-                    self.run_bartender_commander()
-                    self.open_app_window(order_code=value_input, product_name=product_name)
-                    self.reset_input_focus()
-
-                else:
-                    self.normal_logger.log('Warning', f'Řádek v souboru {self.nor_file} nemá očekávaný formát.', 'WORORCON007')
-                    self.messenger.show_warning('Warning', f'Řádek v souboru {self.nor_file} nemá očekávaný formát.', 'WORORCON007')
-                    self.reset_input_focus()
-                    return
-        except Exception as e:
-            self.normal_logger.log('Error', f'Neočekávaná chyba při zpracování .NOR souboru: {e}', 'WORORCON008')
-            self.messenger.show_error('Error', f'{e}', 'WORORCON008', exit_on_close=False)
-            self.reset_input_focus()
-            return
+        self.work_order_window.show_loading(f'Načítám příkaz {value_input}…')
+        QThreadPool.globalInstance().start(self.order_loader)
 
-    def load_file(self, file_path: Path) -> list[str]:
+    def on_nor_ready(self, order_code: str, product_name: str):
         """
-        Loads text content from file.
-        Načte obsah souboru a vrátí jako list řádků.
+        Called when the .nor file is validated – opens print window right away.
+        Zavoláno po ověření .nor souboru – ihned otevře tiskové okno.
+
+        :param order_code: Validated work order / Ověřený výrobní příkaz
+        :param product_name: Product name from .nor / Název produktu ze souboru .nor
         """
-        try:
-            return file_path.read_text().splitlines()
-        except Exception as e:
-            self.normal_logger.log('Error', f'Soubor {file_path} se nepodařilo načíst: {e}', 'WORORCON009')
-            self.messenger.show_error('Error', f'{e}', 'WORORCON009', False)
-            return []
+        self.work_order_window.hide_loading()
+        self.found_product_name = product_name
+
+        # 📌 Tady zavoláme další okno (index .lbl se mezitím dokončuje na pozadí):
+        self.run_bartender_commander()
+        self.open_app_window(order_code=order_code, product_name=product_name)
+        self.reset_input_focus()
+
+    def on_nor_failed(self, level: str, message: str, error_code: str):
+        """
+        Called when the order cannot be opened (missing files, invalid .nor).
+        Zavoláno, pokud příkaz nelze otevřít (chybějící soubory, neplatný .nor).
+        """
+        self.work_order_window.hide_loading()
+        self.normal_logger.log(level, message, error_code)
+
+        if level == 'Error':
+            self.messenger.show_error('Error', message, error_code, exit_on_close=False)
+        else:
+            self.messenger.show_warning('Warning', message, error_code)
+
+        self.reset_input_focus()
+
+    def on_lbl_failed(self, message: str):
+        """
+        Called when background indexing of the .lbl file failed.
+        Zavoláno, pokud se na pozadí nepodařilo zaindexovat .lbl soubor.
+        """
+        self.normal_logger.log('Error', f'Soubor {self.lbl_file} se nepodařilo načíst: {message}', 'WORORCON009')
+        self.messenger.show_error('Error', f'{message}', 'WORORCON009', False)
 
     def open_app_window(self, order_code, product_name):
         """
@@ -148,7 +143,7 @@ class WorkOrderController:
         Vytvoří PrintController a otevře další okno (tisk).
         """
         from controllers.print_controller import PrintController
-        self.print_controller = PrintController(self.window_stack, order_code, product_name)
+        self.print_controller = PrintController(self.window_stack, order_code, product_name, order_loader=self.order_loader)
         self.window_stack.push(self.print_controller.print_window)
 
     def reset_input_focus(self):
@@ -0,0 +1,117 @@
+# 📦 BatchPrinter – streams a validated list of serials into the print pipeline
+# Postupně předává zvalidovaný seznam serial numbers do tiskové fronty
+
+from collections import deque
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class BatchPrinter(QObject):
+    """
+    Feeds serials one by one to the controller while keeping the print queue short.
+    Předává serialy po jednom controlleru a udržuje tiskovou frontu krátkou.
+
+    - Next serial is processed only while fewer than 'window' jobs are queued, so pause/cancel
+      take effect within a couple of labels / Další serial jen pokud je ve frontě méně než 'window' úloh
+    - A failed serial pauses the batch, operator decides to resume or cancel / Chyba serialu dávku pozastaví
+    - Labels already queued are always printed / Etikety už zařazené do fronty se vždy vytisknou
+    """
+
+    progress = pyqtSignal(int, int)  # processed, total
+    paused_changed = pyqtSignal(bool)
+    finished = pyqtSignal(int, int, bool)  # processed, total, cancelled
+
+    def __init__(self, serials: list[str], process, queue_depth, window: int = 2, tick_ms: int = 100, parent=None):
+        """
+        :param serials: Validated serial numbers / Zvalidované serial numbers
+        :param process: Callable(serial) → bool, enqueues labels of one serial / Zařadí etikety jednoho serialu
+        :param queue_depth: Callable() → int, jobs waiting in print queue / Počet úloh ve frontě
+        :param window: Max jobs queued ahead / Maximální počet úloh ve frontě dopředu
+        :param tick_ms: Feeding interval / Interval podávání
+        """
+        super().__init__(parent)
+        self.process = process
+        self.queue_depth = queue_depth
+        self.window = max(1, window)
+        self.total = len(serials)
+        self.processed = 0
+        self.paused = False
+
+        self._active = False
+        self._serials = deque(serials)
+        self._timer = QTimer(self)
+        self._timer.setInterval(tick_ms)
+        self._timer.timeout.connect(self._feed)
+
+    @property
+    def running(self) -> bool:
+        """
+        True until the batch is finished or cancelled.
+        True, dokud dávka není dokončena nebo zrušena.
+        """
+        return self._active
+
+    def start(self) -> None:
+        """
+        Starts feeding serials.
+        Spustí podávání serialů.
+        """
+        self._active = True
+        self.progress.emit(self.processed, self.total)
+        self._timer.start()
+
+    def set_paused(self, paused: bool) -> None:
+        """
+        Pauses or resumes the batch.
+        Pozastaví nebo obnoví dávku.
+        """
+        if paused == self.paused or not self.running:
+            return
+
+        self.paused = paused
+        if paused:
+            self._timer.stop()
+        else:
+            self._timer.start()
+        self.paused_changed.emit(paused)
+
+    def cancel(self) -> None:
+        """
+        Drops remaining serials (queued labels still print).
+        Zahodí zbývající serialy (zařazené etikety se dotisknou).
+        """
+        if not self.running:
+            return
+
+        self._serials.clear()
+        self._finish(cancelled=True)
+
+    def _feed(self) -> None:
+        """
+        Processes next serial if the print queue has room.
+        Zpracuje další serial, pokud je ve frontě místo.
+        """
+        if not self._serials:
+            self._finish(cancelled=False)
+            return
+
+        if self.queue_depth() >= self.window:
+            return
+
+        # 💡 Error dialogs run a nested event loop – no feeding meanwhile / Dialog chyby běží ve vnořené smyčce – mezitím nepodáváme
+        self._timer.stop()
+        serial = self._serials.popleft()
+        ok = self.process(serial)
+        self.processed += 1
+        self.progress.emit(self.processed, self.total)
+
+        if not ok and self._active and not self.paused:
+            self.paused = True
+            self.paused_changed.emit(True)
+        elif self._active and not self.paused:
+            self._timer.start()
+
+    def _finish(self, cancelled: bool) -> None:
+        self._timer.stop()
+        self._active = False
+        self.paused = False
+        self.finished.emit(self.processed, self.total, cancelled)
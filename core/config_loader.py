@@ -35,6 +35,18 @@ class ConfigLoader:
         raw = self.config.get(section, key, fallback=fallback)
         return Path(raw).resolve() if raw else None
 
+    def get_paths(self, key: str, section: str = 'Paths') -> list[Path]:
+        """
+        Returns list of resolved Paths from a comma-separated value.
+        Vrací seznam absolutních cest z hodnoty oddělené čárkami.
+
+        :param key: Key name / Název klíče
+        :param section: Name of section to search (default is "Paths") / Název sekce (výchozí je "Paths")
+        :return: List of Path objects (empty if key not found) / Seznam cest
+        """
+        raw = self.config.get(section, key, fallback='')
+        return [Path(v.strip()).resolve() for v in raw.split(',') if v.strip()]
+
     def get_trigger_values(self, section: str, trigger_name: str) -> list[str]:
         """
         Returns list of values for a given trigger in the specified section.
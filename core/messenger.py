@@ -90,6 +90,27 @@ class Messenger:
         if exit_on_close and result == QMessageBox.StandardButton.Ok:
             QApplication.quit()
 
+    def ask_question(self, title: str, message: str, error_code=None) -> bool:
+        """
+        Asks a yes/no question, 'No' is the default (a scanner's Enter cannot confirm by accident).
+        Položí otázku ano/ne, výchozí je 'Ne' (Enter ze čtečky nic omylem nepotvrdí).
+
+        :param title: Window title / Název okna
+        :param message: Question text / Text otázky
+        :param error_code: Optional error ID
+        :return: True if confirmed / True, pokud bylo potvrzeno
+        """
+        result = self._show_dialog(
+            title=title,
+            message=message,
+            error_code=error_code,
+            icon=QMessageBox.Icon.Question,
+            icon_path=self.warning_icon_path,
+            buttons=QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            default_button=QMessageBox.StandardButton.No
+        )
+        return QMessageBox.StandardButton(result) == QMessageBox.StandardButton.Yes  # 💡 exec() returns int / exec() vrací int
+
     def show_timed_info(self, title: str, message: str, duration_ms: int = 3000):
         """
         Shows a transient informational dialog that closes automatically after duration.
@@ -125,7 +146,8 @@ class Messenger:
         # ⏲️ Setting the automatic closing / Nastavení automatiky na zavření
         QTimer.singleShot(duration_ms, dialog.accept)
 
-    def _show_dialog(self, title, message, error_code, icon, icon_path):
+    def _show_dialog(self, title, message, error_code, icon, icon_path,
+                     buttons=QMessageBox.StandardButton.Ok, default_button=None):
         """
         Internal shared dialog rendering method.
         Interní metoda pro vykreslení libovolného dialogu.
@@ -137,7 +159,9 @@ class Messenger:
         dialog.setWindowIcon(QIcon(str(icon_path)))
         dialog.setWindowTitle(title)
         dialog.setText(f'{message}' if error_code is None else f'[{error_code}]\n{message}')
-        dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+        dialog.setStandardButtons(buttons)
+        if default_button is not None:
+            dialog.setDefaultButton(default_button)
 
         dialog.adjustSize()
 
@@ -0,0 +1,179 @@
+# 🔐 My2nTokenIndex – local SQLite index of My2N tokens (serial → token) for a whole order
+# Lokální SQLite index My2N tokenů (serial → token) pro celý výrobní příkaz
+
+import os
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from core.config_loader import ConfigLoader
+from core.logger import Logger
+from core.print_service import PrintServiceError, MY2N_TOKEN_PREFIX, my2n_report_path, parse_my2n_token_line
+from utils.tail_reader import find_last_line
+
+# 📦 Shared instance for all orders / Sdílená instance pro všechny příkazy
+_my2n_index = None
+_my2n_index_lock = threading.Lock()
+
+
+def get_my2n_index():
+    """
+    Returns the application-wide My2N token index or None when it cannot be opened.
+    Vrací sdílený index My2N tokenů nebo None, pokud jej nelze otevřít.
+
+    - Database: <[Paths] local_data_path>/my2n_tokens.sqlite (default folder 'data')
+    """
+    global _my2n_index
+    with _my2n_index_lock:
+        if _my2n_index is None:
+            db_path = ConfigLoader().get_path('local_data_path', fallback='data') / 'my2n_tokens.sqlite'
+            try:
+                _my2n_index = My2nTokenIndex(db_path)
+            except Exception as e:
+                Logger(spaced=False).log('Warning', f'Index My2N tokenů nelze otevřít: {str(e)}', 'MY2IDX001')
+                return None
+        return _my2n_index
+
+
+class My2nTokenIndex:
+    """
+    Serial → token table kept in a local SQLite file, refreshed from report files on the share.
+    Tabulka serial → token v lokálním SQLite souboru, obnovovaná z reportů na sdíleném disku.
+
+    - Each row remembers (mtime_ns, size) of its report, refresh re-reads only new or changed reports
+    - Refresh lists the few report folders (20YY/MMMM) of the order with os.scandir instead of one stat() per serial
+      (on Windows the directory listing already carries mtime and size)
+    - Reports are read in a thread pool (network share latency overlaps)
+    - Lookup at scan time is a local primary-key query plus one stat() of the report, a changed report is re-read
+    - Rows of reports that disappeared are dropped (scan then falls back to reading the report and reports the error)
+
+    - Každý řádek si pamatuje (mtime_ns, velikost) reportu, obnova čte jen nové nebo změněné reporty
+    - Obnova projde os.scandir několik složek reportů příkazu (20YY/MMMM) místo stat() pro každý serial
+      (na Windows nese výpis složky čas změny i velikost)
+    - Reporty se čtou ve fondu vláken (latence sdíleného disku se překrývá)
+    - Dotaz při skenu je lokální dotaz podle primárního klíče a jeden stat() reportu, změněný report se přečte znovu
+    - Řádky zmizelých reportů se odstraní (sken pak čte report přímo a chybu ohlásí)
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        :param db_path: SQLite file / SQLite soubor
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS tokens ('
+                'serial TEXT PRIMARY KEY, token TEXT NOT NULL, report TEXT NOT NULL, '
+                'mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, indexed_at REAL NOT NULL)'
+            )
+
+    def lookup(self, serial: str) -> str | None:
+        """
+        Returns indexed token of the serial or None (report is revalidated by stat first).
+        Vrátí zaindexovaný token serialu nebo None (report se nejdříve ověří pomocí stat).
+
+        - Changed report → token is re-read and the row updated / Změněný report → token se přečte znovu a řádek aktualizuje
+        - Missing or unreadable report → row is dropped, None / Chybějící nebo nečitelný report → řádek se odstraní, None
+        """
+        try:
+            with self._lock:
+                row = self._db.execute('SELECT token, report, mtime_ns, size FROM tokens WHERE serial = ?',
+                                       (serial,)).fetchone()
+            if not row:
+                return None
+
+            token, report, mtime_ns, size = row
+            try:
+                stat = Path(report).stat()
+                if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                    return token
+
+                token_line = find_last_line(Path(report), MY2N_TOKEN_PREFIX)
+                token = parse_my2n_token_line(token_line) if token_line else None
+            except (OSError, PrintServiceError):
+                token = None
+
+            with self._lock, self._db:
+                if token:
+                    self._db.execute('UPDATE tokens SET token = ?, mtime_ns = ?, size = ?, indexed_at = ? WHERE serial = ?',
+                                     (token, stat.st_mtime_ns, stat.st_size, time.time(), serial))
+                else:
+                    self._db.execute('DELETE FROM tokens WHERE serial = ?', (serial,))
+            return token
+        except sqlite3.Error as e:
+            Logger(spaced=False).log('Warning', f'Dotaz do indexu My2N tokenů selhal: {str(e)}', 'MY2IDX002')
+            return None
+
+    def refresh(self, serials: list[str], reports_path: Path, workers: int = 8) -> list[str]:
+        """
+        Indexes tokens of the serials (only reports not indexed yet or changed since).
+        Zaindexuje tokeny serialů (jen reporty dosud nezaindexované nebo od té doby změněné).
+
+        :param serials: Serials of the order / Serial numbers příkazu
+        :param reports_path: Root folder of reports / Kořenová složka reportů
+        :param workers: Parallel report readers / Počet paralelních čtení reportů
+        :return: Serials whose report or token is missing / Serialy, kterým chybí report nebo token
+        """
+        with self._lock:
+            known = {serial: (mtime_ns, size) for serial, mtime_ns, size in
+                     self._db.execute('SELECT serial, mtime_ns, size FROM tokens')}
+
+        # 📁 Serials grouped by report folder / Serialy seskupené podle složky reportu
+        folders: dict[Path, dict[str, str]] = {}
+        missing = []
+        for serial in serials:
+            try:
+                report = my2n_report_path(serial, reports_path)
+            except PrintServiceError:
+                missing.append(serial)
+                continue
+            folders.setdefault(report.parent, {})[report.name] = serial
+
+        def list_folder(folder: Path) -> list[tuple[str, Path, tuple[int, int]]]:
+            wanted = folders[folder]
+            listing = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name in wanted and entry.is_file():
+                            stat = entry.stat()  # 💡 Only the order's reports, free on Windows / Jen reporty příkazu, na Windows zdarma
+                            listing.append((wanted[entry.name], Path(entry.path), (stat.st_mtime_ns, stat.st_size)))
+            except OSError:
+                pass  # 💡 Unreachable folder → its serials are reported missing / Nedostupná složka → serialy chybí
+            return listing
+
+        def read_token(serial: str, report: Path):
+            try:
+                token_line = find_last_line(report, MY2N_TOKEN_PREFIX)
+                return serial, parse_my2n_token_line(token_line) if token_line else None
+            except (OSError, PrintServiceError):
+                return serial, None
+
+        rows = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            found = {serial: (report, signature)
+                     for listing in pool.map(list_folder, folders) for serial, report, signature in listing}
+
+            # 🔍 Only new or changed reports are read / Čtou se jen nové nebo změněné reporty
+            changed = [serial for serial, (_report, signature) in found.items() if known.get(serial) != signature]
+            for serial, token in pool.map(lambda serial: read_token(serial, found[serial][0]), changed):
+                if token:
+                    report, (mtime_ns, size) = found[serial]
+                    rows.append((serial, token, str(report), mtime_ns, size, time.time()))
+                else:
+                    missing.append(serial)
+
+        missing += [serial for folder_serials in folders.values() for serial in folder_serials.values() if serial not in found]
+
+        # 🧹 Reports that disappeared (or lost their token) must not keep serving old tokens / Zmizelé reporty nesmí dál vydávat staré tokeny
+        stale = [(serial,) for serial in missing if serial in known]
+        if rows or stale:
+            with self._lock, self._db:
+                self._db.executemany('INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?, ?)', rows)
+                self._db.executemany('DELETE FROM tokens WHERE serial = ?', stale)
+
+        return sorted(missing)
@@ -0,0 +1,141 @@
+# ⏱️ PacingProfile – learns how long BarTender takes per label template and persists it
+# Učí se, jak dlouho BarTender zpracovává jednotlivé šablony etiket, a ukládá to na disk
+
+import json
+import os
+import time
+import threading
+from collections import deque
+from pathlib import Path
+from core.config_loader import ConfigLoader
+from core.logger import Logger
+
+# 📦 Shared instance for all print lanes / Sdílená instance pro všechny tiskové linky
+_pacing_profile = None
+_pacing_profile_lock = threading.Lock()
+
+
+def get_pacing_profile():
+    """
+    Returns the application-wide pacing profile or None when adaptive pacing is disabled.
+    Vrací sdílený profil tempa tisku nebo None, pokud je adaptivní tempo vypnuté.
+
+    - [Printing] adaptive_pacing (default true), pacing_percentile (95), pacing_margin (0.25),
+      pacing_window (50), pacing_min_samples (5)
+    - Profile file: <[Paths] local_data_path>/pacing_profile.json (default folder 'data')
+    """
+    global _pacing_profile
+    with _pacing_profile_lock:
+        if _pacing_profile is None:
+            config = ConfigLoader()
+            if config.get_value('Printing', 'adaptive_pacing', fallback='true').strip().lower() != 'true':
+                return None
+
+            data_dir = config.get_path('local_data_path', fallback='data')
+            _pacing_profile = PacingProfile(
+                data_dir / 'pacing_profile.json',
+                percentile=float(config.get_value('Printing', 'pacing_percentile', fallback='95')),
+                margin=float(config.get_value('Printing', 'pacing_margin', fallback='0.25')),
+                window=int(config.get_value('Printing', 'pacing_window', fallback='50')),
+                min_samples=int(config.get_value('Printing', 'pacing_min_samples', fallback='5')),
+            )
+        return _pacing_profile
+
+
+class PacingProfile:
+    """
+    Rolling window of observed consume times per trigger value (label template).
+    Klouzavé okno naměřených časů zpracování pro každou hodnotu spouštěče (šablonu etikety).
+
+    - learned_ms(): percentile of the window × (1 + margin) / percentil okna × (1 + rezerva)
+    - Saved to JSON at most every 'save_interval_s' seconds / Ukládá se do JSON nejvýše jednou za 'save_interval_s'
+    """
+
+    def __init__(self, path: Path, percentile: float = 95, margin: float = 0.25, window: int = 50,
+                 min_samples: int = 5, save_interval_s: float = 30):
+        """
+        :param path: JSON file with learned samples / JSON soubor s naučenými vzorky
+        :param percentile: Percentile used as latency (0–100) / Percentil použitý jako latence
+        :param margin: Safety margin (0.25 = +25 %) / Bezpečnostní rezerva
+        :param window: Samples kept per template / Počet vzorků na šablonu
+        :param min_samples: Samples needed before learned value is used / Minimum vzorků pro použití
+        :param save_interval_s: Minimal delay between saves / Minimální odstup mezi uloženími
+        """
+        self.path = path
+        self.percentile = percentile
+        self.margin = margin
+        self.window = window
+        self.min_samples = min_samples
+        self.save_interval_s = save_interval_s
+
+        self._samples: dict[str, deque[float]] = {}
+        self._last_save = 0.0
+        self._dirty = False
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+        self._load()
+
+    def record(self, value: str, elapsed_ms: float) -> None:
+        """
+        Adds an observed consume time of the template.
+        Přidá naměřený čas zpracování šablony.
+
+        :param value: Trigger value (template) / Hodnota spouštěče (šablona)
+        :param elapsed_ms: Time from trigger creation to its consumption / Čas od vytvoření po zpracování
+        """
+        samples = self._samples.get(value)
+        if samples is None:
+            samples = self._samples[value] = deque(maxlen=self.window)
+        samples.append(round(elapsed_ms, 1))
+
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.save_interval_s:
+            self.save()
+
+    def learned_ms(self, value: str) -> float | None:
+        """
+        Returns learned latency of the template including margin, or None if not enough samples.
+        Vrátí naučenou latenci šablony včetně rezervy, nebo None při nedostatku vzorků.
+        """
+        samples = self._samples.get(value)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        rank = max(0, min(len(ordered) - 1, round(self.percentile / 100 * len(ordered)) - 1))
+        return ordered[rank] * (1 + self.margin)
+
+    def save(self) -> None:
+        """
+        Writes samples to JSON (atomically via temporary file).
+        Zapíše vzorky do JSON (atomicky přes dočasný soubor).
+        """
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix('.tmp')
+            temp_path.write_text(json.dumps({value: list(samples) for value, samples in self._samples.items()}), encoding='utf-8')
+            os.replace(temp_path, self.path)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Profil tempa tisku nelze uložit: {str(e)}', 'PACPRO001')
+
+    def _load(self) -> None:
+        """
+        Loads samples saved by a previous run.
+        Načte vzorky uložené předchozím během.
+        """
+        if not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            for value, samples in data.items():
+                self._samples[value] = deque((float(sample) for sample in samples), maxlen=self.window)
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Profil tempa tisku nelze načíst: {str(e)}', 'PACPRO002')
@@ -0,0 +1,130 @@
+# 🔮 NextBoxPrefetcher – renders labels of the next serials in background while the operator packs
+# Vykresluje etikety následujících serialů na pozadí, zatímco operátor balí
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.print_service import PrintJob, PrintService
+from utils.lbl_index import LblIndex, GROUP_FIELDS
+from utils.serial_batch import serial_to_int, int_to_serial
+
+
+class NextBoxPrefetcher:
+    """
+    Predicts the next serials (boxes are scanned in ascending order) and keeps their rendered print jobs ready.
+    Předpovídá další serialy (krabice se skenují vzestupně) a drží jejich vykreslené tiskové úlohy připravené.
+
+    - Rendering = .lbl rows, prefix injection, My2N token (index or report) – the same steps as a scan
+    - Jobs are served only while the serial's own .lbl rows are unchanged and only within 'max_age_s'
+      (appending other boxes to the .lbl keeps them valid)
+    - Failed render is not cached, the scan then runs the usual path and reports the error
+
+    - Vykreslení = řádky .lbl, vložení prefixu, My2N token (index nebo report) – stejné kroky jako při skenu
+    - Úlohy se vydají, jen dokud se nezměnily vlastní řádky serialu v .lbl, a jen do 'max_age_s'
+      (připsání dalších krabic do .lbl je nezneplatní)
+    - Neúspěšné vykreslení se neukládá, sken pak proběhne obvyklou cestou a chybu ohlásí
+    """
+
+    def __init__(self, service: PrintService, depth: int = 3, max_gap: int = 10, max_age_s: float = 300):
+        """
+        :param service: Print service of the order (product, prefix, paths) / Tisková služba příkazu
+        :param depth: Serials rendered ahead / Počet serialů vykreslených dopředu
+        :param max_gap: Highest serial step still searched for the next box / Největší hledaný skok serialu
+        :param max_age_s: Lifetime of a rendered entry / Doba platnosti vykresleného záznamu
+        """
+        self.service = service
+        self.depth = depth
+        self.max_gap = max_gap
+        self.max_age_s = max_age_s
+
+        self._entries: dict[str, tuple[tuple[str | None, ...], float, list[PrintJob]]] = {}  # serial → (rows, time, jobs)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+
+        self.hits = 0
+        self.misses = 0
+
+    def predict(self, serial: str, lbl_index: LblIndex) -> list[str]:
+        """
+        Returns the next 'depth' serials of the order after the serial (ascending).
+        Vrátí dalších 'depth' serialů příkazu po daném serialu (vzestupně).
+        """
+        try:
+            number = serial_to_int(serial)
+        except ValueError:
+            return []
+
+        predicted = []
+        for candidate in range(number + 1, number + 1 + self.depth * self.max_gap):
+            next_serial = int_to_serial(candidate)
+            if lbl_index.mask(next_serial):
+                predicted.append(next_serial)
+                if len(predicted) == self.depth:
+                    break
+        return predicted
+
+    def prefetch(self, serial: str, lbl_index: LblIndex, groups: list[str]) -> None:
+        """
+        Schedules rendering of the serials predicted after the scanned one.
+        Naplánuje vykreslení serialů předpovězených po naskenovaném.
+        """
+        predicted = self.predict(serial, lbl_index)
+        now = time.monotonic()
+        with self._lock:
+            # 🧹 Serials behind the scan and stale entries are dropped / Serialy za skenem a staré záznamy se zahodí
+            keep = set(predicted)
+            self._entries = {key: entry for key, entry in self._entries.items()
+                             if key in keep and now - entry[1] < self.max_age_s}
+            pending = [next_serial for next_serial in predicted if next_serial not in self._entries]
+
+        for next_serial in pending:
+            self._executor.submit(self._render, next_serial, lbl_index, groups)
+
+    def take(self, serial: str, lbl_index: LblIndex) -> list[PrintJob] | None:
+        """
+        Returns prefetched jobs of the serial (removed from cache) or None.
+        Vrátí předem vykreslené úlohy serialu (odebrané z cache) nebo None.
+
+        :param lbl_index: Current index of the order – only the serial's rows are compared / Aktuální index příkazu
+        """
+        with self._lock:
+            entry = self._entries.pop(serial, None)
+
+        if (entry and time.monotonic() - entry[1] < self.max_age_s
+                and entry[0] == self._rows(serial, lbl_index, [job.group for job in entry[2]])):
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        return None
+
+    def shutdown(self) -> None:
+        """
+        Drops pending renders (running one finishes in background).
+        Zahodí čekající vykreslení (běžící doběhne na pozadí).
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _rows(serial: str, lbl_index: LblIndex, groups: list[str]) -> tuple[str | None, ...]:
+        """
+        Returns the .lbl rows the groups render from (e.g. B, D, E for product).
+        Vrátí řádky .lbl, ze kterých se skupiny vykreslují (např. B, D, E pro produkt).
+        """
+        return tuple(lbl_index.get(serial, field) for group in sorted(groups) for field in GROUP_FIELDS.get(group, ''))
+
+    def _render(self, serial: str, lbl_index: LblIndex, groups: list[str]) -> None:
+        """
+        Executed in the prefetch thread.
+        Spuštěno ve vlákně předběžného vykreslení.
+        """
+        rows = self._rows(serial, lbl_index, groups)
+        try:
+            jobs = self.service.render(serial, lbl_index, groups)
+        except Exception:
+            return  # 💡 Scan of this serial reports the problem itself / Problém ohlásí až sken serialu
+
+        with self._lock:
+            self._entries[serial] = (rows, time.monotonic(), jobs)
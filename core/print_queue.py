@@ -0,0 +1,457 @@
+# 🧾 PrintQueue – asynchronous queue of label jobs fed to BarTender at configured pace
+# Asynchronní fronta tiskových úloh, které se předávají BarTenderu v nastaveném tempu
+
+import time
+from collections import deque
+from pathlib import Path
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+from core.logger import Logger
+from core.print_service import PrintJob, TriggerNamer, write_lines, write_trigger
+
+
+class _OutstandingTrigger:
+    """
+    Trigger file created but not yet consumed by BarTender.
+    Trigger soubor vytvořený, ale BarTenderem ještě nezpracovaný.
+    """
+
+    def __init__(self, path: Path, value: str, job: PrintJob, wait_ms: float):
+        self.path = path
+        self.value = value
+        self.job = job
+        self.wait_ms = wait_ms  # 💡 Pause (fixed mode) or timeout (watch mode) / Prodleva nebo časový limit
+        self.fired_at = time.monotonic()
+        self.consumed = False
+        self.consumed_at: float | None = None  # perf_counter() / kvůli času do etikety
+        self.trigger_ms = 0.0
+
+
+class PrintQueue(QObject):
+    """
+    Dispatcher which writes output files and trigger files one job after another.
+    Dispečer, který postupně zapisuje výstupní soubory a trigger soubory jednotlivých úloh.
+
+    - Scan only validates and enqueues, GUI is ready for the next serial immediately
+    - Output file of a job is written only when the job is dispatched (previous label already consumed)
+    - Next trigger is fired as soon as BarTender consumes (deletes) the previous one
+    - 'consume_timeout_ms' is a safety net when a trigger is not consumed
+    - A trigger file that cannot be written fails its whole job once, remaining triggers are not fired
+    - A job is printed (job_printed) only when all its triggers were consumed; a trigger which timed out
+      or was replaced before consumption drops the job (job_dropped)
+    - With watch_triggers=False waits a fixed 'pace_ms' instead (no nested event loop in either mode)
+    - With unique trigger names up to 'pipeline_depth' triggers may wait at once; each trigger file
+      then carries its own label data, so jobs of the same template do not overwrite each other
+    - With a PacingProfile the consume time of every template is recorded and the fixed pause
+      uses the learned latency of the template instead of 'pace_ms'; a trigger still waiting when
+      the pause ends is watched further (up to 'consume_timeout_ms'), so slow templates raise the pause
+
+    - Sken pouze validuje a zařadí úlohu, GUI je hned připraveno na další serial
+    - Výstupní soubor úlohy se zapíše až při jejím odeslání (předchozí etiketa už je zpracována)
+    - Další spouštěč se vytvoří, jakmile BarTender předchozí zpracuje (smaže)
+    - 'consume_timeout_ms' je pojistka pro případ, že spouštěč zpracován není
+    - Nezapsatelný trigger soubor ukončí celou úlohu jedinou chybou, zbylé spouštěče se nevytvoří
+    - Úloha je vytištěna (job_printed), jen když byly zpracovány všechny její spouštěče; spouštěč, kterému
+      vypršel limit nebo byl před zpracováním nahrazen, úlohu zahodí (job_dropped)
+    - Při watch_triggers=False se čeká pevně 'pace_ms' (v žádném režimu bez vnořené smyčky událostí)
+    - S unikátními názvy může najednou čekat až 'pipeline_depth' spouštěčů; každý trigger soubor
+      pak nese vlastní data etikety, takže se úlohy stejné šablony navzájem nepřepíší
+    - S PacingProfile se zaznamenává doba zpracování každé šablony a pevná prodleva
+      používá naučenou latenci šablony místo 'pace_ms'; spouštěč, který po prodlevě stále čeká,
+      se sleduje dál (až 'consume_timeout_ms'), takže pomalé šablony prodlevu prodlouží
+    """
+
+    depth_changed = pyqtSignal(int)  # jobs waiting + running / čekající + běžící úlohy
+    label_started = pyqtSignal(str)  # trigger value / název spouštěče
+    job_failed = pyqtSignal(str, str)  # message, error_code
+    job_dropped = pyqtSignal(object)  # PrintJob which will not be printed / úloha, která se nevytiskne
+    job_printed = pyqtSignal(object)  # PrintJob whose triggers were all consumed / úloha se všemi spouštěči zpracovanými
+    trigger_finished = pyqtSignal(str, str, bool, float)  # directory, value, consumed, elapsed_ms
+
+    def __init__(self, trigger_dir_provider, pace_ms: int = 3000, watch_triggers: bool = True,
+                 consume_timeout_ms: int = 15000, poll_ms: int = 250,
+                 unique_triggers: bool = False, pipeline_depth: int = 1, pacing=None, metrics=None, parent=None):
+        """
+        :param trigger_dir_provider: Callable returning trigger directory or None / Funkce vracející složku spouštěčů
+        :param pace_ms: Fixed pause after each trigger file (watch_triggers=False) / Pevná prodleva po trigger souboru
+        :param watch_triggers: Wait until trigger file is consumed / Čekat, než BarTender trigger soubor zpracuje
+        :param consume_timeout_ms: Max wait for consumption / Maximální čekání na zpracování
+        :param poll_ms: Backup polling when directory events are not delivered (network share) / Záložní kontrola
+        :param unique_triggers: Sequenced trigger names (see TriggerNamer) / Unikátní názvy spouštěčů
+        :param pipeline_depth: Max triggers waiting at once (only with unique names) / Max. současně čekajících spouštěčů
+        :param pacing: Shared PacingProfile or None / Sdílený PacingProfile nebo None
+        :param metrics: Shared ScanMetrics or None / Sdílené ScanMetrics nebo None
+        """
+        super().__init__(parent)
+        self.trigger_dir_provider = trigger_dir_provider
+        self.pace_ms = pace_ms
+        self.watch_triggers = watch_triggers
+        self.consume_timeout_ms = consume_timeout_ms
+        self.namer = TriggerNamer(unique_triggers)
+        self.pacing = pacing
+        self.metrics = metrics
+
+        # ❗ Same-name triggers cannot be pipelined (touch would merge them) / Stejně pojmenované spouštěče nelze řetězit
+        self.pipeline_depth = max(1, pipeline_depth) if unique_triggers else 1
+
+        self._jobs: deque[PrintJob] = deque()
+        self._current: PrintJob | None = None
+        self._pending_triggers: deque[str] = deque()
+        self._trigger_dir: Path | None = None
+        self._outstanding: list[_OutstandingTrigger] = []
+        self._late: list[_OutstandingTrigger] = []  # 💡 Fixed mode: pause over, not consumed yet / Prodleva uplynula, nezpracováno
+        self._unsettled: dict[int, int] = {}  # 💡 id(job) → triggers not consumed yet / spouštěče dosud nezpracované
+
+        # 👀 Consumption detection / Detekce zpracování spouštěčů
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._check_outstanding)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_ms)
+        self._poll_timer.timeout.connect(self._check_outstanding)
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+    @property
+    def pipelined(self) -> bool:
+        """
+        True when label data travel inside trigger files (several jobs in flight).
+        True, pokud data etiket putují v trigger souborech (více úloh současně).
+        """
+        return self.pipeline_depth > 1
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of jobs waiting or being printed.
+        Počet čekajících nebo právě tištěných úloh.
+        """
+        in_flight = {id(trigger.job) for trigger in self._outstanding}
+        if self._current:
+            in_flight.add(id(self._current))
+        return len(self._jobs) + len(in_flight)
+
+    def enqueue(self, job: PrintJob) -> None:
+        """
+        Adds job to the queue and starts dispatching if idle.
+        Přidá úlohu do fronty a spustí odesílání, pokud fronta stojí.
+        """
+        self._jobs.append(job)
+        self.depth_changed.emit(self.depth)
+        self._pump()
+
+    def _pump(self) -> None:
+        """
+        Fires as many triggers as the pipeline allows.
+        Vytvoří tolik spouštěčů, kolik pipeline dovolí.
+        """
+        while len(self._outstanding) < self.pipeline_depth:
+            if not self._pending_triggers:
+                # 🛑 Shared output file – wait until the previous job is consumed / Sdílený výstupní soubor – čekáme na dokončení
+                if self._outstanding and not self.pipelined:
+                    break
+
+                self._current = None
+                if not self._start_next_job():
+                    break
+                continue
+
+            self._fire_trigger(self._pending_triggers.popleft())
+
+        if self._outstanding or self._late:
+            self._poll_timer.start()
+        else:
+            self._poll_timer.stop()
+
+        self.depth_changed.emit(self.depth)
+
+    def _start_next_job(self) -> bool:
+        """
+        Takes the next job which can be printed.
+        Vezme další úlohu, kterou lze vytisknout.
+
+        :return: False if the queue is empty / False, pokud je fronta prázdná
+        """
+        while self._jobs:
+            job = self._jobs.popleft()
+            self._unsettled[id(job)] = len(job.trigger_values)
+            if self._prepare_job(job):
+                self._current = job
+                self._pending_triggers = deque(job.trigger_values)
+                return True
+        return False
+
+    def _prepare_job(self, job: PrintJob) -> bool:
+        """
+        Writes output data of the job (unless data travel in trigger files) and resolves trigger directory.
+        Zapíše výstupní data úlohy (pokud data nejdou v trigger souborech) a zjistí složku spouštěčů.
+
+        :return: True if the job can be printed / True, pokud lze úlohu tisknout
+        """
+        if not self.pipelined:
+            try:
+                # 💾 Write header and record to file / Zápis hlavičky a záznamu do souboru
+                started = time.perf_counter()
+                write_lines(job.output_path, job.lines)
+                job.write_ms = (time.perf_counter() - started) * 1000
+            except Exception as e:
+                self._fail(f'Chyba zápisu {job.output_path} ({job.serial}): {str(e)}', 'PRIQUE001', job)
+                return False
+
+        # 🗂️ Retrieve trigger directory / Získání složky pro spouštěče
+        self._trigger_dir = self.trigger_dir_provider()
+        if not self._trigger_dir:
+            self._fail(f'Složka trigger_path neexistuje nebo není zadána ({job.serial}).', 'PRIQUE002', job)
+            return False
+
+        if self.watch_triggers and str(self._trigger_dir) not in self._watcher.directories():
+            self._watcher.addPath(str(self._trigger_dir))
+
+        return True
+
+    def _fire_trigger(self, value: str) -> None:
+        """
+        Creates one trigger file of the current job.
+        Vytvoří jeden trigger soubor aktuální úlohy.
+        """
+        job = self._current
+        trigger_file = self._trigger_dir / self.namer.name(value)
+        try:
+            # 📦 Pipelined: label data inside the trigger / Pipeline: data etikety uvnitř spouštěče
+            started = time.perf_counter()
+            write_trigger(trigger_file, job.lines if self.pipelined else None)
+            trigger_ms = (time.perf_counter() - started) * 1000
+            self.label_started.emit(value)
+        except Exception as e:
+            # 🛑 Rest of the job is dropped – a partial label set is worse than none / Zbytek úlohy se zahodí – neúplná sada etiket je horší než žádná
+            self._pending_triggers.clear()
+            self._current = None
+            self._fail(f'Chyba trigger souboru {trigger_file.name}: {str(e)}', 'PRIQUE003', job)
+            return
+
+        # 💡 Same-name trigger replaced the late one – its consumption can no longer be told apart
+        # Stejnojmenný spouštěč nahradil opožděný – jeho zpracování už nelze rozlišit
+        for late in [late for late in self._late if late.path == trigger_file]:
+            self._learn_late(late, (time.monotonic() - late.fired_at) * 1000)
+            self._late.remove(late)
+            self._settle(late, False)
+
+        trigger = _OutstandingTrigger(trigger_file, value, job, self._wait_ms(value))
+        trigger.trigger_ms = trigger_ms
+        self._outstanding.append(trigger)
+
+    def _wait_ms(self, value: str) -> float:
+        """
+        Returns how long to wait for the trigger of the template.
+        Vrátí, jak dlouho čekat na spouštěč dané šablony.
+
+        - Watch mode: timeout stays 'consume_timeout_ms', consumption itself paces the queue
+        - Fixed mode: learned latency of the template, 'pace_ms' until enough samples exist
+
+        - Režim sledování: limit zůstává 'consume_timeout_ms', tempo určuje samotné zpracování
+        - Pevný režim: naučená latence šablony, dokud není dost vzorků, pak 'pace_ms'
+        """
+        if self.watch_triggers:
+            return self.consume_timeout_ms
+
+        learned_ms = self.pacing.learned_ms(value) if self.pacing else None
+        return learned_ms if learned_ms is not None else self.pace_ms
+
+    def _check_outstanding(self, *_args) -> None:
+        """
+        Called on directory change or poll tick – drops consumed (or timed out) triggers and continues.
+        Voláno při změně složky nebo kontrole – odebere zpracované (nebo prošlé) spouštěče a pokračuje.
+        """
+        if not self._outstanding and not self._late:
+            return
+
+        now = time.monotonic()
+        self._check_late(now)
+
+        still_waiting = []
+        for trigger in self._outstanding:
+            elapsed_ms = (now - trigger.fired_at) * 1000
+
+            if not trigger.consumed and not trigger.path.exists():
+                # 📈 Learn consume time of the template / Učení doby zpracování šablony
+                trigger.consumed = True
+                trigger.consumed_at = time.perf_counter()
+                if self.pacing:
+                    self.pacing.record(trigger.value, elapsed_ms)
+
+            if not self.watch_triggers:
+                # ⏲️ Fixed pace mode / Režim pevné prodlevy
+                if elapsed_ms < trigger.wait_ms:
+                    still_waiting.append(trigger)
+                else:
+                    self._record_label(trigger, elapsed_ms)
+                    if trigger.consumed:
+                        self.trigger_finished.emit(str(trigger.path.parent), trigger.value, True, elapsed_ms)
+                        self._settle(trigger, True)
+                    else:
+                        self._late.append(trigger)  # 📈 Keep watching for the real consume time / Sledujeme skutečnou dobu
+                continue
+
+            if trigger.consumed:
+                self.trigger_finished.emit(str(trigger.path.parent), trigger.value, True, elapsed_ms)
+                self._record_label(trigger, elapsed_ms)
+                self._settle(trigger, True)
+                continue
+
+            if elapsed_ms >= trigger.wait_ms:
+                # ⚠️ Safety net – continue anyway / Pojistka – pokračujeme i tak
+                self.normal_logger.log('Warning', f'Trigger {trigger.path.name} nebyl zpracován do {trigger.wait_ms:.0f} ms.', 'PRIQUE004')
+                self.trigger_finished.emit(str(trigger.path.parent), trigger.value, False, elapsed_ms)
+                self._record_label(trigger, elapsed_ms)
+                self._settle(trigger, False)
+                continue
+
+            still_waiting.append(trigger)
+
+        if len(still_waiting) != len(self._outstanding):
+            self._outstanding = still_waiting
+            self._pump()
+        elif not self._outstanding and not self._late:
+            self._poll_timer.stop()
+
+    def _check_late(self, now: float) -> None:
+        """
+        Fixed mode: learns real consume time of triggers which outlived their pause.
+        Pevný režim: naučí se skutečnou dobu zpracování spouštěčů, které přečkaly svou prodlevu.
+        """
+        still_late = []
+        for trigger in self._late:
+            elapsed_ms = (now - trigger.fired_at) * 1000
+            if not trigger.path.exists():
+                trigger.consumed = True
+                self._learn_late(trigger, elapsed_ms)
+                self.trigger_finished.emit(str(trigger.path.parent), trigger.value, True, elapsed_ms)
+                self._settle(trigger, True)
+            elif elapsed_ms >= self.consume_timeout_ms:
+                self.normal_logger.log('Warning', f'Trigger {trigger.path.name} nebyl zpracován do {self.consume_timeout_ms} ms.', 'PRIQUE005')
+                self._learn_late(trigger, elapsed_ms)
+                # 🔀 Dead Commander is routed around in fixed mode too / Nefunkční Commander se obchází i v pevném režimu
+                self.trigger_finished.emit(str(trigger.path.parent), trigger.value, False, elapsed_ms)
+                self._settle(trigger, False)
+            else:
+                still_late.append(trigger)
+        self._late = still_late
+
+    def _learn_late(self, trigger: _OutstandingTrigger, elapsed_ms: float) -> None:
+        """
+        Records consume time of a late trigger (lower bound if not consumed) – the learned pause grows.
+        Zaznamená dobu zpracování opožděného spouštěče (dolní mez, pokud nezpracován) – naučená prodleva roste.
+        """
+        if self.pacing:
+            self.pacing.record(trigger.value, elapsed_ms)
+
+    def _settle(self, trigger: _OutstandingTrigger, consumed: bool) -> None:
+        """
+        Counts the outcome of one trigger – the job is printed after its last consumed trigger, dropped on the first miss.
+        Započítá výsledek jednoho spouštěče – úloha je vytištěna po posledním zpracovaném, zahozena při prvním nezdaru.
+        """
+        job = trigger.job
+        remaining = self._unsettled.get(id(job))
+        if remaining is None:
+            return  # 💡 Job already dropped / Úloha už byla zahozena
+
+        if not consumed:
+            del self._unsettled[id(job)]
+            self.job_dropped.emit(job)
+        elif remaining <= 1:
+            del self._unsettled[id(job)]
+            self.job_printed.emit(job)
+        else:
+            self._unsettled[id(job)] = remaining - 1
+
+    def _record_label(self, trigger: _OutstandingTrigger, elapsed_ms: float) -> None:
+        """
+        Reports label timings to metrics (time to label only for consumed triggers).
+        Předá časy etikety do metrik (čas do etikety jen u zpracovaných spouštěčů).
+        """
+        if not self.metrics:
+            return
+
+        job = trigger.job
+        stages = {'trigger': trigger.trigger_ms, 'wait': elapsed_ms}
+        if job.write_ms is not None and trigger.value == job.trigger_values[0]:
+            stages['write_output'] = job.write_ms
+        if trigger.consumed_at is not None and job.scan_started is not None:
+            stages['time_to_label'] = (trigger.consumed_at - job.scan_started) * 1000
+        self.metrics.record_label(job.serial, job.group, trigger.value, stages)
+
+    def _fail(self, message: str, error_code: str, job: PrintJob) -> None:
+        """
+        Logs a dispatch error and reports it (and the dropped job) to the controller.
+        Zaloguje chybu odesílání a oznámí ji (i nevytištěnou úlohu) controlleru.
+        """
+        self.normal_logger.log('Error', message, error_code)
+        self.job_failed.emit(message, error_code)
+        if self._unsettled.pop(id(job), None) is not None:
+            self.job_dropped.emit(job)
+
+
+class PrintDispatcher(QObject):
+    """
+    Routes jobs of trigger groups to printer lanes, each lane being an independent PrintQueue.
+    Směruje úlohy skupin spouštěčů do tiskových linek, každá linka je samostatná PrintQueue.
+
+    - Groups mapped to the same lane keep scan order and print one after another
+    - Different lanes (printers / templates) run concurrently, so a mixed product+C4+My2N serial
+      takes as long as its slowest group, not the sum
+
+    - Skupiny na stejné lince drží pořadí skenů a tisknou se postupně
+    - Různé linky (tiskárny / šablony) běží souběžně, smíšený serial product+C4+My2N tak trvá
+      jen jako jeho nejpomalejší skupina, ne jako součet
+    """
+
+    depth_changed = pyqtSignal(int)
+    label_started = pyqtSignal(str)
+    job_failed = pyqtSignal(str, str)
+    job_dropped = pyqtSignal(object)
+    job_printed = pyqtSignal(object)
+
+    def __init__(self, queue_factory, lane_of: dict[str, str], parent=None):
+        """
+        :param queue_factory: Callable(lane_name) → PrintQueue / Funkce vytvářející frontu pro linku
+        :param lane_of: Trigger group → lane name (missing groups use 'default') / Skupina → název linky
+        """
+        super().__init__(parent)
+        self.queue_factory = queue_factory
+        self.lane_of = lane_of
+        self._lanes: dict[str, PrintQueue] = {}
+
+    @property
+    def depth(self) -> int:
+        """
+        Jobs waiting or printing in all lanes.
+        Úlohy čekající nebo tištěné ve všech linkách.
+        """
+        return sum(queue.depth for queue in self._lanes.values())
+
+    def lane(self, group: str) -> PrintQueue:
+        """
+        Returns (and creates on first use) the queue serving the group.
+        Vrátí (a při prvním použití vytvoří) frontu obsluhující skupinu.
+        """
+        name = self.lane_of.get(group, 'default')
+        queue = self._lanes.get(name)
+        if queue is None:
+            queue = self._lanes[name] = self.queue_factory(name)
+            queue.setParent(self)
+            queue.depth_changed.connect(self._on_lane_depth_changed)
+            queue.label_started.connect(self.label_started)
+            queue.job_failed.connect(self.job_failed)
+            queue.job_dropped.connect(self.job_dropped)
+            queue.job_printed.connect(self.job_printed)
+        return queue
+
+    def enqueue(self, job: PrintJob) -> None:
+        """
+        Adds job to the lane of its trigger group.
+        Přidá úlohu do linky její skupiny spouštěčů.
+        """
+        self.lane(job.group).enqueue(job)
+
+    def _on_lane_depth_changed(self, _depth: int) -> None:
+        self.depth_changed.emit(self.depth)
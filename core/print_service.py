@@ -0,0 +1,537 @@
+# 🧩 PrintService – Qt-free print pipeline (parse → validate → extract → write output → trigger)
+# Tisková pipeline bez Qt (načtení → validace → extrakce → zápis výstupu → spouštěč)
+
+import os
+import time
+import itertools
+from contextlib import contextmanager
+from pathlib import Path
+from core.config_loader import ConfigLoader
+from core.trigger_balancer import TriggerDirBalancer
+from core.pacing_profile import get_pacing_profile
+from utils.lbl_index import LblIndex, HeaderTemplate, FIELD_SEPARATOR
+from utils.order_cache import get_order_cache
+from utils.tail_reader import find_last_line
+
+# 🏷️ My2N output file layout / Rozložení výstupního souboru My2N
+MY2N_HEADER = '"L Vyrobni cislo dlouhe","L Bezpecnostni cislo","P Vyrobni cislo","P Bezpecnostni kod"'
+MY2N_TRIGGER = 'SF_MY2N_A'
+MY2N_TOKEN_PREFIX = 'my2n token:'
+
+
+class PrintServiceError(Exception):
+    """
+    Pipeline step failed (carries the service code shown to operator / written to log).
+    Krok pipeline selhal (nese servisní kód zobrazený operátorovi / zapsaný do logu).
+    """
+
+    def __init__(self, message: str, error_code: str, user_message: str | None = None):
+        """
+        :param message: Detailed message for the log / Podrobná zpráva do logu
+        :param error_code: Service code (see info/service_code.md) / Servisní kód
+        :param user_message: Shorter text for the operator (default = message) / Kratší text pro operátora
+        """
+        super().__init__(message)
+        self.message = message
+        self.error_code = error_code
+        self.user_message = user_message or message
+
+
+class PrintJob:
+    """
+    One validated label job (output data + trigger names).
+    Jedna zvalidovaná tisková úloha (výstupní data + názvy spouštěčů).
+    """
+
+    def __init__(self, group: str, serial: str, output_path: Path, lines: list[str], trigger_values: list[str]):
+        """
+        :param group: Trigger group (product, control4, my2n) / Skupina spouštěčů
+        :param serial: Scanned serial number / Naskenovaný serial number
+        :param output_path: Data file read by BarTender / Datový soubor pro BarTender
+        :param lines: Lines written to output file (header, record) / Řádky výstupního souboru
+        :param trigger_values: Trigger file names / Názvy trigger souborů
+        """
+        self.group = group
+        self.serial = serial
+        self.output_path = output_path
+        self.lines = lines
+        self.trigger_values = trigger_values
+        self.token: str | None = None  # 🔐 My2N token of a my2n job (kept for the journal) / My2N token úlohy my2n (pro deník)
+
+        # 📊 Metrics (set by controller / print queue) / Metriky (nastavuje controller / tisková fronta)
+        self.scan_started: float | None = None  # perf_counter() of the scan / začátek skenu
+        self.write_ms: float | None = None
+
+
+class TriggerNamer:
+    """
+    Builds trigger file names, optionally unique per job.
+    Sestavuje názvy trigger souborů, volitelně unikátní pro každou úlohu.
+
+    - Plain mode: trigger name = value from .lbl (e.g. 'SF_MY2N_A') / Prostý režim: název = hodnota z .lbl
+    - Unique mode: '<value>.<session><seq>' (e.g. 'SF_MY2N_A.2510171435021234500017'),
+      BarTender Commander detects it with pattern '<value>.*' (see info/bartender_triggers.md)
+    - Session = start date + time + process id, sequence is shared by all namers of the process
+      (lanes sharing a trigger folder never produce the same name)
+    - Relace = datum + čas startu + id procesu, pořadí je sdílené všemi instancemi v procesu
+      (linky se společnou složkou spouštěčů nikdy nevytvoří stejný název)
+    """
+
+    # 📌 Process-wide session stamp and sequence / Značka relace a pořadí společné pro celý proces
+    _session = f'{time.strftime("%y%m%d%H%M%S")}{os.getpid() % 100000:05d}'
+    _sequence = itertools.count(1)
+
+    def __init__(self, unique: bool = False):
+        """
+        :param unique: Append session stamp and sequence number / Přidat značku relace a pořadové číslo
+        """
+        self.unique = unique
+
+    def name(self, value: str) -> str:
+        """
+        Returns trigger file name for the value.
+        Vrátí název trigger souboru pro danou hodnotu.
+        """
+        if not self.unique:
+            return value
+        return f'{value}.{self._session}{next(self._sequence):05d}'
+
+
+# === 📄 Extraction steps (shared by GUI Validator and headless service) / Kroky extrakce (sdílené GUI a službou)
+
+def require_rows(lbl_index: LblIndex, serial: str, fields: str, error_code: str) -> None:
+    """
+    Checks that all rows (e.g. 'BDE') exist for the serial number.
+    Ověří, že pro serial number existují všechny řádky (např. 'BDE').
+    """
+    missing_keys = lbl_index.missing(serial, fields)
+    if missing_keys:
+        raise PrintServiceError(f'Nebyly nalezeny všechny klíčové řádky: {", ".join(missing_keys)}', error_code,
+                                'Některé klíčové řádky v souboru .lbl chybí!')
+
+
+def header_and_record(lbl_index: LblIndex, serial: str) -> tuple[HeaderTemplate, tuple[str, ...]]:
+    """
+    Returns D= header (tokenized) and E= record (pre-split).
+    Vrátí hlavičku D= (jako šablonu) a záznam E= (rozdělený).
+    """
+    header = lbl_index.get_template(serial, 'D')
+    record = lbl_index.get_fields(serial, 'E')
+    if not header or not record:
+        raise PrintServiceError(f'Nebyly nalezeny hlavička nebo záznam pro "{serial}".', 'VALIDATOR004')
+    return header, record
+
+
+def inject_prefix(template: HeaderTemplate, record_fields: tuple[str, ...], prefix: str | None) -> str:
+    """
+    Injects operator prefix into 'P Znacka balice' field of the record.
+    Vloží prefix operátora do pole 'P Znacka balice' záznamu.
+    """
+    index = template.column('P Znacka balice')
+    if index is None:
+        raise PrintServiceError('Pole "P Znacka balice" chybí.', 'VALIDATOR003', 'Pole v header nebylo nalezeno.')
+
+    if index >= len(record_fields):
+        raise PrintServiceError('Neplatný index pole "P Znacka balice"', 'VALIDATOR002', 'Neplatný index pole v record.')
+
+    if prefix is None:
+        raise PrintServiceError('Není k dispozici prefix přihlášeného operátora.', 'PRISER001')
+
+    # 💉 Single field replacement plus join / Jediná záměna pole a spojení
+    return FIELD_SEPARATOR.join(record_fields[:index] + (prefix,) + record_fields[index + 1:])
+
+
+def trigger_values(lbl_index: LblIndex, serial: str, field: str, error_code: str) -> list[str]:
+    """
+    Returns trigger names from B= (product) or I= (Control4) row.
+    Vrátí názvy spouštěčů z řádku B= (produkt) nebo I= (Control4).
+    """
+    raw_value = lbl_index.get(serial, field)
+    if raw_value is None:
+        raise PrintServiceError(f'Řádek "{serial}{field}=" nebyl nalezen.', error_code)
+
+    values = [val.strip() for val in raw_value.split(';') if val.strip()]
+    if not values:
+        raise PrintServiceError(f'Řádek "{serial}{field}=" neobsahuje žádný spouštěč.', error_code)
+    return values
+
+
+def header_and_record_c4(lbl_index: LblIndex, serial: str) -> tuple[str, str]:
+    """
+    Returns J= header and K= record for Control4.
+    Vrátí hlavičku J= a záznam K= pro Control4.
+    """
+    header = lbl_index.get(serial, 'J')
+    record = lbl_index.get(serial, 'K')
+    if not header or not record:
+        raise PrintServiceError(f'Nebyly nalezeny J/K řádky pro serial "{serial}".', 'VALIDATOR006')
+    return header, record
+
+
+def my2n_report_path(serial: str, reports_path: Path) -> Path:
+    """
+    Resolves report file of the serial: reports_path/20YY/MMMM/<MMMMNNNN>.<YY>.
+    Sestaví cestu k reportu serialu: reports_path/20YY/MMMM/<MMMMNNNN>.<YY>.
+    """
+    parts = serial.split('-')
+    if len(parts) != 3:
+        raise PrintServiceError('Neplatný formát serial number.', 'VALIDATOR009')
+    return reports_path / f'20{parts[0]}' / parts[1] / f'{parts[1]}{parts[2]}.{parts[0]}'
+
+
+def find_my2n_token(serial: str, reports_path: Path) -> str:
+    """
+    Returns the last My2N token from the report file of the serial.
+    Vrátí poslední My2N token ze souboru reportu serialu.
+    """
+    source_file = my2n_report_path(serial, reports_path)
+    if not source_file.exists():
+        raise PrintServiceError(f'Report soubor {source_file} neexistuje.', 'VALIDATOR010')
+
+    try:
+        # 🔙 Token is near the end of the report – read backwards block by block / Token je u konce reportu – čteme odzadu
+        token_line = find_last_line(source_file, MY2N_TOKEN_PREFIX)
+    except Exception as e:
+        raise PrintServiceError(f'Chyba čtení nebo extrakce: {str(e)}', 'VALIDATOR014', str(e))
+
+    if not token_line:
+        raise PrintServiceError('V souboru nebyl nalezen žádný My2N token.', 'VALIDATOR011')
+
+    return parse_my2n_token_line(token_line)
+
+
+def parse_my2n_token_line(token_line: str) -> str:
+    """
+    Extracts token from a 'My2N token: ...' line (case-insensitive search, case-sensitive value).
+    Extrahuje token z řádku 'My2N token: ...' (hledání bez ohledu na velikost, hodnota beze změny).
+    """
+    prefix_index = token_line.lower().find(MY2N_TOKEN_PREFIX)
+    if prefix_index == -1:
+        raise PrintServiceError('Chyba při zpracování řádku s tokenem.', 'VALIDATOR012')
+
+    # ✂️ Extract the token from the original line / Extrahuj token z původního řádku
+    token_value = token_line[prefix_index + len(MY2N_TOKEN_PREFIX):].strip()
+    if not token_value:
+        raise PrintServiceError('My2N token je prázdný.', 'VALIDATOR013', 'My2N token byl nalezen, ale neobsahuje žádnou hodnotu.')
+    return token_value
+
+
+def my2n_lines(serial: str, token: str) -> list[str]:
+    """
+    Returns My2N output file lines (header + record).
+    Vrátí řádky výstupního souboru My2N (hlavička + záznam).
+    """
+    return [MY2N_HEADER, f'"Serial number:","My2N Security Code:","{serial}","{token}"']
+
+
+# === 🗂️ Trigger directories (shared by GUI print queues and headless service) / Složky spouštěčů (sdílené GUI a službou)
+
+def trigger_dirs(config: ConfigLoader, lane: str | None = None) -> list[Path]:
+    """
+    Returns pool of trigger directories of the lane ([LaneTriggerPaths], else [Paths] trigger_path).
+    Vrátí seznam složek spouštěčů linky ([LaneTriggerPaths], jinak [Paths] trigger_path).
+    """
+    paths = config.get_paths(lane, section='LaneTriggerPaths') if lane else []
+    return paths or config.get_paths('trigger_path', section='Paths')
+
+
+def lane_balancer(config: ConfigLoader, lane: str | None = None) -> TriggerDirBalancer:
+    """
+    Creates TriggerDirBalancer of the lane using [Printing] balancing and failover_cooldown_ms.
+    Vytvoří TriggerDirBalancer linky podle [Printing] balancing a failover_cooldown_ms.
+    """
+    return TriggerDirBalancer(
+        trigger_dirs(config, lane),
+        strategy=config.get_value('Printing', 'balancing', fallback='round_robin').strip().lower(),
+        cooldown_ms=int(config.get_value('Printing', 'failover_cooldown_ms', fallback='60000')),
+    )
+
+
+# === 💾 Output and trigger files / Výstupní a trigger soubory
+
+def write_lines(path: Path, lines: list[str]) -> None:
+    """
+    Writes label data (header, record) to a file.
+    Zapíše data etikety (hlavička, záznam) do souboru.
+    """
+    with path.open('w') as file:
+        for line in lines:
+            file.write(line + '\n')
+
+
+def write_trigger(trigger_file: Path, lines: list[str] | None = None) -> None:
+    """
+    Creates trigger file; with lines the label data are renamed into place so BarTender never sees a partial file.
+    Vytvoří trigger soubor; s daty se soubor přejmenuje na místo, takže BarTender nikdy neuvidí neúplný soubor.
+    """
+    if lines is None:
+        trigger_file.touch(exist_ok=True)
+        return
+
+    temp_file = trigger_file.with_name(f'~{trigger_file.name}.tmp')
+    write_lines(temp_file, lines)
+    os.replace(temp_file, trigger_file)
+
+
+@contextmanager
+def _stage(timings: dict | None, name: str):
+    """
+    Adds duration of the block (ms) to timings[name].
+    Přičte dobu běhu bloku (ms) k timings[name].
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+
+class PrintService:
+    """
+    Whole print flow of one work order without GUI (render used by PrintController, render + dispatch by cli.py).
+    Celý tiskový tok jednoho výrobního příkazu bez GUI (render používá PrintController, render + dispatch cli.py).
+
+    - Every step raises PrintServiceError, GUI shows it through Validator.report
+    - Dispatch is synchronous: output file → trigger → wait for consumption (or fixed pace)
+    - Trigger folder is picked by the lane's TriggerDirBalancer, fixed pace is learned by PacingProfile (as in PrintQueue)
+
+    - Každý krok vyvolá PrintServiceError, GUI ho zobrazí přes Validator.report
+    - Odeslání je synchronní: výstupní soubor → spouštěč → čekání na zpracování (nebo pevná prodleva)
+    - Složku spouštěčů vybírá TriggerDirBalancer linky, pevnou prodlevu učí PacingProfile (stejně jako v PrintQueue)
+    """
+
+    def __init__(self, order_code: str, product_name: str | None = None, prefix: str | None = None,
+                 config: ConfigLoader | None = None, token_index=None):
+        """
+        :param order_code: Work order / Výrobní příkaz
+        :param product_name: Product name (read from .nor when omitted) / Název produktu (jinak z .nor)
+        :param prefix: Operator prefix injected into product labels / Prefix operátora pro etikety produktu
+        :param config: Loaded configuration / Načtená konfigurace
+        :param token_index: My2nTokenIndex asked before the report is read (optional) / Index tokenů dotázaný před čtením reportu
+        """
+        self.config = config or ConfigLoader()
+        self.order_code = order_code.strip().upper()
+        self.prefix = prefix
+        self.token_index = token_index
+
+        self.orders_path = self.config.get_path('orders_path', section='Paths')
+        if not self.orders_path:
+            raise PrintServiceError('Konfigurační cesta orders_path nebyla nalezena!', 'PRISER002')
+
+        self.product_name = (product_name or self.read_product_name()).strip().upper()
+
+        self.pace_ms = int(self.config.get_value('Printing', 'trigger_pace_ms', fallback='3000'))
+        self.watch_triggers = self.config.get_value('Printing', 'watch_triggers', fallback='true').strip().lower() == 'true'
+        self.consume_timeout_ms = int(self.config.get_value('Printing', 'trigger_timeout_ms', fallback='15000'))
+        self.namer = TriggerNamer(self.config.get_value('Printing', 'unique_triggers', fallback='false').strip().lower() == 'true')
+        self.pipelined = self.namer.unique and int(self.config.get_value('Printing', 'pipeline_depth', fallback='1')) > 1
+
+        self.lane_of = {group: lanes[0] for group, lanes in self.config.get_all_triggers('PrinterLanes').items() if lanes}
+        self.balancers: dict[str | None, TriggerDirBalancer] = {}
+        self.pacing = get_pacing_profile()
+
+    def read_product_name(self) -> str:
+        """
+        Reads and checks product name from the .nor file of the order.
+        Načte a ověří název produktu ze souboru .nor příkazu.
+        """
+        nor_file = self.orders_path / f'{self.order_code}.nor'
+        try:
+            with nor_file.open('r') as file:
+                parts = file.readline().strip().split(';')
+        except Exception as e:
+            raise PrintServiceError(f'Soubor {nor_file} nelze načíst: {str(e)}', 'PRISER003')
+
+        if len(parts) < 2 or parts[0].lstrip('$').upper() != self.order_code:
+            raise PrintServiceError(f'Soubor {nor_file} nemá očekávaný formát nebo neodpovídá příkazu {self.order_code}.', 'PRISER003')
+        return parts[1]
+
+    def trigger_groups(self) -> list[str]:
+        """
+        Returns trigger groups (product, control4, my2n) mapped to the product.
+        Vrátí skupiny spouštěčů (product, control4, my2n) namapované na produkt.
+        """
+        return [group for group, products in self.config.get_all_triggers('ProductTriggerMapping').items()
+                if self.product_name in products]
+
+    def load_index(self) -> LblIndex:
+        """
+        Returns .lbl index of the order from the shared cache.
+        Vrátí index .lbl příkazu ze sdílené cache.
+        """
+        lbl_file = self.orders_path / f'{self.order_code}.lbl'
+        if not lbl_file.exists():
+            raise PrintServiceError(f'Soubor {lbl_file} neexistuje.', 'PRISER004')
+        try:
+            return get_order_cache().get(lbl_file)
+        except Exception as e:
+            raise PrintServiceError(f'Chyba načtení souboru {str(e)}', 'PRISER004')
+
+    def trigger_dir(self, group: str) -> Path | None:
+        """
+        Returns first reachable trigger directory of the group's lane.
+        Vrátí první dostupnou složku spouštěčů linky dané skupiny.
+        """
+        return next((path for path in trigger_dirs(self.config, self.lane_of.get(group)) if path.exists()), None)
+
+    def require_trigger_dirs(self, jobs: list[PrintJob]) -> None:
+        """
+        Checks that every job's lane has a reachable trigger directory (before anything is enqueued).
+        Ověří, že linka každé úlohy má dostupnou složku spouštěčů (dřív, než se cokoli zařadí).
+        """
+        for job in jobs:
+            if not self.trigger_dir(job.group):
+                raise PrintServiceError(f'Složka trigger_path neexistuje nebo není zadána ({job.serial}).', 'PRISER007')
+
+    def balancer(self, group: str) -> TriggerDirBalancer:
+        """
+        Returns TriggerDirBalancer of the group's lane (created on first use).
+        Vrátí TriggerDirBalancer linky dané skupiny (vytvoří se při prvním použití).
+        """
+        lane = self.lane_of.get(group)
+        if lane not in self.balancers:
+            self.balancers[lane] = lane_balancer(self.config, lane)
+        return self.balancers[lane]
+
+    def render(self, serial: str, lbl_index: LblIndex, groups: list[str], timings: dict | None = None) -> list[PrintJob]:
+        """
+        Validates the serial and builds print jobs for all groups (nothing is written).
+        Zvaliduje serial a sestaví tiskové úlohy pro všechny skupiny (nic se nezapisuje).
+        """
+        jobs = []
+
+        if 'product' in groups:
+            with _stage(timings, 'extract_product'):
+                output_path = self.config.get_path('output_file_path_product', section='ProductPaths')
+                if not output_path:
+                    raise PrintServiceError('Cesta k výstupnímu souboru product nebyla nalezena.', 'PRISER005')
+                require_rows(lbl_index, serial, 'BDE', 'VALIDATOR001')
+                header, record_fields = header_and_record(lbl_index, serial)
+                record = inject_prefix(header, record_fields, self.prefix)
+                values = trigger_values(lbl_index, serial, 'B', 'VALIDATOR005')
+                jobs.append(PrintJob('product', serial, output_path, [header.text, record], values))
+
+        if 'control4' in groups:
+            with _stage(timings, 'extract_control4'):
+                output_path = self.config.get_path('output_file_path_c4_product', section='Control4Paths')
+                if not output_path:
+                    raise PrintServiceError('Cesta k výstupnímu souboru product nebyla nalezena.', 'PRISER005')
+                require_rows(lbl_index, serial, 'IJK', 'VALIDATOR008')
+                header, record = header_and_record_c4(lbl_index, serial)
+                values = trigger_values(lbl_index, serial, 'I', 'VALIDATOR007')
+                jobs.append(PrintJob('control4', serial, output_path, [header, record], values))
+
+        if 'my2n' in groups:
+            with _stage(timings, 'my2n_lookup'):
+                reports_path = self.config.get_path('reports_path', section='Paths')
+                output_path = self.config.get_path('output_file_path_my2n', section='My2nPaths')
+                if not reports_path or not output_path:
+                    raise PrintServiceError('Cesty k reportu nebo výstupu nejsou definovány.', 'PRISER006', 'Chybí konfigurace cest pro My2N.')
+                token = (self.token_index.lookup(serial) if self.token_index else None) or find_my2n_token(serial, reports_path)
+                job = PrintJob('my2n', serial, output_path, my2n_lines(serial, token), [MY2N_TRIGGER])
+                job.token = token
+                jobs.append(job)
+
+        return jobs
+
+    def dispatch(self, job: PrintJob, timings: dict | None = None) -> None:
+        """
+        Writes output file and fires triggers of the job, waiting for each to be consumed.
+        Zapíše výstupní soubor a vytvoří spouštěče úlohy, na každý počká do zpracování.
+        """
+        balancer = self.balancer(job.group)
+        trigger_dir = balancer.pick()
+        if not trigger_dir:
+            raise PrintServiceError(f'Složka trigger_path neexistuje nebo není zadána ({job.serial}).', 'PRISER007')
+
+        if not self.pipelined:
+            with _stage(timings, 'write_output'):
+                try:
+                    write_lines(job.output_path, job.lines)
+                except Exception as e:
+                    raise PrintServiceError(f'Chyba zápisu {job.output_path} ({job.serial}): {str(e)}', 'PRISER008')
+
+        for value in job.trigger_values:
+            trigger_file = trigger_dir / self.namer.name(value)
+            with _stage(timings, 'trigger'):
+                try:
+                    write_trigger(trigger_file, job.lines if self.pipelined else None)
+                except Exception as e:
+                    raise PrintServiceError(f'Chyba trigger souboru {trigger_file.name}: {str(e)}', 'PRISER009')
+
+            with _stage(timings, 'wait'):
+                self._wait_for(trigger_file, value, balancer)
+
+    def _wait_for(self, trigger_file: Path, value: str, balancer: TriggerDirBalancer, poll_s: float = 0.05) -> None:
+        """
+        Waits until BarTender consumes the trigger (or the fixed pace elapses) and feeds balancer and pacing profile.
+        Čeká, než BarTender spouštěč zpracuje (nebo uplyne pevná prodleva), a předá výsledek balanceru a profilu tempa.
+        """
+        learned_ms = self.pacing.learned_ms(value) if self.pacing else None
+        wait_ms = self.consume_timeout_ms if self.watch_triggers else (learned_ms if learned_ms is not None else self.pace_ms)
+        directory = str(trigger_file.parent)
+
+        started = time.monotonic()
+        elapsed_ms = 0.0
+        consumed = False
+        while elapsed_ms < wait_ms:
+            if not consumed and not trigger_file.exists():
+                consumed = True
+                if self.pacing:
+                    self.pacing.record(value, elapsed_ms)
+                balancer.report(directory, value, True, elapsed_ms)
+                if self.watch_triggers:
+                    return
+            time.sleep(min(poll_s, (wait_ms - elapsed_ms) / 1000))
+            elapsed_ms = (time.monotonic() - started) * 1000
+
+        # 💡 Fixed pace is over – a trigger still waiting is left to BarTender / Pevná prodleva uplynula – čekající spouštěč zůstává BarTenderu
+        if self.watch_triggers and not consumed:
+            balancer.report(directory, value, False, elapsed_ms)
+            raise PrintServiceError(f'Trigger {trigger_file.name} nebyl zpracován do {self.consume_timeout_ms} ms.', 'PRISER010')
+
+    def process(self, serials: list[str], dispatch: bool = True) -> dict:
+        """
+        Runs the whole flow for a list of serials.
+        Provede celý tok pro seznam serial numbers.
+
+        :param serials: Serial numbers in print order / Serial numbers v pořadí tisku
+        :param dispatch: False = only validate and extract (dry run) / False = jen validace a extrakce
+        :return: Order info and one result per serial (ok, jobs, timings_ms, error) / Info o příkazu a výsledek pro každý serial
+        """
+        timings = {}
+        with _stage(timings, 'load_index'):
+            lbl_index = self.load_index()
+        groups = self.trigger_groups()
+
+        results = []
+        for serial in serials:
+            serial_timings = {}
+            result = {'serial': serial, 'ok': True, 'jobs': [], 'timings_ms': serial_timings}
+            started = time.perf_counter()
+            try:
+                for job in self.render(serial, lbl_index, groups, serial_timings):
+                    if dispatch:
+                        self.dispatch(job, serial_timings)
+                    result['jobs'].append({'group': job.group, 'output': str(job.output_path), 'triggers': job.trigger_values})
+            except PrintServiceError as e:
+                result.update(ok=False, error={'code': e.error_code, 'message': e.message})
+
+            serial_timings['total'] = (time.perf_counter() - started) * 1000
+            result['timings_ms'] = {stage: round(ms, 3) for stage, ms in serial_timings.items()}
+            results.append(result)
+
+        # ⏱️ Persist learned pacing / Uložení naučeného tempa tisku
+        if dispatch and self.pacing:
+            self.pacing.save()
+
+        return {
+            'order': self.order_code,
+            'product': self.product_name,
+            'groups': groups,
+            'dispatched': dispatch,
+            'load_index_ms': round(timings['load_index'], 3),
+            'ok': all(result['ok'] for result in results),
+            'serials': results,
+        }
@@ -0,0 +1,93 @@
+# 🔁 PrintedSerials – persistent set of already printed serials of a work order
+# Trvalá množina již vytištěných serial numbers výrobního příkazu
+
+import os
+from pathlib import Path
+from core.logger import Logger
+
+# 📌 Serial 00-0000-0000 as a 10-digit number fits into 5 bytes / Serial jako 10místné číslo se vejde do 5 bajtů
+RECORD_SIZE = 5
+
+
+def serial_key(serial: str) -> int | None:
+    """
+    Converts serial 00-0000-0000 to its numeric key (None for other formats).
+    Převede serial 00-0000-0000 na číselný klíč (None pro jiné formáty).
+    """
+    digits = serial.replace('-', '')
+    return int(digits) if len(digits) == 10 and digits.isdigit() else None
+
+
+class PrintedSerials:
+    """
+    Set of printed serials of one order, backed by an append-only file of 5-byte records.
+    Množina vytištěných serialů jednoho příkazu uložená v souboru s 5bajtovými záznamy (jen připisování).
+
+    - Loaded once with the order, lookups are O(1) set membership / Načte se jednou s příkazem, dotaz je O(1)
+    - Each print appends one record with a single write, a torn record after power loss is ignored
+    - Každý tisk připíše jeden záznam jediným zápisem, neúplný záznam po výpadku se ignoruje
+    """
+
+    def __init__(self, directory: Path, order_code: str):
+        """
+        :param directory: Folder with printed-serial files / Složka se soubory vytištěných serialů
+        :param order_code: Work order / Výrobní příkaz
+        """
+        self.path = directory / f'{order_code}.bin'
+        self._keys: set[int] = set()
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+        self._load()
+
+    def __contains__(self, serial: str) -> bool:
+        return serial_key(serial) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, serial: str) -> None:
+        """
+        Marks the serial as printed (persisted immediately).
+        Označí serial jako vytištěný (ihned uloženo).
+        """
+        key = serial_key(serial)
+        if key is None or key in self._keys:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                os.write(fd, key.to_bytes(RECORD_SIZE, 'big'))
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Vytištěný serial {serial} nelze uložit: {str(e)}', 'PRTSER001')
+
+        self._keys.add(key)
+
+    def _load(self) -> None:
+        """
+        Reads all records of the order.
+        Načte všechny záznamy příkazu.
+        """
+        if not self.path.exists():
+            return
+
+        try:
+            data = self.path.read_bytes()
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Vytištěné serialy nelze načíst: {str(e)}', 'PRTSER002')
+            return
+
+        usable = len(data) - len(data) % RECORD_SIZE
+        if usable != len(data):
+            # ✂️ Drop torn record so next appends stay aligned / Odstranění neúplného záznamu kvůli zarovnání
+            try:
+                os.truncate(self.path, usable)
+            except Exception as e:
+                self.normal_logger.log('Warning', f'Neúplný záznam nelze odstranit: {str(e)}', 'PRTSER003')
+
+        self._keys = {int.from_bytes(data[i:i + RECORD_SIZE], 'big') for i in range(0, usable, RECORD_SIZE)}
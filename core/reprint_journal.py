@@ -0,0 +1,163 @@
+# 📒 ReprintJournal – local journal of rendered label payloads for instant reprints
+# Lokální deník vykreslených dat etiket pro okamžitý dotisk
+
+import os
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from core.logger import Logger
+from core.print_service import PrintJob
+
+
+class ReprintJournal:
+    """
+    Append-only journal of one work order, keyed by serial number (JSON lines, one file per order).
+    Deník jednoho výrobního příkazu s klíčem serial number (JSON řádky, jeden soubor na příkaz).
+
+    - Entry = rendered jobs (output file, header + record, triggers), My2N token, operator prefix
+      and signature of the .lbl it was rendered from
+    - Newer entry of the same serial replaces the older one; file is compacted when it grows
+      to twice 'max_entries'
+    - Only the 'max_orders' most recently used orders are kept on disk
+
+    - Záznam = vykreslené úlohy (výstupní soubor, hlavička + záznam, spouštěče), My2N token, prefix
+      operátora a podpis .lbl, ze kterého vznikl
+    - Novější záznam stejného serialu nahradí starší; soubor se zhutní, když naroste na dvojnásobek 'max_entries'
+    - Na disku zůstává jen 'max_orders' naposledy použitých příkazů
+    """
+
+    def __init__(self, directory: Path, order_code: str, max_entries: int = 2000, max_orders: int = 20):
+        """
+        :param directory: Journal folder / Složka deníku
+        :param order_code: Work order / Výrobní příkaz
+        :param max_entries: Serials kept per order / Počet serialů uložených pro příkaz
+        :param max_orders: Orders kept on disk / Počet příkazů uložených na disku
+        """
+        self.directory = directory
+        self.order_code = order_code
+        self.max_entries = max_entries
+        self.max_orders = max_orders
+        self.path = directory / f'{order_code}.jsonl'
+
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lines = 0
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, serial: str) -> dict | None:
+        """
+        Returns journal entry of the serial or None.
+        Vrátí záznam deníku pro serial nebo None.
+        """
+        return self._entries.get(serial)
+
+    def last(self, count: int) -> list[dict]:
+        """
+        Returns the last 'count' printed serials in print order.
+        Vrátí posledních 'count' vytištěných serialů v pořadí tisku.
+        """
+        if count <= 0:
+            return []
+        return list(self._entries.values())[-count:]
+
+    def record(self, serial: str, jobs: list[PrintJob], prefix: str | None = None, token: str | None = None,
+               source: tuple[int, int] | None = None) -> None:
+        """
+        Stores rendered jobs of the serial (appends one line, compacts when needed).
+        Uloží vykreslené úlohy serialu (přidá jeden řádek, případně soubor zhutní).
+
+        :param source: (mtime_ns, size) of the .lbl the jobs were rendered from / Podpis .lbl souboru
+        """
+        entry = {
+            'serial': serial,
+            'printed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'prefix': prefix,
+            'token': token,
+            'source': list(source) if source else None,
+            'jobs': [
+                {'group': job.group, 'output': str(job.output_path), 'lines': job.lines, 'triggers': job.trigger_values}
+                for job in jobs
+            ],
+        }
+
+        self._entries.pop(serial, None)
+        self._entries[serial] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self._lines >= 2 * self.max_entries:
+                self._compact()
+            else:
+                with self.path.open('a', encoding='utf-8') as file:
+                    file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                self._lines += 1
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Deník dotisku nelze uložit: {str(e)}', 'REPJOU001')
+
+    @staticmethod
+    def jobs(entry: dict) -> list[PrintJob]:
+        """
+        Rebuilds print jobs from a journal entry.
+        Sestaví tiskové úlohy ze záznamu deníku.
+        """
+        return [PrintJob(job['group'], entry['serial'], Path(job['output']), job['lines'], job['triggers']) for job in entry['jobs']]
+
+    def _load(self) -> None:
+        """
+        Loads journal of the order and prunes journals of old orders.
+        Načte deník příkazu a odstraní deníky starých příkazů.
+        """
+        if self.path.exists():
+            try:
+                with self.path.open('r', encoding='utf-8') as file:
+                    for line in file:
+                        self._lines += 1
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # 💡 Torn last line after power loss / Neúplný poslední řádek po výpadku
+                        self._entries.pop(entry['serial'], None)
+                        self._entries[entry['serial']] = entry
+            except Exception as e:
+                self.normal_logger.log('Warning', f'Deník dotisku nelze načíst: {str(e)}', 'REPJOU002')
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            self.path.touch()  # 💡 Marks the order as recently used / Označí příkaz jako naposledy použitý
+
+        self._prune_orders()
+
+    def _compact(self) -> None:
+        """
+        Rewrites the journal with current entries only (atomically).
+        Přepíše deník jen aktuálními záznamy (atomicky).
+        """
+        temp_path = self.path.with_suffix('.tmp')
+        with temp_path.open('w', encoding='utf-8') as file:
+            for entry in self._entries.values():
+                file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.path)
+        self._lines = len(self._entries)
+
+    def _prune_orders(self) -> None:
+        """
+        Deletes journals of the least recently used orders above 'max_orders'.
+        Smaže deníky nejdéle nepoužitých příkazů nad limit 'max_orders'.
+        """
+        try:
+            journals = sorted(self.directory.glob('*.jsonl'), key=lambda path: path.stat().st_mtime, reverse=True)
+            for old in journals[self.max_orders:]:
+                if old != self.path:
+                    old.unlink()
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Staré deníky dotisku nelze odstranit: {str(e)}', 'REPJOU003')
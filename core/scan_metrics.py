@@ -0,0 +1,279 @@
+# 📊 ScanMetrics – per-scan stage timings, rolling histograms and metrics export
+# Časy jednotlivých kroků skenu, klouzavé histogramy a export metrik
+
+import csv
+import os
+import time
+import socket
+import threading
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from core.config_loader import ConfigLoader
+from core.logger import Logger
+
+# 📌 Histogram bucket bounds in ms (+Inf is implicit) / Hranice košů histogramu v ms
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# 📌 Stages of a scan in CSV column order / Kroky skenu v pořadí sloupců CSV
+SCAN_STAGES = ('config', 'journal', 'load_lbl', 'validate', 'my2n_lookup', 'enqueue')
+
+# 📌 Stages of a label measured by the print queue / Kroky etikety měřené tiskovou frontou
+LABEL_STAGES = ('write_output', 'trigger', 'wait', 'time_to_label')
+
+# 📦 Shared instance / Sdílená instance
+_scan_metrics = None
+_scan_metrics_lock = threading.Lock()
+
+
+def get_scan_metrics():
+    """
+    Returns the application-wide metrics collector or None when [Metrics] enabled = false.
+    Vrací sdílený sběrač metrik nebo None, pokud je [Metrics] enabled = false.
+
+    - [Metrics] station (default host name), flush_interval_s (10), window (500)
+    - Files: <[Paths] local_data_path>/metrics/printline.prom, scans.csv, labels.csv
+    """
+    global _scan_metrics
+    with _scan_metrics_lock:
+        if _scan_metrics is None:
+            config = ConfigLoader()
+            if config.get_value('Metrics', 'enabled', fallback='true').strip().lower() != 'true':
+                return None
+
+            _scan_metrics = ScanMetrics(
+                config.get_path('local_data_path', fallback='data') / 'metrics',
+                station=config.get_value('Metrics', 'station', fallback=socket.gethostname()),
+                flush_interval_s=float(config.get_value('Metrics', 'flush_interval_s', fallback='10')),
+                window=int(config.get_value('Metrics', 'window', fallback='500')),
+            )
+        return _scan_metrics
+
+
+class Histogram:
+    """
+    Cumulative histogram (Prometheus style) plus a rolling window for percentiles.
+    Kumulativní histogram (ve stylu Prometheus) a klouzavé okno pro percentily.
+    """
+
+    def __init__(self, window: int = 500):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, value_ms: float) -> None:
+        """
+        Adds one observation.
+        Přidá jedno měření.
+        """
+        self.counts[bisect_left(BUCKETS_MS, value_ms)] += 1
+        self.total += value_ms
+        self.count += 1
+        self.recent.append(value_ms)
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Nearest-rank percentile of the rolling window.
+        Percentil (nejbližší pořadí) z klouzavého okna.
+        """
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))]
+
+
+class ScanTimer:
+    """
+    Times stages of one scan as laps (each lap ends the previous stage).
+    Měří kroky jednoho skenu jako mezičasy (každý mezičas ukončí předchozí krok).
+
+    - Works without a collector too (metrics disabled) / Funguje i bez sběrače (metriky vypnuté)
+    """
+
+    def __init__(self, metrics: 'ScanMetrics | None', order_code: str, serial: str):
+        self.metrics = metrics
+        self.order_code = order_code
+        self.serial = serial
+        self.started = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.finished = False
+        self._lap_started = self.started
+
+    def lap(self, name: str) -> None:
+        """
+        Adds time since the previous lap to the stage.
+        Přičte čas od předchozího mezičasu ke kroku.
+        """
+        now = time.perf_counter()
+        self.stages[name] = self.stages.get(name, 0.0) + (now - self._lap_started) * 1000
+        self._lap_started = now
+
+    def skip(self) -> None:
+        """
+        Excludes time since the previous lap (e.g. operator reading a dialog).
+        Vynechá čas od předchozího mezičasu (např. operátor čte dialog).
+        """
+        self._lap_started = time.perf_counter()
+
+    def finish(self, result: str) -> None:
+        """
+        Records the scan (result: ok / reprint / failed / invalid).
+        Zaznamená sken (výsledek: ok / reprint / failed / invalid).
+        """
+        if self.finished:
+            return
+        self.finished = True
+        if self.metrics:
+            self.metrics.record_scan(self, result, (time.perf_counter() - self.started) * 1000)
+
+
+class ScanMetrics:
+    """
+    Collects scan and label timings and exports them for charting.
+    Sbírá časy skenů a etiket a exportuje je pro grafy.
+
+    - printline.prom: Prometheus textfile collector format (histograms, counters, rolling p95)
+    - scans.csv / labels.csv: one row per scan / per label for scans per hour and time-to-label charts
+    - Files are rewritten / appended at most every 'flush_interval_s' seconds
+
+    - printline.prom: formát textfile collectoru Prometheus (histogramy, čítače, klouzavé p95)
+    - scans.csv / labels.csv: řádek na sken / etiketu pro grafy skenů za hodinu a času do etikety
+    - Soubory se přepisují / doplňují nejvýše jednou za 'flush_interval_s' sekund
+    """
+
+    def __init__(self, directory: Path, station: str, flush_interval_s: float = 10, window: int = 500):
+        self.directory = directory
+        self.station = station
+        self.flush_interval_s = flush_interval_s
+        self.window = window
+
+        self.scan_histograms: dict[str, Histogram] = {}
+        self.label_histograms: dict[str, Histogram] = {}
+        self.scan_results: dict[str, int] = {}
+
+        self._scan_rows: list[list] = []
+        self._label_rows: list[list] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+    def record_scan(self, timer: ScanTimer, result: str, total_ms: float) -> None:
+        """
+        Stores stage timings of a finished scan.
+        Uloží časy kroků dokončeného skenu.
+        """
+        with self._lock:
+            for stage, value_ms in timer.stages.items():
+                self._histogram(self.scan_histograms, stage).observe(value_ms)
+            self._histogram(self.scan_histograms, 'total').observe(total_ms)
+            self.scan_results[result] = self.scan_results.get(result, 0) + 1
+
+            self._scan_rows.append(
+                [time.strftime('%Y-%m-%d %H:%M:%S'), self.station, timer.order_code, timer.serial, result]
+                + [f'{timer.stages[stage]:.1f}' if stage in timer.stages else '' for stage in SCAN_STAGES]
+                + [f'{total_ms:.1f}']
+            )
+        self.flush_if_due()
+
+    def record_label(self, serial: str, group: str, trigger: str, stages: dict[str, float]) -> None:
+        """
+        Stores timings of one label (write_output, trigger, wait, time_to_label).
+        Uloží časy jedné etikety (zápis výstupu, spouštěč, čekání, čas do etikety).
+        """
+        with self._lock:
+            for stage, value_ms in stages.items():
+                self._histogram(self.label_histograms, stage).observe(value_ms)
+
+            self._label_rows.append(
+                [time.strftime('%Y-%m-%d %H:%M:%S'), self.station, serial, group, trigger]
+                + [f'{stages[stage]:.1f}' if stage in stages else '' for stage in LABEL_STAGES]
+            )
+        self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        """
+        Flushes metrics files when the flush interval elapsed.
+        Zapíše soubory metrik, pokud uplynul interval.
+        """
+        if time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Rewrites Prometheus file and appends pending CSV rows.
+        Přepíše soubor pro Prometheus a doplní čekající řádky CSV.
+        """
+        with self._lock:
+            scan_rows, self._scan_rows = self._scan_rows, []
+            label_rows, self._label_rows = self._label_rows, []
+            prometheus = self._render_prometheus()
+            self._last_flush = time.monotonic()
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._append_csv(self.directory / 'scans.csv', ['timestamp', 'station', 'order', 'serial', 'result']
+                             + [f'{stage}_ms' for stage in SCAN_STAGES] + ['total_ms'], scan_rows)
+            self._append_csv(self.directory / 'labels.csv', ['timestamp', 'station', 'serial', 'group', 'trigger']
+                             + [f'{stage}_ms' for stage in LABEL_STAGES], label_rows)
+
+            # 💡 Atomic replace – collector never reads a half-written file / Atomická záměna – collector nečte rozepsaný soubor
+            prom_path = self.directory / 'printline.prom'
+            temp_path = prom_path.with_suffix('.tmp')
+            temp_path.write_text(prometheus, encoding='utf-8')
+            os.replace(temp_path, prom_path)
+        except Exception as e:
+            self.normal_logger.log('Warning', f'Metriky nelze uložit: {str(e)}', 'SCAMET001')
+
+    def _histogram(self, histograms: dict[str, Histogram], name: str) -> Histogram:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram(self.window)
+        return histogram
+
+    @staticmethod
+    def _append_csv(path: Path, header: list[str], rows: list[list]) -> None:
+        if not rows:
+            return
+        new_file = not path.exists()
+        with path.open('a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            if new_file:
+                writer.writerow(header)
+            writer.writerows(rows)
+
+    def _render_prometheus(self) -> str:
+        """
+        Renders all metrics in Prometheus text exposition format.
+        Vykreslí všechny metriky v textovém formátu Prometheus.
+        """
+        station = self.station.replace('\\', '\\\\').replace('"', '\\"')
+        lines = []
+
+        lines.append('# HELP printline_scans_total Scans by result.')
+        lines.append('# TYPE printline_scans_total counter')
+        for result, count in sorted(self.scan_results.items()):
+            lines.append(f'printline_scans_total{{station="{station}",result="{result}"}} {count}')
+
+        for metric, histograms, description in (
+                ('printline_scan_stage_ms', self.scan_histograms, 'Duration of scan stages in ms.'),
+                ('printline_label_stage_ms', self.label_histograms, 'Duration of label stages in ms.')):
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} histogram')
+            for stage, histogram in sorted(histograms.items()):
+                labels = f'station="{station}",stage="{stage}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS_MS + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{labels}}} {histogram.total:.3f}')
+                lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+
+            lines.append(f'# HELP {metric}_p95 Rolling p95 of the last {self.window} observations in ms.')
+            lines.append(f'# TYPE {metric}_p95 gauge')
+            for stage, histogram in sorted(histograms.items()):
+                lines.append(f'{metric}_p95{{station="{station}",stage="{stage}"}} {histogram.percentile(95):.3f}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,86 @@
+# ⚖️ TriggerDirBalancer – spreads print jobs across a pool of trigger directories (one per Commander/printer)
+# Rozděluje tiskové úlohy mezi více složek spouštěčů (jedna na každý Commander/tiskárnu)
+
+import os
+import time
+import itertools
+from pathlib import Path
+from core.logger import Logger
+
+
+class TriggerDirBalancer:
+    """
+    Picks trigger directory for each job and fails over from directories that stopped consuming.
+    Vybírá složku spouštěčů pro každou úlohu a vyřadí složky, které přestaly spouštěče zpracovávat.
+
+    - 'round_robin': directories take turns / složky se střídají
+    - 'least_pending': directory with the fewest waiting trigger files / složka s nejméně čekajícími soubory
+    - A directory whose trigger timed out is skipped for 'cooldown_ms' (unless no other is left)
+    """
+
+    STRATEGIES = ('round_robin', 'least_pending')
+
+    def __init__(self, directories: list[Path], strategy: str = 'round_robin', cooldown_ms: int = 60000):
+        """
+        :param directories: Pool of trigger directories / Seznam složek spouštěčů
+        :param strategy: 'round_robin' or 'least_pending' / Strategie výběru
+        :param cooldown_ms: How long a failed directory is skipped / Jak dlouho se vadná složka přeskakuje
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f'Unknown balancing strategy "{strategy}".')
+
+        self.directories = directories
+        self.strategy = strategy
+        self.cooldown_ms = cooldown_ms
+
+        self._turn = itertools.count()
+        self._down_until: dict[str, float] = {}
+
+        # 📝 Logging setup / Nastavení loggeru
+        self.normal_logger = Logger(spaced=False)
+
+    def pick(self) -> Path | None:
+        """
+        Returns directory for the next job or None if no directory is reachable.
+        Vrátí složku pro další úlohu nebo None, pokud není dostupná žádná složka.
+        """
+        reachable = [directory for directory in self.directories if directory.exists()]
+        if not reachable:
+            return None
+
+        now = time.monotonic()
+        healthy = [directory for directory in reachable if self._down_until.get(str(directory), 0) <= now]
+        candidates = healthy or reachable  # 💡 Everything failed → keep trying all / Vše selhalo → zkoušíme všechny
+
+        # 🔄 Rotate start so that ties are spread evenly / Rotace začátku, aby se shody rozložily rovnoměrně
+        start = next(self._turn) % len(candidates)
+        rotated = candidates[start:] + candidates[:start]
+
+        if self.strategy == 'least_pending':
+            return min(rotated, key=self._pending_files)
+        return rotated[0]
+
+    def report(self, directory: str, value: str, consumed: bool, elapsed_ms: float) -> None:
+        """
+        Feedback from the print queue about one trigger (connected to PrintQueue.trigger_finished).
+        Zpětná vazba z tiskové fronty o jednom spouštěči (napojeno na PrintQueue.trigger_finished).
+        """
+        if consumed:
+            self._down_until.pop(directory, None)
+            return
+
+        if len(self.directories) > 1:
+            self._down_until[directory] = time.monotonic() + self.cooldown_ms / 1000
+            self.normal_logger.log('Warning', f'Složka {directory} nezpracovala trigger {value} ({elapsed_ms:.0f} ms), dočasně vyřazena.', 'TRIBAL001')
+
+    @staticmethod
+    def _pending_files(directory: Path) -> int:
+        """
+        Counts trigger files waiting in directory (temporary '~' files excluded).
+        Spočítá trigger soubory čekající ve složce (bez dočasných '~' souborů).
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return sum(1 for entry in entries if entry.is_file() and not entry.name.startswith('~'))
+        except OSError:
+            return 1 << 30
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import QApplication
 from views.login_window import LoginWindow
 from controllers.login_controller import LoginController
 from views.splash_screen import SplashScreen
+from utils.startup_warmup import StartupWarmup
 from utils.window_stack import WindowStackManager
 
 # 📌 Window stack manager for navigation between UI windows / Správce zásobníku oken aplikace
@@ -29,9 +30,9 @@ def main():
         window_stack.push(login_window)  # 💡 Push the login window onto the stack / Tohle je důležité!
         login_window.effects.fade_in(login_window, duration=2000)
 
-    # 📌 Show splash screen and then launch login window / Zobrazí splash screen a poté spustí přihlašovací okno
+    # 📌 Show splash screen, warm caches meanwhile, then launch login window / Splash, mezitím zahřátí cache, poté přihlášení
     splash = SplashScreen()
-    splash.start(launch_login)
+    splash.start(launch_login, StartupWarmup())
 
     app.exec()
 
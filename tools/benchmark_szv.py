@@ -0,0 +1,76 @@
+# 🧪 SZV decoder benchmark – original per-byte loop vs. keystream decoder on a synthetic employee file
+# Porovnání původního dekodéru po bajtech a dekodéru s klíčovým proudem na syntetickém souboru zaměstnanců
+#
+# python -m tools.benchmark_szv [employees]
+
+import sys
+import time
+import random
+from utils.szv_codec import SZV_ENCODING, SZV_SEPARATOR, keystream, xor_line, decode_line
+
+
+def encode_line(segments: list[str]) -> bytes:
+    """
+    Encrypts segments into one line (inverse of decode_line).
+    Zašifruje části do jednoho řádku (opak decode_line).
+    """
+    return xor_line(SZV_SEPARATOR.join(segments).encode(SZV_ENCODING))
+
+
+def decode_line_loop(data: bytes) -> list[str]:
+    """
+    Original per-byte decoder (reference for the benchmark).
+    Původní dekodér po bajtech (reference pro benchmark).
+    """
+    int_xor = len(data) % 32
+    decoded_data = bytearray(len(data))
+
+    for i in range(len(data)):
+        decoded_data[i] = data[i] ^ (int_xor ^ 0x6)
+        int_xor = (int_xor + 5) % 32
+
+    return decoded_data.decode(SZV_ENCODING).split(SZV_SEPARATOR)
+
+
+def benchmark(employees: int = 2000, repeat: int = 5) -> dict:
+    """
+    Compares original and keystream decoder on a synthetic employee file.
+    Porovná původní a nový dekodér na syntetickém souboru zaměstnanců.
+
+    :param employees: Lines of the file / Počet řádků souboru
+    :param repeat: Measured passes, the best one is reported / Počet měření, vrací se nejlepší
+    :return: Best times in ms and speed-up / Nejlepší časy v ms a zrychlení
+    :raises ValueError: Decoders disagree / Dekodéry se neshodují
+    """
+    rng = random.Random(1)
+    surnames = ['Novák', 'Svoboda', 'Dvořák', 'Černý', 'Procházková', 'Kučera', 'Veselý', 'Horáková']
+    names = ['Jan', 'Petr', 'Jana', 'Marie', 'Tomáš', 'Lucie', 'Jiří', 'Eva']
+    lines = [
+        encode_line([
+            f'{rng.randrange(10 ** 9, 10 ** 10)}',
+            f'{number},{rng.randrange(100, 999)},{rng.choice(surnames)},{rng.choice(names)},{number % 900 + 100:03d}',
+        ])
+        for number in range(employees)
+    ]
+
+    if any(decode_line(line) != decode_line_loop(line) for line in lines):
+        raise ValueError('Keystream decoder differs from the original loop.')
+
+    results = {}
+    for name, decoder in (('loop', decode_line_loop), ('keystream', decode_line)):
+        best = float('inf')
+        for _ in range(repeat):
+            keystream.cache_clear()  # 💡 Every pass pays for its keystreams / Každý průchod si klíče spočítá znovu
+            started = time.perf_counter()
+            for line in lines:
+                decoder(line)
+            best = min(best, (time.perf_counter() - started) * 1000)
+        results[f'{name}_ms'] = round(best, 3)
+
+    results['employees'] = employees
+    results['speedup'] = round(results['loop_ms'] / results['keystream_ms'], 1)
+    return results
+
+
+if __name__ == '__main__':
+    print(benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
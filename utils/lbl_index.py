@@ -0,0 +1,410 @@
+# 🗂️ LblIndex – parses .lbl order file once into a dictionary keyed by (serial, field)
+# Jednorázově rozparsuje .lbl soubor do slovníku podle (serial number, písmeno řádku)
+
+import os
+import sys
+import mmap
+import locale
+from pathlib import Path
+from typing import Iterable
+
+# 📌 Row letters we care about / Sledovaná písmena řádků
+# B/D/E = product (triggers, header, record), I/J/K = Control4 (triggers, header, record)
+LBL_FIELDS = frozenset('BDEIJK')
+
+# 📌 Trigger rows keep the first occurrence, others the last one (same as the original linear scans)
+# Řádky spouštěčů drží první výskyt, ostatní poslední (stejně jako původní lineární průchody)
+TRIGGER_FIELDS = frozenset('BI')
+
+# 📌 Header rows (D/J) and record rows (E/K) / Řádky hlaviček (D/J) a záznamů (E/K)
+HEADER_FIELDS = frozenset('DJ')
+RECORD_FIELDS = frozenset('EK')
+
+# 📌 One bit per row letter for the completeness bitmap / Jeden bit na písmeno řádku pro bitmapu kompletnosti
+FIELD_BITS = {field: 1 << position for position, field in enumerate('BDEIJK')}
+
+# 📌 Rows required by each trigger group (my2n needs nothing from .lbl) / Řádky vyžadované jednotlivými skupinami
+GROUP_FIELDS = {'product': 'BDE', 'control4': 'IJK'}
+
+# 📌 Column separator inside header/record rows / Oddělovač sloupců v hlavičce a záznamu
+FIELD_SEPARATOR = '","'
+
+# 📦 Interned header templates shared by all orders / Sdílené (internované) šablony hlaviček všech příkazů
+_header_templates: dict[str, 'HeaderTemplate'] = {}
+
+
+def fields_mask(fields: str) -> int:
+    """
+    Converts row letters (e.g. 'BDE') to a bitmask.
+    Převede písmena řádků (např. 'BDE') na bitovou masku.
+    """
+    mask = 0
+    for field in fields:
+        mask |= FIELD_BITS[field]
+    return mask
+
+
+class HeaderTemplate:
+    """
+    Header row tokenized once, with cached column positions.
+    Jednou rozdělená hlavička s uloženými pozicemi sloupců.
+    """
+    __slots__ = ('text', 'fields', 'columns')
+
+    def __init__(self, text: str):
+        self.text = sys.intern(text)
+        self.fields = tuple(text.split(FIELD_SEPARATOR))
+
+        # 💡 First occurrence wins, same as list.index() / Platí první výskyt, stejně jako list.index()
+        self.columns = {}
+        for position, name in enumerate(self.fields):
+            self.columns.setdefault(name, position)
+
+    def column(self, name: str) -> int | None:
+        """
+        Returns position of the named column or None.
+        Vrátí pozici pojmenovaného sloupce nebo None.
+        """
+        return self.columns.get(name)
+
+
+def header_template(text: str) -> HeaderTemplate:
+    """
+    Returns the shared template for a header string (tokenized only the first time).
+    Vrátí sdílenou šablonu pro text hlavičky (rozdělí se jen poprvé).
+    """
+    template = _header_templates.get(text)
+    if template is None:
+        template = _header_templates[text] = HeaderTemplate(text)
+    return template
+
+
+class LblIndex:
+    """
+    In-memory index of a .lbl file.
+    Index .lbl souboru v paměti.
+
+    - Every line 'SERIAL<letter>=value' is stored under key (SERIAL, letter)
+    - Lookups cost a single hash access regardless of the order size
+    - Headers (D/J) are kept as shared HeaderTemplate, records (E/K) as pre-split tuples
+    """
+
+    def __init__(self, lines: Iterable[str] = ()):
+        """
+        Builds the index from lines of a .lbl file.
+        Sestaví index z řádků .lbl souboru.
+
+        :param lines: Lines of .lbl file / Řádky .lbl souboru
+        """
+        self._entries: dict[tuple[str, str], str | HeaderTemplate | tuple[str, ...]] = {}
+        self._masks: dict[str, int] = {}  # 🧮 serial → bitmap of present rows / serial → bitmapa přítomných řádků
+        self.extend(lines)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """
+        Adds further lines to the index.
+        Přidá do indexu další řádky.
+
+        :param lines: Lines of .lbl file / Řádky .lbl souboru
+        """
+        entries = self._entries
+        masks = self._masks
+        for line in lines:
+            eq = line.find('=')
+            if eq < 2:
+                continue
+
+            field = line[eq - 1]
+            if field not in LBL_FIELDS:
+                continue
+
+            serial = line[:eq - 1]
+            key = (serial, field)
+            if field in TRIGGER_FIELDS and key in entries:
+                continue
+
+            masks[serial] = masks.get(serial, 0) | FIELD_BITS[field]
+
+            value = line[eq + 1:].strip()
+            if value and field in HEADER_FIELDS:
+                entries[key] = header_template(value)
+            elif value and field in RECORD_FIELDS:
+                entries[key] = tuple(value.split(FIELD_SEPARATOR))
+            else:
+                entries[key] = value
+
+    def get(self, serial: str, field: str) -> str | None:
+        """
+        Returns value of the given row for the serial number.
+        Vrátí hodnotu daného řádku pro serial number.
+
+        :param serial: Serial number / Serial number
+        :param field: Row letter (B, D, E, I, J, K) / Písmeno řádku
+        :return: Stripped value or None / Očištěná hodnota nebo None
+        """
+        value = self._entries.get((serial, field))
+        if isinstance(value, HeaderTemplate):
+            return value.text
+        if isinstance(value, tuple):
+            return FIELD_SEPARATOR.join(value)
+        return value
+
+    def get_template(self, serial: str, field: str) -> HeaderTemplate | None:
+        """
+        Returns tokenized header row (D or J) or None if missing/empty.
+        Vrátí rozdělenou hlavičku (D nebo J) nebo None, pokud chybí nebo je prázdná.
+        """
+        value = self._entries.get((serial, field))
+        return value if isinstance(value, HeaderTemplate) else None
+
+    def get_fields(self, serial: str, field: str) -> tuple[str, ...] | None:
+        """
+        Returns pre-split record row (E or K) or None if missing/empty.
+        Vrátí předem rozdělený záznam (E nebo K) nebo None, pokud chybí nebo je prázdný.
+        """
+        value = self._entries.get((serial, field))
+        return value if isinstance(value, tuple) else None
+
+    def has(self, serial: str, field: str) -> bool:
+        """
+        Checks whether the row exists for the serial number.
+        Ověří, zda pro serial number existuje daný řádek.
+        """
+        return bool(self._masks.get(serial, 0) & FIELD_BITS[field])
+
+    def mask(self, serial: str) -> int:
+        """
+        Returns completeness bitmap of the serial number (see FIELD_BITS).
+        Vrátí bitmapu kompletnosti serial number (viz FIELD_BITS).
+        """
+        return self._masks.get(serial, 0)
+
+    def missing(self, serial: str, fields: str) -> list[str]:
+        """
+        Returns keys (e.g. '25-0001-0001B=') which are not present.
+        Vrátí klíče (např. '25-0001-0001B='), které v souboru chybí.
+
+        :param serial: Serial number / Serial number
+        :param fields: Required row letters, e.g. 'BDE' / Požadovaná písmena řádků
+        """
+        mask = self._masks.get(serial, 0)
+        return [f'{serial}{field}=' for field in fields if not mask & FIELD_BITS[field]]
+
+    def completeness(self, fields: str) -> tuple[int, int]:
+        """
+        Counts serial numbers having / missing some of the required rows (one pass over the bitmap).
+        Spočítá serial numbers, které mají / nemají všechny požadované řádky (jeden průchod bitmapou).
+
+        :param fields: Required row letters, e.g. 'BDEIJK' / Požadovaná písmena řádků
+        :return: (complete, incomplete) / (kompletní, neúplné)
+        """
+        required = fields_mask(fields)
+        complete = sum(1 for mask in self._masks.values() if mask & required == required)
+        return complete, len(self._masks) - complete
+
+    def serials(self) -> set[str]:
+        """
+        Returns all serial numbers present in the index.
+        Vrátí všechny serial numbers obsažené v indexu.
+        """
+        return set(self._masks)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MmapLblIndex:
+    """
+    Memory-mapped alternative to LblIndex for very large orders.
+    Alternativa k LblIndex nad mapovaným souborem pro velmi velké příkazy.
+
+    - Keeps only raw key → (offset, length) of the value / Drží jen surový klíč → (offset, délka) hodnoty
+    - Decodes just the lines requested for the scanned serial / Dekóduje jen řádky pro naskenovaný serial
+    - Same lookup API as LblIndex, so Validator does not care which one it gets
+    - Immutable once built: a grown file gets a new index, the map is released when the last holder drops it
+    - Appended lines go to a new level, older levels are shared with the base index (no copy per append);
+      a level is merged into the older one once it is as large, so there are only O(log n) levels
+    - Po sestavení se nemění: narostlý soubor dostane nový index, mapování se uvolní, až ho pustí poslední držitel
+    - Připsané řádky tvoří novou úroveň, starší úrovně se sdílejí se základním indexem (bez kopie při každém připsání);
+      úroveň se sloučí se starší, jakmile je stejně velká, takže úrovní je jen O(log n)
+    """
+
+    def __init__(self, path: Path, encoding: str | None = None, base: 'MmapLblIndex | None' = None):
+        """
+        Maps the file and indexes all of its lines (or only those appended after 'base').
+        Namapuje soubor a zaindexuje všechny jeho řádky (nebo jen řádky připsané za 'base').
+
+        :param path: Path to .lbl file / Cesta k .lbl souboru
+        :param encoding: Text encoding of the file (default: system locale, same as read_text()) / Kódování souboru
+        :param base: Index of the same file before it grew, left untouched / Index téhož souboru před nárůstem, nemění se
+        """
+        self.path = path
+        self.encoding = base.encoding if base else encoding or locale.getpreferredencoding(False)
+
+        # 📚 Levels newest first: (raw key → (offset, length), raw serial → bitmap) / Úrovně od nejnovější
+        self._levels: list[tuple[dict[bytes, tuple[int, int]], dict[bytes, int]]] = [({}, {})] + (base._levels if base else [])
+        self._map = self._map_file(path)
+        self.offset = self._extend_from(base.offset if base else 0)
+        self._compact()
+
+    @staticmethod
+    def _map_file(path: Path) -> mmap.mmap | None:
+        """
+        Maps the whole current file content (empty file cannot be mapped).
+        Namapuje celý aktuální obsah souboru (prázdný soubor namapovat nelze).
+        """
+        with path.open('rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def _extend_from(self, offset: int) -> int:
+        """
+        Indexes lines of the mapped content starting at byte offset.
+        Zaindexuje řádky namapovaného obsahu od zadaného bajtu.
+
+        :param offset: Byte offset of the first unread line / Bajt prvního nezpracovaného řádku
+        :return: Offset right after the last complete line / Offset za posledním celým řádkem
+        """
+        data = self._map
+        if data is None:
+            return offset
+
+        entries, masks = self._levels[0]
+        older = [level_entries for level_entries, _masks in self._levels[1:]]
+        end = len(data)
+        pos = offset
+        while pos < end:
+            newline = data.find(b'\n', pos)
+            line_end = end if newline == -1 else newline
+            eq = data.find(b'=', pos, line_end)
+
+            if eq - pos >= 2:
+                key = data[pos:eq]
+                field = chr(key[-1])
+                # 💡 First trigger row wins, so a trigger key exists in one level only / Platí první řádek spouštěče
+                if field in LBL_FIELDS and not (field in TRIGGER_FIELDS and (key in entries or any(key in level for level in older))):
+                    entries[key] = (eq + 1, line_end - eq - 1)
+                    masks[key[:-1]] = masks.get(key[:-1], 0) | FIELD_BITS[field]
+
+            if newline == -1:
+                break
+            pos = newline + 1
+
+        return data.rfind(b'\n') + 1
+
+    def _compact(self) -> None:
+        """
+        Merges the newest level into older ones while it is at least as large (base levels are never modified).
+        Slučuje nejnovější úroveň se staršími, dokud je aspoň stejně velká (úrovně základního indexu se nemění).
+        """
+        levels = self._levels
+        if len(levels) > 1 and not levels[0][0]:
+            del levels[0]  # 💡 Nothing new was appended / Nic nového nepřibylo
+
+        while len(levels) > 1 and len(levels[0][0]) >= len(levels[1][0]):
+            (new_entries, new_masks), (old_entries, old_masks) = levels[0], levels[1]
+            entries = dict(old_entries)
+            entries.update(new_entries)  # 💡 Trigger keys never repeat, later D/E/J/K rows win / Klíče spouštěčů se neopakují
+            masks = dict(old_masks)
+            for serial, mask in new_masks.items():
+                masks[serial] = masks.get(serial, 0) | mask
+            levels[:2] = [(entries, masks)]
+
+    def _location(self, key: bytes) -> tuple[int, int] | None:
+        """
+        Returns (offset, length) of the newest row with the key.
+        Vrátí (offset, délku) nejnovějšího řádku s daným klíčem.
+        """
+        for entries, _masks in self._levels:
+            location = entries.get(key)
+            if location is not None:
+                return location
+        return None
+
+    def _combined_masks(self) -> dict[bytes, int]:
+        """
+        Returns bitmaps of all serials across levels.
+        Vrátí bitmapy všech serialů napříč úrovněmi.
+        """
+        if len(self._levels) == 1:
+            return self._levels[0][1]
+
+        combined = {}
+        for _entries, masks in self._levels:
+            for serial, mask in masks.items():
+                combined[serial] = combined.get(serial, 0) | mask
+        return combined
+
+    def get(self, serial: str, field: str) -> str | None:
+        """
+        Returns value of the given row for the serial number, decoded on demand.
+        Vrátí hodnotu daného řádku pro serial number, dekódovanou až při dotazu.
+        """
+        location = self._location(f'{serial}{field}'.encode(self.encoding))
+        if location is None:
+            return None
+
+        start, length = location
+        return self._map[start:start + length].decode(self.encoding).strip()
+
+    def get_template(self, serial: str, field: str) -> HeaderTemplate | None:
+        """
+        Returns tokenized header row (D or J) or None if missing/empty.
+        Vrátí rozdělenou hlavičku (D nebo J) nebo None, pokud chybí nebo je prázdná.
+        """
+        value = self.get(serial, field)
+        return header_template(value) if value else None
+
+    def get_fields(self, serial: str, field: str) -> tuple[str, ...] | None:
+        """
+        Returns split record row (E or K) or None if missing/empty.
+        Vrátí rozdělený záznam (E nebo K) nebo None, pokud chybí nebo je prázdný.
+        """
+        value = self.get(serial, field)
+        return tuple(value.split(FIELD_SEPARATOR)) if value else None
+
+    def has(self, serial: str, field: str) -> bool:
+        """
+        Checks whether the row exists for the serial number.
+        Ověří, zda pro serial number existuje daný řádek.
+        """
+        return bool(self.mask(serial) & FIELD_BITS[field])
+
+    def mask(self, serial: str) -> int:
+        """
+        Returns completeness bitmap of the serial number (see FIELD_BITS).
+        Vrátí bitmapu kompletnosti serial number (viz FIELD_BITS).
+        """
+        raw = serial.encode(self.encoding)
+        mask = 0
+        for _entries, masks in self._levels:
+            mask |= masks.get(raw, 0)
+        return mask
+
+    def missing(self, serial: str, fields: str) -> list[str]:
+        """
+        Returns keys (e.g. '25-0001-0001B=') which are not present.
+        Vrátí klíče (např. '25-0001-0001B='), které v souboru chybí.
+        """
+        mask = self.mask(serial)
+        return [f'{serial}{field}=' for field in fields if not mask & FIELD_BITS[field]]
+
+    def completeness(self, fields: str) -> tuple[int, int]:
+        """
+        Counts serial numbers having / missing some of the required rows (one pass over the bitmap).
+        Spočítá serial numbers, které mají / nemají všechny požadované řádky (jeden průchod bitmapou).
+        """
+        required = fields_mask(fields)
+        masks = self._combined_masks()
+        complete = sum(1 for mask in masks.values() if mask & required == required)
+        return complete, len(masks) - complete
+
+    def serials(self) -> set[str]:
+        """
+        Returns all serial numbers present in the index.
+        Vrátí všechny serial numbers obsažené v indexu.
+        """
+        return {serial.decode(self.encoding) for _entries, masks in self._levels for serial in masks}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries, _masks in self._levels)  # 💡 Stored entries (cache cost) / Uložené záznamy (cena v cache)
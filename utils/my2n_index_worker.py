@@ -0,0 +1,54 @@
+# 🔐 My2nIndexWorker – refreshes the local My2N token index of an order off the GUI thread
+# Obnovuje lokální index My2N tokenů příkazu mimo hlavní (GUI) vlákno
+
+from pathlib import Path
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from core.my2n_index import My2nTokenIndex
+
+
+class My2nIndexSignals(QObject):
+    """
+    Signals emitted by My2nIndexWorker (delivered in the GUI thread).
+    Signály workeru My2nIndexWorker (doručené do GUI vlákna).
+    """
+    finished = pyqtSignal(list)  # serials without report or token / serialy bez reportu nebo tokenu
+    failed = pyqtSignal(str)  # message
+
+
+class My2nIndexWorker(QRunnable):
+    """
+    Background job reading My2N reports of all serials of an order into the token index.
+    Úloha na pozadí, která načte My2N reporty všech serialů příkazu do indexu tokenů.
+    """
+
+    def __init__(self, index: My2nTokenIndex, serials: list[str], reports_path: Path, workers: int = 8):
+        """
+        Prepares the job (does not start it).
+        Připraví úlohu (nespouští ji).
+
+        :param index: Token index / Index tokenů
+        :param serials: Serials of the order / Serial numbers příkazu
+        :param reports_path: Root folder of reports / Kořenová složka reportů
+        :param workers: Parallel report readers / Počet paralelních čtení reportů
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # 💡 Controller keeps the reference / Referenci drží controller
+
+        self.signals = My2nIndexSignals()
+        self.index = index
+        self.serials = serials
+        self.reports_path = reports_path
+        self.workers = workers
+
+    def run(self):
+        """
+        Executed in a QThreadPool thread.
+        Spuštěno ve vlákně QThreadPool.
+        """
+        try:
+            missing = self.index.refresh(self.serials, self.reports_path, self.workers)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(missing)
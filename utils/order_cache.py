@@ -0,0 +1,219 @@
+# 🗃️ OrderFileCache – shared cache of indexed .lbl files with stat revalidation and LRU eviction
+# Sdílená cache zaindexovaných .lbl souborů s kontrolou změn (mtime + velikost) a LRU vyřazováním
+
+import os
+import zlib
+import threading
+import locale
+from collections import OrderedDict
+from pathlib import Path
+from core.config_loader import ConfigLoader
+from utils.lbl_index import LblIndex, MmapLblIndex
+
+# 📏 Size of the leading window used to detect rewritten files / Velikost úvodního okna pro detekci přepsání souboru
+HEAD_WINDOW = 4096
+
+# 📏 Approximate memory held per indexed row in mmap mode / Přibližná paměť na jeden řádek v režimu mmap
+MMAP_ENTRY_COST = 128
+
+# 📦 Shared instance for the whole application / Sdílená instance pro celou aplikaci
+_order_cache = None
+_order_cache_lock = threading.Lock()
+
+
+def get_order_cache():
+    """
+    Returns the application-wide order file cache (created on first use).
+    Vrací sdílenou cache souborů příkazů (vytvoří se při prvním použití).
+
+    - Memory budget is read from [Cache] lbl_cache_budget_mb (default 64 MB)
+    - Backend is read from [Cache] lbl_backend: 'memory' (default) or 'mmap'
+    """
+    global _order_cache
+    with _order_cache_lock:
+        if _order_cache is None:
+            config = ConfigLoader()
+            budget_mb = config.get_value('Cache', 'lbl_cache_budget_mb', fallback='64')
+            backend = config.get_value('Cache', 'lbl_backend', fallback='memory').strip().lower()
+            _order_cache = OrderFileCache(budget_bytes=int(budget_mb) * 1024 * 1024, backend=backend)
+        return _order_cache
+
+
+class _CacheEntry:
+    """
+    Cached index with the stat signature of the file it was built from.
+    Uložený index spolu s podpisem souboru (mtime + velikost), ze kterého vznikl.
+
+    - offset: bytes consumed up to the last complete line / Počet zpracovaných bajtů po poslední celý řádek
+    - head_len / head_crc: length and checksum of the leading window / Délka a kontrolní součet úvodního okna
+    """
+
+    def __init__(self, index: LblIndex | MmapLblIndex, mtime_ns: int, size: int, offset: int, head_len: int, head_crc: int):
+        self.index = index
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.offset = offset
+        self.head_len = head_len
+        self.head_crc = head_crc
+        self.cost = 0
+
+
+class OrderFileCache:
+    """
+    LRU cache of LblIndex objects keyed by file path.
+    LRU cache objektů LblIndex podle cesty k souboru.
+
+    - Every access costs a single stat() call / Každý přístup stojí jen jedno volání stat()
+    - File is re-read only when its mtime or size changed / Soubor se čte znovu jen při změně
+    - Growing files are extended by parsing only the appended tail / Rostoucí soubory se doindexují jen o nový konec
+    - Least recently used orders are evicted when the memory budget is exceeded
+    - Backend 'mmap' keeps only byte offsets and decodes rows on demand (for very large orders)
+    - Handed-out mmap indexes are never closed – reload or growth builds a new one, the old map is freed
+      once no caller holds it (the file stays mapped until then)
+    - Vydané mmap indexy se nikdy nezavírají – nové načtení nebo nárůst vytvoří nový index, staré mapování
+      se uvolní, až ho žádný volající nedrží (do té doby zůstává soubor namapován)
+    """
+
+    def __init__(self, budget_bytes: int = 64 * 1024 * 1024, backend: str = 'memory'):
+        """
+        Initializes an empty cache.
+        Inicializuje prázdnou cache.
+
+        :param budget_bytes: Approximate memory budget / Přibližný paměťový limit
+        :param backend: 'memory' (decoded LblIndex) or 'mmap' (MmapLblIndex) / Typ indexu
+        """
+        if backend not in ('memory', 'mmap'):
+            raise ValueError(f'Unknown .lbl backend "{backend}".')
+
+        self.budget_bytes = budget_bytes
+        self.backend = backend
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._used_bytes = 0
+
+        # 🔒 Orders are preloaded from worker threads / Příkazy se přednačítají z pracovních vláken
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        """
+        Normalizes path so that 'T:/Prikazy/X.lbl' and 't:\\prikazy\\x.lbl' share an entry.
+        Normalizuje cestu, aby různé zápisy téhož souboru sdílely jeden záznam.
+        """
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: Path) -> LblIndex | MmapLblIndex:
+        """
+        Returns index of the file, re-reading it only if it changed since last access.
+        Vrátí index souboru, znovu ho načte jen pokud se od posledního přístupu změnil.
+
+        :param path: Path to .lbl file / Cesta k .lbl souboru
+        :return: LblIndex or MmapLblIndex (depending on backend)
+        :raises OSError: If the file cannot be read / Pokud soubor nelze načíst
+        """
+        key = self._key(path)
+        with self._lock:
+            stat = path.stat()
+
+            entry = self._entries.get(key)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._entries.move_to_end(key)
+                return entry.index
+
+            if entry and self._append_tail(path, entry, stat):
+                self._store(key, entry)
+                return entry.index
+
+            entry = self._load_full(path, stat)
+            self._store(key, entry)
+            return entry.index
+
+    def _load_full(self, path: Path, stat: os.stat_result) -> _CacheEntry:
+        """
+        Reads and indexes the whole file.
+        Načte a zaindexuje celý soubor.
+        """
+        if self.backend == 'mmap':
+            index = MmapLblIndex(path)
+            with path.open('rb') as file:
+                head_len = min(HEAD_WINDOW, index.offset)
+                head_crc = zlib.crc32(file.read(head_len))
+            return _CacheEntry(index, stat.st_mtime_ns, stat.st_size, index.offset, head_len, head_crc)
+
+        data = path.read_bytes()
+        index = LblIndex(data.decode(locale.getpreferredencoding(False)).splitlines())
+
+        # 📌 Remember where the last complete line ends / Zapamatujeme si konec posledního celého řádku
+        offset = data.rfind(b'\n') + 1
+        head_len = min(HEAD_WINDOW, offset)
+        return _CacheEntry(index, stat.st_mtime_ns, len(data), offset, head_len, zlib.crc32(data[:head_len]))
+
+    @staticmethod
+    def _append_tail(path: Path, entry: _CacheEntry, stat: os.stat_result) -> bool:
+        """
+        Indexes only bytes appended since the last load.
+        Zaindexuje pouze bajty připsané od posledního načtení.
+
+        :return: False if the file must be reloaded completely / False, pokud je nutné načíst celý soubor
+        """
+        # ❗ File did not grow or the last line was incomplete → full reload / Soubor nenarostl nebo byl poslední řádek neúplný → plné načtení
+        if stat.st_size <= entry.size or entry.offset != entry.size:
+            return False
+
+        with path.open('rb') as file:
+            if zlib.crc32(file.read(entry.head_len)) != entry.head_crc:
+                return False
+
+            if isinstance(entry.index, MmapLblIndex):
+                # 🗺️ New map of the grown file indexed only from the consumed offset / Nové mapování a indexace od zpracovaného offsetu
+                entry.index = MmapLblIndex(path, base=entry.index)
+                entry.offset = entry.index.offset
+                entry.size = stat.st_size
+                entry.mtime_ns = stat.st_mtime_ns
+                return True
+
+            file.seek(entry.offset)
+            tail = file.read()
+
+        entry.index.extend(tail.decode(locale.getpreferredencoding(False)).splitlines())
+        entry.offset += tail.rfind(b'\n') + 1
+        entry.size += len(tail)
+        entry.mtime_ns = stat.st_mtime_ns
+        return True
+
+    def invalidate(self, path: Path) -> None:
+        """
+        Drops cached entry for the given file.
+        Odstraní záznam daného souboru z cache.
+        """
+        with self._lock:
+            entry = self._entries.pop(self._key(path), None)
+            if entry:
+                self._used_bytes -= entry.cost
+
+    def clear(self) -> None:
+        """
+        Drops all cached entries.
+        Vyprázdní celou cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._used_bytes = 0
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        """
+        Stores entry as most recently used and evicts the oldest ones over budget.
+        Uloží záznam jako naposledy použitý a vyřadí nejstarší záznamy nad limit.
+        """
+        previous = self._entries.pop(key, None)
+        if previous:
+            self._used_bytes -= previous.cost
+
+        # 📏 Decoded index costs about the file size, mmap index only its offsets / Dekódovaný index ~ velikost souboru, mmap jen offsety
+        entry.cost = len(entry.index) * MMAP_ENTRY_COST if isinstance(entry.index, MmapLblIndex) else entry.size
+        self._entries[key] = entry
+        self._used_bytes += entry.cost
+
+        # 💡 The newest entry always stays, even if it alone exceeds the budget / Nejnovější záznam zůstává vždy
+        while self._used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._used_bytes -= evicted.cost
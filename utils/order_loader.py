@@ -0,0 +1,90 @@
+# ⏳ OrderLoadWorker – loads .nor and indexes .lbl of a work order off the GUI thread
+# Načítá .nor a indexuje .lbl výrobního příkazu mimo hlavní (GUI) vlákno
+
+from pathlib import Path
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from utils.order_cache import get_order_cache
+
+
+class OrderLoadSignals(QObject):
+    """
+    Signals emitted by OrderLoadWorker (delivered in the GUI thread).
+    Signály workeru OrderLoadWorker (doručené do GUI vlákna).
+    """
+    nor_ready = pyqtSignal(str, str)  # order_code, product_name
+    nor_failed = pyqtSignal(str, str, str)  # level, message, error_code
+    lbl_ready = pyqtSignal()
+    lbl_failed = pyqtSignal(str)  # message
+
+
+class OrderLoadWorker(QRunnable):
+    """
+    Background job for opening a work order.
+    Úloha na pozadí pro otevření výrobního příkazu.
+
+    - Checks existence of .lbl and .nor files / Ověří existenci souborů .lbl a .nor
+    - Validates .nor and reports product name as soon as possible / Ověří .nor a co nejdříve vrátí název produktu
+    - Then builds the .lbl index into the shared order cache / Poté sestaví index .lbl do sdílené cache
+    """
+
+    def __init__(self, orders_dir: Path, order_code: str):
+        """
+        Prepares the job (does not start it).
+        Připraví úlohu (nespouští ji).
+
+        :param orders_dir: Folder with orders / Složka s příkazy
+        :param order_code: Scanned work order / Naskenovaný výrobní příkaz
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # 💡 Controller keeps the reference / Referenci drží controller
+
+        self.signals = OrderLoadSignals()
+        self.order_code = order_code
+        self.lbl_file = orders_dir / f'{order_code}.lbl'
+        self.nor_file = orders_dir / f'{order_code}.nor'
+
+        # 📌 Result of .lbl indexing (set before lbl_ready/lbl_failed is emitted) / Výsledek indexace .lbl
+        self.lbl_done = False
+        self.lbl_error = None
+
+    def run(self):
+        """
+        Executed in a QThreadPool thread.
+        Spuštěno ve vlákně QThreadPool.
+        """
+        if not self.lbl_file.exists() or not self.nor_file.exists():
+            self.signals.nor_failed.emit('Warning', f'Soubor {self.lbl_file} nebo {self.nor_file} nebyl nalezen!', 'WORORCON005')
+            return
+
+        try:
+            with self.nor_file.open('r') as file:
+                parts = file.readline().strip().split(';')
+        except Exception as e:
+            self.signals.nor_failed.emit('Error', f'Neočekávaná chyba při zpracování .NOR souboru: {e}', 'WORORCON008')
+            return
+
+        if len(parts) < 2:
+            self.signals.nor_failed.emit('Warning', f'Řádek v souboru {self.nor_file} nemá očekávaný formát.', 'WORORCON007')
+            return
+
+        nor_order_code = parts[0].lstrip('$').upper()
+        product_name = parts[1].strip()
+
+        if nor_order_code != self.order_code:
+            self.signals.nor_failed.emit('Warning', f'Výrobní příkaz v souboru .NOR ({nor_order_code}) neodpovídá zadanému vstupu ({self.order_code})!', 'WORORCON006')
+            return
+
+        # ✅ .nor is valid → print window can be opened / .nor je platný → lze otevřít tiskové okno
+        self.signals.nor_ready.emit(self.order_code, product_name)
+
+        # 🗂️ Build .lbl index in the meantime / Mezitím sestavíme index .lbl
+        try:
+            get_order_cache().get(self.lbl_file)
+        except Exception as e:
+            self.lbl_error = str(e)
+
+        self.lbl_done = True
+        if self.lbl_error is None:
+            self.signals.lbl_ready.emit()
+        else:
+            self.signals.lbl_failed.emit(self.lbl_error)
@@ -0,0 +1,68 @@
+# 📋 Serial batch – parses serial ranges and scanned/pasted lists for batch printing
+# Rozbor rozsahů serial numbers a naskenovaných/vložených seznamů pro dávkový tisk
+
+import re
+
+SERIAL_PATTERN = re.compile(r'\d{2}-\d{4}-\d{4}')
+RANGE_SEPARATOR = '..'
+
+
+def serial_to_int(serial: str) -> int:
+    """
+    Converts serial 00-0000-0000 to a number (ranges may cross the middle block).
+    Převede serial 00-0000-0000 na číslo (rozsah může přecházet přes prostřední blok).
+    """
+    return int(serial.replace('-', ''))
+
+
+def int_to_serial(number: int) -> str:
+    """
+    Converts number back to serial 00-0000-0000.
+    Převede číslo zpět na serial 00-0000-0000.
+    """
+    digits = f'{number:010d}'
+    return f'{digits[:2]}-{digits[2:6]}-{digits[6:]}'
+
+
+def parse_serial_batch(text: str, max_serials: int = 1000) -> list[str]:
+    """
+    Parses batch input into an ordered list of unique serial numbers.
+    Rozebere vstup dávky na seřazený seznam unikátních serial numbers.
+
+    - Items are separated by new lines, commas, semicolons or spaces / Položky oddělené řádky, čárkou, středníkem nebo mezerou
+    - Range: '25-0001-0001..25-0001-0200' (both ends included) / Rozsah včetně obou krajních hodnot
+    - Duplicates keep their first position / Duplicity si ponechají první pozici
+
+    :param text: Pasted or scanned text / Vložený nebo naskenovaný text
+    :param max_serials: Upper limit of the batch / Maximální velikost dávky
+    :return: Serial numbers in print order / Serial numbers v pořadí tisku
+    :raises ValueError: Invalid item or too large batch / Neplatná položka nebo příliš velká dávka
+    """
+    serials: dict[str, None] = {}
+
+    for item in re.split(r'[\s,;]+', text.strip().upper()):
+        if not item:
+            continue
+
+        if RANGE_SEPARATOR in item:
+            first, _, last = item.partition(RANGE_SEPARATOR)
+            if not SERIAL_PATTERN.fullmatch(first) or not SERIAL_PATTERN.fullmatch(last):
+                raise ValueError(f'Neplatný rozsah: {item}')
+
+            start, stop = serial_to_int(first), serial_to_int(last)
+            if stop < start:
+                raise ValueError(f'Rozsah {item} je obrácený.')
+            if stop - start + 1 > max_serials:
+                raise ValueError(f'Rozsah {item} překračuje limit {max_serials} serial numbers.')
+
+            for number in range(start, stop + 1):
+                serials[int_to_serial(number)] = None
+        elif SERIAL_PATTERN.fullmatch(item):
+            serials[item] = None
+        else:
+            raise ValueError(f'Neplatný serial number: {item}')
+
+        if len(serials) > max_serials:
+            raise ValueError(f'Dávka překračuje limit {max_serials} serial numbers.')
+
+    return list(serials)
@@ -0,0 +1,133 @@
+# 🔥 StartupWarmup – warms config, paths, SZV index and order listing while the splash screen is shown
+# Zahřeje konfiguraci, cesty, index SZV a výpis příkazů, zatímco je zobrazen splash screen
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from core.config_loader import ConfigLoader
+from core.logger import Logger
+from utils.szv_index import get_szv_index
+
+
+class StartupWarmupSignals(QObject):
+    """
+    Signals emitted by StartupWarmup (delivered in the GUI thread).
+    Signály úlohy StartupWarmup (doručené do GUI vlákna).
+    """
+    step_done = pyqtSignal(str, bool, str)  # step, ok, summary
+    finished = pyqtSignal(list)  # [(step, ok, summary), …]
+
+
+class StartupWarmup(QRunnable):
+    """
+    Background job run during the splash screen.
+    Úloha na pozadí spuštěná během splash screenu.
+
+    - Config is parsed first, then path checks, SZV decode + index and order listing run in parallel
+    - A failed step is only reported – login or work order window shows the real error later
+    - Nejdřív se načte konfigurace, poté paralelně kontrola cest, dekódování + index SZV a výpis příkazů
+    - Neúspěšný krok se jen ohlásí – skutečnou chybu zobrazí až přihlášení nebo okno příkazu
+    """
+
+    def __init__(self, config_path: Path = Path('setup') / 'config.ini'):
+        """
+        Prepares the job (does not start it).
+        Připraví úlohu (nespouští ji).
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # 💡 Splash keeps the reference / Referenci drží splash
+
+        self.signals = StartupWarmupSignals()
+        self.config_path = config_path
+        self.config: ConfigLoader | None = None
+        self.results: list[tuple[str, bool, str]] = []
+
+    def run(self):
+        """
+        Executed in a QThreadPool thread.
+        Spuštěno ve vlákně QThreadPool.
+        """
+        if self._step('config', self.warm_config):
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix='warmup') as pool:
+                steps = {pool.submit(self._step, name, step): name
+                         for name, step in (('paths', self.warm_paths), ('szv', self.warm_szv), ('orders', self.warm_orders))}
+                for future in as_completed(steps):
+                    future.result()
+
+            try:
+                summary = ', '.join(f'{name}: {text}' for name, ok, text in self.results)
+                Logger(self.config_path, spaced=False).clear_log('Info', f'Zahřátí při startu – {summary}')
+            except Exception:
+                pass  # 💡 Logging problem is reported by the login window / Problém s logem ohlásí přihlášení
+
+        self.signals.finished.emit(list(self.results))
+
+    def _step(self, name: str, step) -> bool:
+        """
+        Runs one step and reports its summary.
+        Provede jeden krok a ohlásí jeho souhrn.
+        """
+        try:
+            ok, summary = step()
+        except Exception as e:
+            ok, summary = False, str(e)
+
+        self.results.append((name, ok, summary))
+        self.signals.step_done.emit(name, ok, summary)
+        return ok
+
+    def warm_config(self) -> tuple[bool, str]:
+        """
+        Parses config.ini.
+        Načte config.ini.
+        """
+        self.config = ConfigLoader(self.config_path)
+        return True, f'{len(self.config.config.sections())} sekcí'
+
+    def warm_paths(self) -> tuple[bool, str]:
+        """
+        Checks that configured folders and files are reachable.
+        Ověří dostupnost nastavených složek a souborů.
+        """
+        paths = {
+            'orders_path': self.config.get_path('orders_path'),
+            'reports_path': self.config.get_path('reports_path'),
+            'szv_input_file': self.szv_path(),
+        }
+        for number, path in enumerate(self.config.get_paths('trigger_path'), start=1):
+            paths[f'trigger_path {number}'] = path
+
+        missing = [key for key, path in paths.items() if not path or not path.exists()]
+        summary = f'{len(paths) - len(missing)}/{len(paths)} dostupných'
+        return not missing, summary + (f' (chybí: {", ".join(missing)})' if missing else '')
+
+    def warm_szv(self) -> tuple[bool, str]:
+        """
+        Decodes SZV.dat into the shared login index.
+        Dekóduje SZV.dat do sdíleného indexu přihlášení.
+        """
+        index = get_szv_index(self.szv_path(), self.config.get_path('local_data_path', fallback='data') / 'szv_snapshot.dat')
+        try:
+            index.refresh()
+        except OSError as e:
+            if not index.records:
+                raise
+            return False, f'{len(index.records)} operátorů z lokálního snímku ({e})'
+        return True, f'{len(index.records)} operátorů'
+
+    def warm_orders(self) -> tuple[bool, str]:
+        """
+        Lists order files (warms directory cache of the share).
+        Vypíše soubory příkazů (zahřeje cache adresáře sdíleného disku).
+        """
+        orders_path = self.config.get_path('orders_path')
+        if not orders_path:
+            return False, 'orders_path není nastaven'
+        return True, f'{sum(1 for _ in orders_path.glob("*.lbl"))} příkazů'
+
+    def szv_path(self) -> Path:
+        """
+        SZV file path exactly as SzvDecrypt resolves it (same key of the shared index).
+        Cesta k SZV přesně jako v SzvDecrypt (stejný klíč sdíleného indexu).
+        """
+        return Path(self.config.get_value('Paths', 'szv_input_file', fallback='T:/Prikazy/DataTPV/SZV.dat'))
@@ -0,0 +1,38 @@
+# 🔐 SZV codec – XOR keystream coding of SZV.dat lines (Qt-free, shared by login and tools/benchmark_szv.py)
+# XOR kódování řádků SZV.dat pomocí klíčového proudu (bez Qt, sdílené přihlášením i nástroji)
+
+from functools import lru_cache
+
+# 📌 Encoding of decoded text and field separator / Kódování dekódovaného textu a oddělovač polí
+SZV_ENCODING = 'windows-1250'
+SZV_SEPARATOR = '\x15'
+
+
+@lru_cache(maxsize=512)
+def keystream(length: int) -> int:
+    """
+    Returns XOR keystream of a line as one big integer (depends only on line length).
+    Vrátí klíčový proud XOR řádku jako jedno velké číslo (závisí jen na délce řádku).
+
+    - Byte i = ((length % 32 + 5 * i) % 32) ^ 0x6 / Bajt i = ((délka % 32 + 5 * i) % 32) ^ 0x6
+    - Cached per length, an employee file has only a few distinct lengths / Cache podle délky, souborů má jen pár různých délek
+    """
+    start = length % 32
+    return int.from_bytes(bytes(((start + 5 * i) % 32) ^ 0x6 for i in range(length)), 'big')
+
+
+def xor_line(data: bytes) -> bytes:
+    """
+    XORs a whole line with its keystream in one operation (coding is symmetric).
+    Provede XOR celého řádku s klíčovým proudem jedinou operací (kódování je symetrické).
+    """
+    length = len(data)
+    return (int.from_bytes(data, 'big') ^ keystream(length)).to_bytes(length, 'big')
+
+
+def decode_line(data: bytes) -> list[str]:
+    """
+    Decodes one encrypted line into its segments.
+    Dekóduje jeden zašifrovaný řádek na jednotlivé části.
+    """
+    return xor_line(data).decode(SZV_ENCODING).split(SZV_SEPARATOR)
@@ -0,0 +1,176 @@
+# 🪪 SzvIndex – decoded SZV.dat as a dict of card hash → operator record, revalidated by stat
+# Dekódovaný SZV.dat jako slovník hash karty → záznam operátora, obnovovaný podle stat
+
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from core.logger import Logger
+from utils.szv_codec import decode_line
+
+# 📦 Shared instances per SZV file / Sdílené instance podle souboru SZV
+_szv_indexes: dict[Path, 'SzvIndex'] = {}
+_szv_indexes_lock = threading.Lock()
+
+
+def get_szv_index(path: Path, snapshot_path: Path | None = None) -> 'SzvIndex':
+    """
+    Returns the application-wide index of the SZV file (created on first use, from the local snapshot if any).
+    Vrací sdílený index souboru SZV (vytvoří se při prvním použití, z lokálního snímku, pokud existuje).
+
+    :param snapshot_path: Local encrypted snapshot, used when the index is created / Lokální zašifrovaný snímek
+    """
+    with _szv_indexes_lock:
+        index = _szv_indexes.get(path)
+        if index is None:
+            index = _szv_indexes[path] = SzvIndex(path, snapshot_path)
+            index.load_snapshot()
+        return index
+
+
+def hash_card(card_id: str) -> str:
+    """
+    Returns SHA-256 hex digest of a card ID (key of the index).
+    Vrátí SHA-256 hex otisk ID karty (klíč indexu).
+    """
+    return hashlib.sha256(card_id.encode()).hexdigest()
+
+
+class SzvIndex:
+    """
+    Card hash → decoded record ('id,number,surname,name,prefix,…') of one SZV file.
+    Hash karty → dekódovaný záznam ('id,číslo,příjmení,jméno,prefix,…') jednoho souboru SZV.
+
+    - File is decoded and hashed only when its mtime or size changed / Soubor se dekóduje jen při změně mtime nebo velikosti
+    - Login then costs one stat(), one SHA-256 and one dict lookup / Přihlášení pak stojí jeden stat(), jeden SHA-256 a jeden dotaz
+    - First line of a duplicate card wins (same as the original linear scan) / Při duplicitě platí první řádek (jako původní průchod)
+    - Local snapshot keeps the source still XOR-encrypted (nothing decoded is written to disk), with source
+      mtime/size/SHA-256 in its header, so login works immediately and without the share
+    - Lokální snímek drží zdroj stále zašifrovaný XOR (nic dekódovaného se neukládá), v hlavičce mtime/velikost/SHA-256
+      zdroje, takže přihlášení funguje ihned i bez sdíleného disku
+    """
+
+    def __init__(self, path: Path, snapshot_path: Path | None = None):
+        """
+        :param path: Encrypted SZV.dat / Zašifrovaný SZV.dat
+        :param snapshot_path: Local encrypted snapshot (optional) / Lokální zašifrovaný snímek (volitelný)
+        """
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.records: dict[str, str] = {}
+        self.signature: tuple[int, int] | None = None
+        self.digest: str | None = None
+        self.skipped = 0  # 💡 Undecodable lines of the last build / Nedekódovatelné řádky posledního sestavení
+        self.from_snapshot = False
+        self.error: str | None = None  # 💡 Last failed background refresh / Poslední neúspěšná obnova na pozadí
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def refresh(self) -> bool:
+        """
+        Rebuilds the index if the file changed (and rewrites the snapshot).
+        Znovu sestaví index, pokud se soubor změnil (a přepíše snímek).
+
+        :return: True if the file was (re)decoded / True, pokud byl soubor znovu dekódován
+        :raises OSError: File cannot be read / Soubor nelze přečíst
+        """
+        with self._lock:
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self.signature:
+                self.error = None  # 💡 Source reachable and unchanged / Zdroj dostupný a beze změny
+                return False
+
+            content = self.path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            rebuilt = digest != self.digest  # 💡 Touched but same content → keep decoded records / Stejný obsah → beze změny
+            if rebuilt:
+                self._build(content)
+
+            self.signature, self.digest, self.from_snapshot, self.error = signature, digest, False, None
+            self._save_snapshot(content)
+            return rebuilt
+
+    def refresh_in_background(self) -> None:
+        """
+        Checks the source in a daemon thread (at most one at a time), errors are kept in 'error'.
+        Ověří zdroj ve vlákně na pozadí (nejvýše jedno současně), chyby se uloží do 'error'.
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.error = str(e)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name='szv-refresh', daemon=True).start()
+
+    def load_snapshot(self) -> bool:
+        """
+        Loads the index from the local snapshot (corrupt or missing snapshot is ignored).
+        Načte index z lokálního snímku (poškozený nebo chybějící snímek se ignoruje).
+        """
+        if not self.snapshot_path:
+            return False
+
+        try:
+            with self.snapshot_path.open('rb') as file:
+                header = json.loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError):
+            return False
+
+        if header.get('source') != str(self.path) or hashlib.sha256(content).hexdigest() != header.get('sha256'):
+            return False  # 💡 Other source or damaged snapshot / Jiný zdroj nebo poškozený snímek
+
+        with self._lock:
+            if self.signature is not None:
+                return False  # 💡 Source already decoded / Zdroj už byl dekódován
+            self._build(content)
+            self.signature = tuple(header['signature'])
+            self.digest = header['sha256']
+            self.from_snapshot = True
+        return True
+
+    def _build(self, content: bytes) -> None:
+        """
+        Decodes lines and builds hash → record dict.
+        Dekóduje řádky a sestaví slovník hash → záznam.
+        """
+        records = {}
+        skipped = 0
+        for line in content.decode('latin-1').splitlines():
+            if not line.strip():
+                continue
+            try:
+                decoded_line = decode_line(bytes.fromhex(line.strip()))
+            except ValueError:
+                skipped += 1
+                continue
+            records.setdefault(hash_card(decoded_line[0]), ','.join(decoded_line))
+
+        self.records, self.skipped = records, skipped
+
+    def _save_snapshot(self, content: bytes) -> None:
+        """
+        Writes source bytes (still encrypted) with its signature atomically; failure only disables offline login.
+        Atomicky zapíše bajty zdroje (stále zašifrované) s podpisem; chyba jen vypne přihlášení bez sítě.
+        """
+        if not self.snapshot_path:
+            return
+
+        header = {'source': str(self.path), 'signature': list(self.signature), 'sha256': self.digest}
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.snapshot_path.with_suffix('.tmp')
+            temp_path.write_bytes(json.dumps(header).encode('ascii') + b'\n' + content)
+            os.replace(temp_path, self.snapshot_path)
+        except OSError as e:
+            Logger(spaced=False).log('Warning', f'Lokální snímek SZV nelze uložit: {str(e)}', 'SZVIDX001')
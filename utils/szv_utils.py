@@ -1,11 +1,11 @@
 # 🔐 Utility module for decrypting user credentials via SZV.dat
 # Pomocný modul pro dekódování přihlašovacích údajů ze souboru SZV.dat
 
-import hashlib
 import configparser
 from core.logger import Logger
 from pathlib import Path
 from core.messenger import Messenger
+from utils.szv_index import get_szv_index, hash_card
 
 # 🏷️ Global variable for prefix after login / Globální proměnná pro uložený prefix
 value_prefix = None
@@ -51,80 +51,42 @@ class SzvDecrypt:
 
         self.szv_input_file = config.get('Paths', 'szv_input_file', fallback='T:/Prikazy/DataTPV/SZV.dat')
 
+        # 💾 Local encrypted snapshot for fast and offline login / Lokální zašifrovaný snímek pro rychlé přihlášení i bez sítě
+        self.snapshot_path = Path(config.get('Paths', 'local_data_path', fallback='data')).resolve() / 'szv_snapshot.dat'
+
         # 📌 Decoded user info / Uchovávání dekódovaných hodnot
         self.value_surname = None
         self.value_name = None
         self.value_prefix = None
 
-    def log_decoded_file(self):
-        """
-        Logs entire decrypted content from SZV file.
-        Zaloguje dekódovaný obsah pro ladicí účely.
-        """
-        try:
-            with Path(self.szv_input_file).open('r') as infile:
-                for line in infile:
-                    byte_array = bytearray.fromhex(line.strip())
-                    decoded_line = self.decoding_line(byte_array)
-                    self.normal_logger.clear_log('Info', f'Dekódovaný řádek: {decoded_line}')
-        except Exception as e:
-            self.normal_logger.log('Error', f'Při čtení souboru došlo k chybě: {str(e)}', 'SZVUT002')
-
-    def decoding_line(self, encoded_data):
-        """
-        Decodes line using XOR bitwise transformation.
-        Provádí dekódování jednoho řádku XOR transformací.
-
-        :param encoded_data: Encrypted bytearray
-        :return: List of decoded segments
-        """
-        try:
-            int_xor = len(encoded_data) % 32
-            decoded_data = bytearray(len(encoded_data))
-
-            for i in range(len(encoded_data)):
-                decoded_data[i] = encoded_data[i] ^ (int_xor ^ 0x6)
-                int_xor = (int_xor + 5) % 32
-
-            return decoded_data.decode('windows-1250').split('\x15')
-        except Exception as e:
-            self.normal_logger.log('Error', f'Dekódování selhalo: {e}', 'SZVUT003')
-            self.messenger.show_error('Error', f'{e}', 'SZVUT003', True)
-            return []
-
     def check_login(self, password):
         """
         Validates user password against decoded SHA-256 hashes.
         Ověří přihlášení uživatele podle hesla (ID karty).
 
+        - Decoded file is kept as hash → record dict, re-read only when SZV.dat changes (see utils/szv_index.py)
+        - Dekódovaný soubor je uložen jako slovník hash → záznam, znovu se čte jen při změně SZV.dat
+
         :param password: User-provided password string
         :return: True if login is valid, False otherwise
         """
         global value_prefix
         try:
-            decoded_data = self.decoding_file()
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-            for decoded_line in decoded_data:
-                if hashed_password == decoded_line[0]:
-                    if len(decoded_line) > 1:
-                        parts = decoded_line[1].split(',')
-                        if len(parts) >= 4:
-                            self.value_surname = parts[2].strip()
-                            self.value_name = parts[3].strip()
-                            self.value_prefix = parts[4].strip()
-                            global value_prefix
-                            value_prefix = self.value_prefix  # ❗ Global variable update / Aktualizace globální proměnné
-                            self.spaced_logger.clear_log('Info', f'Logged: {self.value_surname} {self.value_name} {self.value_prefix}')
-                            return True
-                        else:
-                            self.normal_logger.log('Warning', f'Řádek neobsahuje dostatek částí: {decoded_line[1]}', 'SZVUT004')
-                            return False
-                    else:
-                        self.normal_logger.log('Warning', f'Řádek neobsahuje další části: {decoded_line}', 'SZVUT005')
-                        return False
-
-            self.spaced_logger.log('Warning', f'Zadané heslo ({password}) nebylo nalezeno v souboru ({self.szv_input_file}).', 'SZVUT006')
-
+            record = self.lookup_record(password)
+            if record is None:
+                self.spaced_logger.log('Warning', f'Zadané heslo ({password}) nebylo nalezeno v souboru ({self.szv_input_file}).', 'SZVUT006')
+                return False
+
+            parts = record.split(',')
+            if len(parts) >= 4:
+                self.value_surname = parts[2].strip()
+                self.value_name = parts[3].strip()
+                self.value_prefix = parts[4].strip()
+                value_prefix = self.value_prefix  # ❗ Global variable update / Aktualizace globální proměnné
+                self.spaced_logger.clear_log('Info', f'Logged: {self.value_surname} {self.value_name} {self.value_prefix}')
+                return True
+
+            self.normal_logger.log('Warning', f'Řádek neobsahuje dostatek částí: {record}', 'SZVUT004')
             return False
 
         except Exception as e:
@@ -132,30 +94,34 @@ class SzvDecrypt:
             self.messenger.show_error('Error', f'{str(e)}', 'SZVUT007', True)
             return False
 
-    def decoding_file(self):
+    def lookup_record(self, password):
         """
-        Loads and decodes the encrypted SZV file.
-        Načte a dekóduje obsah šifrovaného souboru.
+        Returns decoded record of the card from the shared SZV index (None if not found or unreadable).
+        Vrátí dekódovaný záznam karty ze sdíleného indexu SZV (None, pokud chybí nebo soubor nelze číst).
 
-        :return: List of [hash, decoded_string]
+        - Known card is answered from memory / local snapshot, SZV.dat is checked in background
+        - Unknown card (e.g. new employee) waits for SZV.dat to be checked
+        - Známá karta se ověří z paměti / lokálního snímku, SZV.dat se zkontroluje na pozadí
+        - Neznámá karta (např. nový zaměstnanec) počká na kontrolu SZV.dat
         """
-        decoded_lines = []
+        index = get_szv_index(Path(self.szv_input_file), self.snapshot_path)
+        record = index.records.get(hash_card(password))
+        if record is not None:
+            if index.error:
+                self.normal_logger.log('Warning', f'Soubor {self.szv_input_file} není dostupný, přihlášení z lokálního snímku: {index.error}', 'SZVUT010')
+            index.refresh_in_background()
+            return record
+
         try:
-            with Path(self.szv_input_file).open('r') as infile:
-                for line in infile:
-                    byte_array = bytearray.fromhex(line.strip())
-                    decoded_line = self.decoding_line(byte_array)
-                    if decoded_line and len(decoded_line) >= 1:
-                        decoded_lines.append([hashlib.sha256(decoded_line[0].encode()).hexdigest(), ','.join(decoded_line)])
-                    else:
-                        self.normal_logger.log('Error', f'Přeskočen chybný dekódovaný řádek.', 'SZVUT008')
-                        self.messenger.show_error('Error', f'Přeskočen chybný dekódovaný řádek.', 'SZVUT008', False)
+            if index.refresh() and index.skipped:
+                self.normal_logger.log('Error', f'Přeskočeno chybných dekódovaných řádků: {index.skipped}.', 'SZVUT008')
         except Exception as e:
             self.normal_logger.log('Error', f'Při čtení souboru došlo k chybě: {str(e)}', 'SZVUT009')
-            self.messenger.show_error('Error', f'{str(e)}', 'SZVUT009', True)
-            return []
+            if not index.records:
+                self.messenger.show_error('Error', f'{str(e)}', 'SZVUT009', True)
+            return None  # 💡 With a snapshot the card is simply unknown / Se snímkem je karta jen neznámá
 
-        return decoded_lines
+        return index.records.get(hash_card(password))
 
     # ⚠️ Checklist file, leave a comment! / Kontrolní výpis souboru, nech zakomentováno!
     # def print_decoded_file(self):
@@ -164,11 +130,10 @@ class SzvDecrypt:
     #     Vytiskne všechny dekódované řádky do konzole (ladicí režim).
     #     """
     #     try:
-    #         decoded_data = self.decoding_file()
+    #         index = get_szv_index(Path(self.szv_input_file), self.snapshot_path)
+    #         index.refresh()
     #         print('\n🟢 DEKÓDOVANÝ OBSAH SZV.dat:')
-    #         for idx, decoded_line in enumerate(decoded_data, start=1):
-    #             hash_val = decoded_line[0]
-    #             decoded_text = decoded_line[1]
+    #         for idx, (hash_val, decoded_text) in enumerate(index.records.items(), start=1):
     #             print(f'🔹 [{idx}] {decoded_text}  ← (hash: {hash_val[:8]}...)')
     #     except Exception as e:
     #         print(f'[CHYBA] Nepodařilo se dekódovat soubor: {e}')
@@ -0,0 +1,83 @@
+# 🔙 Tail reader – finds the last line containing a marker by reading a file backwards in blocks
+# Najde poslední řádek obsahující značku čtením souboru odzadu po blocích
+
+import codecs
+import locale
+from pathlib import Path
+
+# 📌 Block read from the end of the file per step / Velikost bloku čteného od konce souboru
+TAIL_BLOCK_SIZE = 8192
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    """
+    True when ASCII text has the same bytes in the encoding (utf-8, cp1250, …), so bytes can be searched.
+    True, pokud má ASCII text v daném kódování stejné bajty (utf-8, cp1250, …) a lze hledat v bajtech.
+    """
+    try:
+        return 'a\n:'.encode(encoding) == b'a\n:'
+    except LookupError:
+        return False
+
+
+def find_last_line(path: Path, marker: str, encoding: str | None = None, block_size: int = TAIL_BLOCK_SIZE) -> str | None:
+    """
+    Returns the last line containing marker (case-insensitive), reading only as many blocks from the end as needed.
+    Vrátí poslední řádek obsahující značku (bez ohledu na velikost písmen), čte od konce jen potřebné bloky.
+
+    - Same result as scanning reversed(read_text().splitlines()) / Stejný výsledek jako průchod reversed(read_text().splitlines())
+    - Falls back to a full read for encodings that are not ASCII compatible or on a decode error
+    - Při kódování nekompatibilním s ASCII nebo chybě dekódování přečte celý soubor
+
+    :param path: File to search / Prohledávaný soubor
+    :param marker: ASCII marker, e.g. 'my2n token:' / ASCII značka
+    :param encoding: Text encoding (default = same as Path.read_text) / Kódování (výchozí jako Path.read_text)
+    :return: Line without line ending or None / Řádek bez konce řádku nebo None
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    if not _ascii_compatible(encoding):
+        return _find_last_line_full(path, marker, encoding)
+
+    needle = marker.lower().encode('ascii')
+    try:
+        with path.open('rb') as file:
+            position = file.seek(0, 2)
+            carry = b''  # 💡 Start of a line that continues in the block read before / Začátek řádku z dříve čteného bloku
+
+            while position > 0:
+                size = min(block_size, position)
+                position -= size
+                file.seek(position)
+                buffer = file.read(size) + carry
+
+                if position > 0:
+                    # ✂️ Part before the first newline may continue in the previous block / Část před prvním koncem řádku může pokračovat
+                    newline = buffer.find(b'\n')
+                    if newline == -1:
+                        carry = buffer
+                        continue
+                    carry, complete = buffer[:newline + 1], buffer[newline + 1:]
+                else:
+                    carry, complete = b'', buffer
+
+                found = complete.lower().rfind(needle)
+                if found != -1:
+                    start = complete.rfind(b'\n', 0, found) + 1
+                    end = complete.find(b'\n', found)
+                    line = codecs.decode(complete[start:end if end != -1 else len(complete)], encoding)
+                    # 💡 Other separators known to splitlines() (\r, \x0b, …) / Další oddělovače známé splitlines()
+                    return next(part for part in reversed(line.splitlines()) if marker.lower() in part.lower())
+    except UnicodeDecodeError:
+        return _find_last_line_full(path, marker, encoding)
+
+    return None
+
+
+def _find_last_line_full(path: Path, marker: str, encoding: str) -> str | None:
+    """
+    Full scan fallback (original behaviour).
+    Záložní průchod celým souborem (původní chování).
+    """
+    marker = marker.lower()
+    lines = path.read_text(encoding=encoding).splitlines()
+    return next((line for line in reversed(lines) if marker in line.lower()), None)
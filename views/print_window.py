@@ -3,7 +3,7 @@
 
 from pathlib import Path
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QProgressBar, QInputDialog
 from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QIcon
 from effects.window_effects_manager import WindowEffectsManager
 
@@ -64,6 +64,28 @@ class PrintWindow(QWidget):
         self.print_label.setFixedHeight(32)
         self.print_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
+        # 🧮 Order completeness summary / Souhrn kompletnosti příkazu
+        self.summary_label = QLabel()
+        self.summary_label.setFont(label_font)
+        self.summary_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.summary_label.setStyleSheet('color: black;')
+
+        # 🔐 My2N token index status (hidden for products without My2N) / Stav indexu My2N tokenů
+        self.my2n_label = QLabel()
+        self.my2n_label.setFont(label_font)
+        self.my2n_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.my2n_label.setStyleSheet('color: black;')
+        self.my2n_label.hide()
+
+        # 🧾 Print queue status / Stav tiskové fronty
+        self.queue_label = QLabel()
+        self.queue_label.setFont(label_font)
+        self.queue_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.queue_label.setStyleSheet('color: black;')
+        self.queue_depth = 0
+        self.current_label = ''
+        self._refresh_queue_label()
+
         # 📌 Logo / Logo aplikace
         self.logo = QLabel(self)
         pixmap = QPixmap(str(print_logo)).scaled(self.width() - 20, 256, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
@@ -116,14 +138,64 @@ class PrintWindow(QWidget):
         self.exit_button.setFont(button_font)
         self.exit_button.setStyleSheet(button_style)
 
+        # 📦 Batch print / Dávkový tisk
+        small_button_font = QFont('Arial', 11, QFont.Weight.Bold)
+
+        self.batch_button: QPushButton = QPushButton('Dávka')
+        self.batch_button.setFont(small_button_font)
+        self.batch_button.setStyleSheet(button_style)
+
+        # 📒 Reprint from local journal / Dotisk z lokálního deníku
+        self.reprint_button: QPushButton = QPushButton('Dotisk')
+        self.reprint_button.setFont(small_button_font)
+        self.reprint_button.setStyleSheet(button_style)
+
+        extra_buttons = QHBoxLayout()
+        extra_buttons.addWidget(self.batch_button)
+        extra_buttons.addWidget(self.reprint_button)
+
+        self.batch_label = QLabel()
+        self.batch_label.setFont(label_font)
+        self.batch_label.setStyleSheet('color: black;')
+
+        self.batch_bar = QProgressBar()
+        self.batch_bar.setTextVisible(False)
+        self.batch_bar.setFixedHeight(8)
+
+        self.batch_pause_button: QPushButton = QPushButton('Pauza')
+        self.batch_pause_button.setFont(small_button_font)
+        self.batch_pause_button.setStyleSheet(button_style)
+
+        self.batch_cancel_button: QPushButton = QPushButton('Zrušit dávku')
+        self.batch_cancel_button.setFont(small_button_font)
+        self.batch_cancel_button.setStyleSheet(button_style)
+
+        batch_buttons = QHBoxLayout()
+        batch_buttons.addWidget(self.batch_pause_button)
+        batch_buttons.addWidget(self.batch_cancel_button)
+
+        self.batch_panel = QWidget()
+        batch_layout = QVBoxLayout()
+        batch_layout.setContentsMargins(0, 0, 0, 0)
+        batch_layout.addWidget(self.batch_label)
+        batch_layout.addWidget(self.batch_bar)
+        batch_layout.addLayout(batch_buttons)
+        self.batch_panel.setLayout(batch_layout)
+        self.batch_panel.hide()
+
         # 📌 Enter triggers print / Propojení tlačítka s akcí přihlášení
         self.serial_number_input.returnPressed.connect(self.print_button.click)
 
         # 📌 Add elements to the main layout / Přidání prvků do hlavního layoutu
         layout.addWidget(self.print_label)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.my2n_label)
+        layout.addWidget(self.queue_label)
         layout.addWidget(self.logo)
         layout.addWidget(self.serial_number_input)
         layout.addWidget(self.print_button)
+        layout.addLayout(extra_buttons)
+        layout.addWidget(self.batch_panel)
         layout.addWidget(self.exit_button)
 
         # 📦 Finalize layout / Nastavení layoutu okna
@@ -142,3 +214,113 @@ class PrintWindow(QWidget):
         """
         self.serial_number_input.clear()
         self.serial_number_input.setFocus()
+
+    def set_order_summary(self, text: str, ok: bool = True):
+        """
+        Shows order completeness summary (red when some serials are incomplete).
+        Zobrazí souhrn kompletnosti příkazu (červeně, pokud jsou některé serialy neúplné).
+
+        :param text: Summary text / Text souhrnu
+        :param ok: False highlights the summary as a problem / False zvýrazní souhrn jako problém
+        """
+        self.summary_label.setStyleSheet('color: black;' if ok else 'color: #C0392B;')
+        self.summary_label.setText(text)
+
+    def set_my2n_status(self, text: str, ok: bool = True):
+        """
+        Shows My2N token index status (red when some reports are missing).
+        Zobrazí stav indexu My2N tokenů (červeně, pokud některé reporty chybí).
+        """
+        self.my2n_label.setStyleSheet('color: black;' if ok else 'color: #C0392B;')
+        self.my2n_label.setText(text)
+        self.my2n_label.show()
+
+    def set_queue_depth(self, depth: int):
+        """
+        Shows number of jobs waiting in print queue.
+        Zobrazí počet úloh čekajících v tiskové frontě.
+        """
+        self.queue_depth = depth
+        if not depth:
+            self.current_label = ''
+        self._refresh_queue_label()
+
+    def set_current_label(self, value: str):
+        """
+        Shows the label currently being printed.
+        Zobrazí právě tištěnou etiketu.
+        """
+        self.current_label = value
+        self._refresh_queue_label()
+
+    def _refresh_queue_label(self):
+        """
+        Renders queue depth and current label.
+        Vykreslí hloubku fronty a aktuální etiketu.
+        """
+        text = f'Fronta tisku: {self.queue_depth}'
+        if self.current_label:
+            text += f'   Tisknu: {self.current_label}'
+        self.queue_label.setText(text)
+
+    def ask_batch_serials(self) -> str | None:
+        """
+        Asks for a serial range or list (one per line or 'from..to').
+        Vyžádá rozsah nebo seznam serial numbers (jeden na řádek nebo 'od..do').
+
+        :return: Entered text or None when cancelled / Zadaný text nebo None při zrušení
+        """
+        text, ok = QInputDialog.getMultiLineText(self, 'Dávkový tisk', 'Serial numbers (jeden na řádek) nebo rozsah 25-0001-0001..25-0001-0200:')
+        return text if ok and text.strip() else None
+
+    def ask_reprint_count(self, available: int) -> int | None:
+        """
+        Asks how many last printed serials should be reprinted.
+        Zeptá se, kolik naposledy vytištěných serialů se má dotisknout.
+
+        :param available: Serials in the journal / Počet serialů v deníku
+        :return: Count or None when cancelled / Počet nebo None při zrušení
+        """
+        count, ok = QInputDialog.getInt(self, 'Dotisk', 'Počet posledních serial numbers k dotisku:', 1, 1, available)
+        return count if ok else None
+
+    def show_batch(self, total: int):
+        """
+        Shows batch progress panel and blocks single scans.
+        Zobrazí panel průběhu dávky a zablokuje jednotlivé skeny.
+        """
+        self.batch_bar.setRange(0, total)
+        self.set_batch_progress(0, total)
+        self.set_batch_paused(False)
+        self.batch_panel.show()
+        self.batch_button.setEnabled(False)
+        self.reprint_button.setEnabled(False)
+        self.print_button.setEnabled(False)
+        self.serial_number_input.setEnabled(False)
+
+    def set_batch_progress(self, processed: int, total: int):
+        """
+        Updates batch progress.
+        Aktualizuje průběh dávky.
+        """
+        self.batch_bar.setValue(processed)
+        self.batch_label.setText(f'Dávka: {processed} / {total}')
+
+    def set_batch_paused(self, paused: bool):
+        """
+        Switches pause button text.
+        Přepne text tlačítka pauzy.
+        """
+        self.batch_pause_button.setText('Pokračovat' if paused else 'Pauza')
+
+    def hide_batch(self):
+        """
+        Hides batch panel and enables single scans again.
+        Skryje panel dávky a znovu povolí jednotlivé skeny.
+        """
+        self.batch_panel.hide()
+        self.batch_button.setEnabled(True)
+        self.reprint_button.setEnabled(True)
+        self.print_button.setEnabled(True)
+        self.serial_number_input.setEnabled(True)
+        self.reset_input_focus()
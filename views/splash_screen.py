@@ -3,17 +3,18 @@
 
 from PyQt6.QtWidgets import QSplashScreen, QLabel
 from PyQt6.QtGui import QPixmap, QMovie
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QThreadPool
 from pathlib import Path
 
 
 class SplashScreen(QSplashScreen):
-    def __init__(self, duration_ms=5000):
+    def __init__(self, duration_ms=5000, min_duration_ms=1500):
         """
         Initializes splash screen appearance and animation.
         Inicializuje splash screen, včetně vzhledu a animace.
 
-        :param duration_ms: Duration before transition / Doba zobrazení v milisekundách
+        :param duration_ms: Duration before transition (longest wait for warm-up) / Doba zobrazení v milisekundách (nejdelší čekání na zahřátí)
+        :param min_duration_ms: Shortest display time when warm-up finishes early / Nejkratší doba zobrazení při rychlém zahřátí
         """
         base_dir = Path(__file__).parent.parent
         ico_dir = base_dir / 'resources' / 'ico'
@@ -27,6 +28,13 @@ class SplashScreen(QSplashScreen):
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         self.setWindowOpacity(0.0)
         self.duration = duration_ms
+        self.min_duration = min_duration_ms
+
+        # 🔥 Warm-up state / Stav zahřátí
+        self.warmup = None
+        self._min_elapsed = False
+        self._warmed_up = False
+        self._finished = False
 
         # 📝 Text label / Textový popisek
         self.label = QLabel('Načítání aplikace…', self)
@@ -52,17 +60,48 @@ class SplashScreen(QSplashScreen):
         height = self.pixmap().height() or 200
         self.label.setGeometry(0, height - 100, width, 50)
 
-    def start(self, on_finish_callback):
+    def start(self, on_finish_callback, warmup=None):
         """
         Starts the splash screen animation and transition.
         Spustí splash obrazovku a naplánuje přechod po timeoutu.
 
+        - With warm-up the splash closes when it finishes (not before min_duration_ms, not after duration_ms)
+        - Se zahřátím se splash zavře po jeho dokončení (ne dříve než min_duration_ms, ne později než duration_ms)
+
         :param on_finish_callback: Function to call after timeout / Funkce po dokončení
+        :param warmup: StartupWarmup job run in the meantime (optional) / Úloha zahřátí spuštěná mezitím
         """
         self.show()
         self._animate_fade_in()
         QTimer.singleShot(self.duration, lambda: self._finish(on_finish_callback))
 
+        if warmup is None:
+            return
+
+        self.warmup = warmup
+        warmup.signals.step_done.connect(self._on_warmup_step)
+        warmup.signals.finished.connect(lambda results: self._on_warmup_finished(on_finish_callback))
+        QThreadPool.globalInstance().start(warmup)
+        QTimer.singleShot(self.min_duration, lambda: self._on_min_elapsed(on_finish_callback))
+
+    def _on_warmup_step(self, step: str, ok: bool, summary: str):
+        """
+        Shows what has just been loaded.
+        Zobrazí, co bylo právě načteno.
+        """
+        names = {'config': 'Konfigurace', 'paths': 'Cesty', 'szv': 'Operátoři', 'orders': 'Příkazy'}
+        self.label.setText(f'{"✔" if ok else "✖"} {names.get(step, step)}: {summary}')
+
+    def _on_warmup_finished(self, callback):
+        self._warmed_up = True
+        if self._min_elapsed:
+            self._finish(callback)
+
+    def _on_min_elapsed(self, callback):
+        self._min_elapsed = True
+        if self._warmed_up:
+            self._finish(callback)
+
     def _animate_fade_in(self):
         """
         Applies fade-in opacity animation to the splash screen.
@@ -76,8 +115,11 @@ class SplashScreen(QSplashScreen):
 
     def _finish(self, callback):
         """
-        Closes splash screen and continues to next screen.
-        Zavře splash screen a pokračuje na další obrazovku.
+        Closes splash screen and continues to next screen (only once).
+        Zavře splash screen a pokračuje na další obrazovku (jen jednou).
         """
+        if self._finished:
+            return
+        self._finished = True
         self.close()
         callback()
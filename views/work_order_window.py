@@ -3,7 +3,7 @@
 
 from pathlib import Path
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QProgressBar
 from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QIcon
 from effects.window_effects_manager import WindowEffectsManager
 
@@ -107,8 +107,22 @@ class WorkOrderWindow(QWidget):
         # 📌 Enter triggers continue / Enter aktivuje pokračování
         self.work_order_input.returnPressed.connect(self.next_button.click)
 
+        # ⏳ Loading indicator (hidden until an order is being loaded) / Indikátor načítání (skrytý do načítání příkazu)
+        self.loading_label = QLabel()
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.loading_label.setStyleSheet('color: black;')
+        self.loading_label.hide()
+
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)  # 💡 Busy indicator / Nekonečný průběh
+        self.loading_bar.setTextVisible(False)
+        self.loading_bar.setFixedHeight(8)
+        self.loading_bar.hide()
+
         # 📦 Add widgets to layout / Přidání prvků do hlavního layoutu
         layout.addWidget(self.work_order_input)
+        layout.addWidget(self.loading_label)
+        layout.addWidget(self.loading_bar)
         layout.addWidget(self.next_button)
         layout.addWidget(self.exit_button)
 
@@ -120,3 +134,26 @@ class WorkOrderWindow(QWidget):
         self.raise_()
         self.work_order_input.setFocus()
         self.effects.fade_in(self, duration=1000)  # 🌟 Visual animation / Vizuální animace
+
+    def show_loading(self, text: str):
+        """
+        Shows the progress indicator and blocks another submit.
+        Zobrazí indikátor průběhu a zablokuje další odeslání.
+
+        :param text: Status text / Stavový text
+        """
+        self.loading_label.setText(text)
+        self.loading_label.show()
+        self.loading_bar.show()
+        self.next_button.setEnabled(False)
+        self.work_order_input.setEnabled(False)
+
+    def hide_loading(self):
+        """
+        Hides the progress indicator and enables input again.
+        Skryje indikátor průběhu a znovu povolí vstup.
+        """
+        self.loading_label.hide()
+        self.loading_bar.hide()
+        self.next_button.setEnabled(True)
+        self.work_order_input.setEnabled(True)